@@ -1,12 +1,13 @@
 """
 Settings and configuration management for AIDP MCP Server
 """
+import functools
 import os
+import sys
 from pathlib import Path
-from typing import Any, Optional
-import yaml
-from dotenv import load_dotenv
-from pydantic import BaseModel, Field, field_validator
+from typing import Any, Mapping, Optional
+from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import ValidationError as PydanticValidationError
 
 from utils.errors import ConfigurationError
 
@@ -14,6 +15,8 @@ from utils.errors import ConfigurationError
 class InstanceConfig(BaseModel):
     """Configuration for a single AIDP instance"""
 
+    model_config = ConfigDict(frozen=True)
+
     ocid: str
     region: str
     compartment_ocid: str
@@ -26,6 +29,8 @@ class InstanceConfig(BaseModel):
 class AuthConfig(BaseModel):
     """OCI authentication configuration"""
 
+    model_config = ConfigDict(frozen=True)
+
     method: str = "config_file"  # config_file or instance_principal
     config_path: str = "~/.oci/config"
     profile: str = "DEFAULT"
@@ -34,6 +39,8 @@ class AuthConfig(BaseModel):
 class DefaultsConfig(BaseModel):
     """Default values for various operations"""
 
+    model_config = ConfigDict(frozen=True)
+
     cluster_size: str = "small"
     cluster_shape: str = "VM.Standard2.4"
     cluster_worker_count: int = 2
@@ -51,16 +58,23 @@ class DefaultsConfig(BaseModel):
 class PerformanceConfig(BaseModel):
     """Performance and connection settings"""
 
+    model_config = ConfigDict(frozen=True)
+
     request_timeout_seconds: int = 300
-    max_concurrent_requests: int = 10
+    # Both size a semaphore or a worker pool, so they must be at least 1
+    max_concurrent_requests: int = Field(10, ge=1)
     retry_max_attempts: int = 3
     retry_backoff_seconds: int = 2
-    connection_pool_size: int = 20
+    connection_pool_size: int = Field(20, ge=1)
+    eager_client_init: bool = True
+    pretty_json: bool = True
 
 
 class CacheConfig(BaseModel):
     """Cache configuration"""
 
+    model_config = ConfigDict(frozen=True)
+
     enabled: bool = True
     ttl_seconds: int = 300
     max_size_mb: int = 100
@@ -69,6 +83,8 @@ class CacheConfig(BaseModel):
 class LoggingConfig(BaseModel):
     """Logging configuration"""
 
+    model_config = ConfigDict(frozen=True)
+
     level: str = "INFO"
     file: Optional[str] = "~/aidp-mcp-server.log"
     max_size_mb: int = 100
@@ -79,6 +95,8 @@ class LoggingConfig(BaseModel):
 class FeaturesConfig(BaseModel):
     """Feature flags for enabling/disabling modules"""
 
+    model_config = ConfigDict(frozen=True)
+
     instance_management: bool = True
     data_catalog: bool = True
     object_storage: bool = True
@@ -91,9 +109,102 @@ class FeaturesConfig(BaseModel):
     analytics_reporting: bool = True
 
 
+class AIDPConfig(BaseModel):
+    """Top-level "aidp" section of the configuration file"""
+
+    model_config = ConfigDict(frozen=True)
+
+    instances: dict[str, InstanceConfig] = Field(default_factory=dict)
+    auth: AuthConfig = Field(default_factory=AuthConfig)
+    defaults: DefaultsConfig = Field(default_factory=DefaultsConfig)
+    performance: PerformanceConfig = Field(default_factory=PerformanceConfig)
+    cache: CacheConfig = Field(default_factory=CacheConfig)
+    logging: LoggingConfig = Field(default_factory=LoggingConfig)
+    features: FeaturesConfig = Field(default_factory=FeaturesConfig)
+
+
+# Parsed configuration files keyed by path, tagged with (mtime_ns, size)
+_CONFIG_CACHE: dict[Path, tuple[tuple[int, int], Any]] = {}
+
+
+@functools.cache
+def _resolve_config_path(config_file: str) -> Path:
+    """
+    Resolve a configuration file path, expanding the user directory
+
+    Args:
+        config_file: Configuration file path as given
+
+    Returns:
+        Expanded path
+    """
+    return Path(config_file).expanduser()
+
+
+def _parse_config_file(config_file: Path) -> Any:
+    """
+    Parse a configuration file
+
+    Files with a .toml suffix are read with the standard library TOML
+    parser; anything else is treated as YAML.
+
+    Args:
+        config_file: Path to the configuration file
+
+    Returns:
+        Parsed configuration data
+    """
+    raw = config_file.read_bytes()
+
+    if config_file.suffix.lower() == ".toml":
+        import tomllib
+
+        return tomllib.loads(raw.decode("utf-8"))
+
+    import yaml
+
+    # Prefer the libyaml C loader when PyYAML was built with it
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    return yaml.load(raw, Loader=loader)
+
+
+def _int_env(env: Mapping[str, str], key: str) -> Optional[int]:
+    """
+    Read an integer override from an environment mapping
+
+    Args:
+        env: Environment variable mapping
+        key: Environment variable name
+
+    Returns:
+        Parsed integer, or None if the variable is unset or not an integer
+    """
+    value = env.get(key)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
 class Settings:
     """Main settings class for AIDP MCP Server"""
 
+    __slots__ = (
+        "config_file",
+        "active_instance_name",
+        "instances",
+        "_instance_names",
+        "auth",
+        "defaults",
+        "performance",
+        "cache",
+        "logging",
+        "features",
+        "_dict_cache",
+    )
+
     def __init__(
         self,
         config_file: Optional[str] = None,
@@ -103,10 +214,12 @@ class Settings:
         Initialize settings
 
         Args:
-            config_file: Path to YAML configuration file
+            config_file: Path to YAML or TOML configuration file
             instance_name: Name of the AIDP instance to use
         """
         # Load environment variables
+        from dotenv import load_dotenv
+
         load_dotenv()
 
         # Determine config file path
@@ -116,120 +229,165 @@ class Settings:
                 str(Path(__file__).parent / "aidp_config.yaml"),
             )
 
-        self.config_file = Path(config_file).expanduser()
+        self.config_file = _resolve_config_path(config_file)
+        self._dict_cache: Optional[dict[str, Any]] = None
 
         # Load configuration
         self._load_config()
 
         # Determine active instance
-        self.active_instance_name = instance_name or os.getenv("AIDP_INSTANCE", "melbourne")
+        self.active_instance_name = sys.intern(
+            instance_name or os.getenv("AIDP_INSTANCE", "melbourne")
+        )
 
         if self.active_instance_name not in self.instances:
             raise ConfigurationError(
                 f"Instance '{self.active_instance_name}' not found in configuration",
-                details={"available_instances": list(self.instances.keys())},
+                details={"available_instances": self._instance_names},
             )
 
     def _load_config(self) -> None:
-        """Load configuration from YAML file"""
+        """Load configuration from the YAML or TOML file"""
         if not self.config_file.exists():
             raise ConfigurationError(
                 f"Configuration file not found: {self.config_file}",
                 details={"config_file": str(self.config_file)},
             )
 
-        try:
-            with open(self.config_file, "r") as f:
-                config_data = yaml.safe_load(f)
-        except Exception as e:
-            raise ConfigurationError(
-                f"Failed to load configuration file: {str(e)}",
-                original_error=e,
-            )
-
-        if not isinstance(config_data, dict) or "aidp" not in config_data:
-            raise ConfigurationError("Invalid configuration file structure")
-
-        aidp_config = config_data["aidp"]
+        # Reuse the parsed file if it is unchanged since the last load
+        stat = self.config_file.stat()
+        file_key = (stat.st_mtime_ns, stat.st_size)
+        cached = _CONFIG_CACHE.get(self.config_file)
 
-        # Parse instances
-        self.instances: dict[str, InstanceConfig] = {}
-        for name, instance_data in aidp_config.get("instances", {}).items():
+        if cached is not None and cached[0] == file_key:
+            config_data = cached[1]
+        else:
             try:
-                self.instances[name] = InstanceConfig(**instance_data)
+                config_data = _parse_config_file(self.config_file)
             except Exception as e:
                 raise ConfigurationError(
-                    f"Invalid configuration for instance '{name}': {str(e)}",
+                    f"Failed to load configuration file: {str(e)}",
                     original_error=e,
                 )
+            _CONFIG_CACHE[self.config_file] = (file_key, config_data)
 
-        if not self.instances:
-            raise ConfigurationError("No instances configured")
+        if not isinstance(config_data, dict) or "aidp" not in config_data:
+            raise ConfigurationError("Invalid configuration file structure")
 
-        # Parse other config sections
+        # Merge environment overrides into the raw sections, then validate
+        # the whole "aidp" section in a single pass
         try:
-            self.auth = AuthConfig(**aidp_config.get("auth", {}))
-            self.defaults = DefaultsConfig(**aidp_config.get("defaults", {}))
-            self.performance = PerformanceConfig(**aidp_config.get("performance", {}))
-            self.cache = CacheConfig(**aidp_config.get("cache", {}))
-            self.logging = LoggingConfig(**aidp_config.get("logging", {}))
-            self.features = FeaturesConfig(**aidp_config.get("features", {}))
+            aidp_data = config_data["aidp"]
+            overrides = self._env_overrides()
+            if overrides:
+                aidp_data = {
+                    **aidp_data,
+                    **{
+                        section: {**aidp_data.get(section, {}), **updates}
+                        for section, updates in overrides.items()
+                    },
+                }
+            aidp_config = AIDPConfig.model_validate(aidp_data)
+        except PydanticValidationError as e:
+            # All instances are validated together; report every failing one
+            invalid_instances = sorted(
+                {
+                    str(error["loc"][1])
+                    for error in e.errors()
+                    if len(error["loc"]) > 1 and error["loc"][0] == "instances"
+                }
+            )
+            raise ConfigurationError(
+                f"Invalid configuration: {str(e)}",
+                details={"invalid_instances": invalid_instances} if invalid_instances else None,
+                original_error=e,
+            )
         except Exception as e:
             raise ConfigurationError(
                 f"Invalid configuration: {str(e)}",
                 original_error=e,
             )
 
-        # Apply environment variable overrides
-        self._apply_env_overrides()
+        # Intern instance names so repeated lookups compare by identity
+        self.instances: dict[str, InstanceConfig] = {
+            sys.intern(name): instance for name, instance in aidp_config.instances.items()
+        }
+
+        if not self.instances:
+            raise ConfigurationError("No instances configured")
+
+        # Instances do not change after load; reused by lookup errors
+        self._instance_names: tuple[str, ...] = tuple(self.instances)
+
+        self.auth = aidp_config.auth
+        self.defaults = aidp_config.defaults
+        self.performance = aidp_config.performance
+        self.cache = aidp_config.cache
+        self.logging = aidp_config.logging
+        self.features = aidp_config.features
+
+    def _env_overrides(self) -> dict[str, dict[str, Any]]:
+        """
+        Collect environment variable overrides for the configuration
+
+        Returns:
+            Field overrides keyed by configuration section name
+        """
+        # Bind the environment mapping once and read every override from it
+        env = os.environ
 
-    def _apply_env_overrides(self) -> None:
-        """Apply environment variable overrides to configuration"""
         # Logging overrides
-        if log_level := os.getenv("LOG_LEVEL"):
-            self.logging.level = log_level
+        logging_updates: dict[str, Any] = {}
 
-        if log_file := os.getenv("LOG_FILE"):
-            self.logging.file = log_file
+        if log_level := env.get("LOG_LEVEL"):
+            logging_updates["level"] = log_level
 
-        if log_max_size := os.getenv("LOG_MAX_SIZE_MB"):
-            try:
-                self.logging.max_size_mb = int(log_max_size)
-            except ValueError:
-                pass
+        if log_file := env.get("LOG_FILE"):
+            logging_updates["file"] = log_file
+
+        if (log_max_size := _int_env(env, "LOG_MAX_SIZE_MB")) is not None:
+            logging_updates["max_size_mb"] = log_max_size
 
         # Auth overrides
-        if auth_method := os.getenv("OCI_AUTH_METHOD"):
-            self.auth.method = auth_method
+        auth_updates: dict[str, Any] = {}
+
+        if auth_method := env.get("OCI_AUTH_METHOD"):
+            auth_updates["method"] = auth_method
 
-        if config_path := os.getenv("OCI_CONFIG_PATH"):
-            self.auth.config_path = config_path
+        if config_path := env.get("OCI_CONFIG_PATH"):
+            auth_updates["config_path"] = config_path
 
-        if profile := os.getenv("OCI_PROFILE"):
-            self.auth.profile = profile
+        if profile := env.get("OCI_PROFILE"):
+            auth_updates["profile"] = profile
 
         # Performance overrides
-        if timeout := os.getenv("REQUEST_TIMEOUT"):
-            try:
-                self.performance.request_timeout_seconds = int(timeout)
-            except ValueError:
-                pass
+        performance_updates: dict[str, Any] = {}
 
-        if max_retries := os.getenv("MAX_RETRIES"):
-            try:
-                self.performance.retry_max_attempts = int(max_retries)
-            except ValueError:
-                pass
+        if (timeout := _int_env(env, "REQUEST_TIMEOUT")) is not None:
+            performance_updates["request_timeout_seconds"] = timeout
+
+        if (max_retries := _int_env(env, "MAX_RETRIES")) is not None:
+            performance_updates["retry_max_attempts"] = max_retries
+
+        if (max_concurrent := _int_env(env, "MAX_CONCURRENT_REQUESTS")) is not None:
+            performance_updates["max_concurrent_requests"] = max_concurrent
 
         # Cache overrides
-        if cache_enabled := os.getenv("ENABLE_CACHE"):
-            self.cache.enabled = cache_enabled.lower() in ("true", "1", "yes")
+        cache_updates: dict[str, Any] = {}
 
-        if cache_ttl := os.getenv("CACHE_TTL_SECONDS"):
-            try:
-                self.cache.ttl_seconds = int(cache_ttl)
-            except ValueError:
-                pass
+        if cache_enabled := env.get("ENABLE_CACHE"):
+            cache_updates["enabled"] = cache_enabled.lower() in ("true", "1", "yes")
+
+        if (cache_ttl := _int_env(env, "CACHE_TTL_SECONDS")) is not None:
+            cache_updates["ttl_seconds"] = cache_ttl
+
+        overrides = {
+            "logging": logging_updates,
+            "auth": auth_updates,
+            "performance": performance_updates,
+            "cache": cache_updates,
+        }
+        return {section: updates for section, updates in overrides.items() if updates}
 
     @property
     def instance(self) -> InstanceConfig:
@@ -252,24 +410,34 @@ class Settings:
         if name not in self.instances:
             raise ConfigurationError(
                 f"Instance '{name}' not found",
-                details={"available_instances": list(self.instances.keys())},
+                details={"available_instances": self._instance_names},
             )
         return self.instances[name]
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert settings to dictionary"""
-        return {
-            "active_instance": self.active_instance_name,
-            "instances": {
-                name: instance.model_dump() for name, instance in self.instances.items()
-            },
-            "auth": self.auth.model_dump(),
-            "defaults": self.defaults.model_dump(),
-            "performance": self.performance.model_dump(),
-            "cache": self.cache.model_dump(),
-            "logging": self.logging.model_dump(),
-            "features": self.features.model_dump(),
-        }
+        """
+        Convert settings to dictionary
+
+        The configuration models are frozen, so the snapshot is built once
+        and shared by later calls. Callers must not modify it.
+
+        Returns:
+            Settings as a dictionary
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "active_instance": self.active_instance_name,
+                "instances": {
+                    name: instance.model_dump() for name, instance in self.instances.items()
+                },
+                "auth": self.auth.model_dump(),
+                "defaults": self.defaults.model_dump(),
+                "performance": self.performance.model_dump(),
+                "cache": self.cache.model_dump(),
+                "logging": self.logging.model_dump(),
+                "features": self.features.model_dump(),
+            }
+        return self._dict_cache
 
 
 # Global settings instance
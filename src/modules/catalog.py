@@ -2,7 +2,7 @@
 Module 2: Data Catalog Operations
 Provides tools for discovering and managing data assets
 """
-from typing import Any
+from typing import Any, Sequence
 import mcp.types as types
 from src.oci_client import OCIClient
 from utils.logger import get_logger
@@ -12,64 +12,88 @@ from utils.validators import validate_required_fields
 logger = get_logger(__name__)
 
 
-def get_tools() -> list[types.Tool]:
-    """Get list of data catalog tools (20 tools)"""
-    tools = []
-    
-    # Tool definitions for all 20 catalog tools
-    tool_definitions = [
-        ("list_catalog_objects", "Browse catalog with filters", {"limit": "integer", "filter": "string"}),
-        ("search_catalog", "Advanced search with keywords", {"query": "string", "limit": "integer"}),
-        ("get_object_metadata", "Get detailed metadata", {"object_id": "string"}),
-        ("create_catalog_entry", "Register new data asset", {"name": "string", "type": "string", "metadata": "object"}),
-        ("update_catalog_entry", "Update metadata/tags", {"object_id": "string", "metadata": "object"}),
-        ("delete_catalog_entry", "Remove from catalog", {"object_id": "string"}),
-        ("get_data_lineage", "View data lineage graph", {"object_id": "string"}),
-        ("list_databases", "List all databases", {"limit": "integer"}),
-        ("get_database_details", "Get database info", {"database_id": "string"}),
-        ("list_schemas", "List schemas in database", {"database_id": "string"}),
-        ("list_tables", "List tables in schema", {"schema_id": "string"}),
-        ("get_table_schema", "Get table structure", {"table_id": "string"}),
-        ("get_table_statistics", "Get row counts, sizes", {"table_id": "string"}),
-        ("preview_table_data", "Preview first N rows", {"table_id": "string", "limit": "integer"}),
-        ("refresh_catalog", "Trigger catalog sync", {}),
-        ("set_object_tags", "Add/update tags", {"object_id": "string", "tags": "object"}),
-        ("get_object_tags", "Retrieve tags", {"object_id": "string"}),
-        ("export_catalog_metadata", "Export as JSON/CSV", {"format": "string"}),
-        ("import_catalog_metadata", "Import metadata", {"file_path": "string"}),
-        ("validate_catalog_entry", "Validate metadata", {"object_id": "string"}),
-    ]
-    
-    for name, desc, props in tool_definitions:
-        schema = {"type": "object", "properties": {}}
-        required = []
-        for prop_name, prop_type in props.items():
-            if prop_type == "string":
-                schema["properties"][prop_name] = {"type": "string"}
-            elif prop_type == "integer":
-                schema["properties"][prop_name] = {"type": "integer"}
-            elif prop_type == "object":
-                schema["properties"][prop_name] = {"type": "object"}
-            if prop_name in ["object_id", "name", "type", "database_id", "schema_id", "table_id"]:
-                required.append(prop_name)
-        if required:
-            schema["required"] = required
-        
-        tools.append(types.Tool(name=name, description=desc, inputSchema=schema))
-    
-    return tools
+# Tool definitions for all 20 catalog tools
+_TOOL_DEFINITIONS = [
+    ("list_catalog_objects", "Browse catalog with filters", {"limit": "integer", "filter": "string"}),
+    ("search_catalog", "Advanced search with keywords", {"query": "string", "limit": "integer"}),
+    ("get_object_metadata", "Get detailed metadata", {"object_id": "string"}),
+    ("create_catalog_entry", "Register new data asset", {"name": "string", "type": "string", "metadata": "object"}),
+    ("update_catalog_entry", "Update metadata/tags", {"object_id": "string", "metadata": "object"}),
+    ("delete_catalog_entry", "Remove from catalog", {"object_id": "string"}),
+    ("get_data_lineage", "View data lineage graph", {"object_id": "string"}),
+    ("list_databases", "List all databases", {"limit": "integer"}),
+    ("get_database_details", "Get database info", {"database_id": "string"}),
+    ("list_schemas", "List schemas in database", {"database_id": "string"}),
+    ("list_tables", "List tables in schema", {"schema_id": "string"}),
+    ("get_table_schema", "Get table structure", {"table_id": "string"}),
+    ("get_table_statistics", "Get row counts, sizes", {"table_id": "string"}),
+    ("preview_table_data", "Preview first N rows", {"table_id": "string", "limit": "integer"}),
+    ("refresh_catalog", "Trigger catalog sync", {}),
+    ("set_object_tags", "Add/update tags", {"object_id": "string", "tags": "object"}),
+    ("get_object_tags", "Retrieve tags", {"object_id": "string"}),
+    ("export_catalog_metadata", "Export as JSON/CSV", {"format": "string"}),
+    ("import_catalog_metadata", "Import metadata", {"file_path": "string"}),
+    ("validate_catalog_entry", "Validate metadata", {"object_id": "string"}),
+]
 
+# JSON schema fragment for each compact property type
+_PROP_SCHEMA = {
+    "string": {"type": "string"},
+    "integer": {"type": "integer"},
+    "object": {"type": "object"},
+}
 
-async def handle_tool_call(name: str, arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
-    """Handle catalog tool calls"""
-    logger.info(f"Catalog tool: {name}")
-    
-    # Placeholder implementation - returns mock data
-    data = {
+# Properties that are required wherever they appear
+_REQUIRED_FIELDS = frozenset({"object_id", "name", "type", "database_id", "schema_id", "table_id"})
+
+
+def _build_tool(name: str, desc: str, props: dict[str, str]) -> types.Tool:
+    """Build a catalog tool from its compact definition"""
+    schema = {"type": "object", "properties": {}}
+    required = []
+    for prop_name, prop_type in props.items():
+        # Copy the fragment so no two tools share a mutable schema dict
+        schema["properties"][prop_name] = dict(_PROP_SCHEMA[prop_type])
+        if prop_name in _REQUIRED_FIELDS:
+            required.append(prop_name)
+    if required:
+        schema["required"] = required
+
+    return types.Tool(name=name, description=desc, inputSchema=schema)
+
+
+# Tool definitions are static, so build them once at import time
+_TOOLS = tuple(_build_tool(*definition) for definition in _TOOL_DEFINITIONS)
+
+
+def _build_response_template(name: str) -> dict[str, Any]:
+    """Build the placeholder response for a catalog tool"""
+    return {
         "tool": name,
-        "arguments": arguments,
+        "arguments": None,
         "message": f"Catalog tool '{name}' executed successfully (mock implementation)",
         "note": "This is a placeholder. Integrate with actual AIDP Catalog API in production.",
     }
+
+
+# Placeholder responses per tool; only "arguments" is filled in per call
+_RESPONSE_TEMPLATES = {
+    name: _build_response_template(name) for name, _, _ in _TOOL_DEFINITIONS
+}
+
+
+def get_tools() -> Sequence[types.Tool]:
+    """Get list of data catalog tools (20 tools)"""
+    return _TOOLS
+
+
+async def handle_tool_call(name: str, arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    """Handle catalog tool calls"""
+    logger.info("Catalog tool: %s", name)
     
-    return format_success_response(data)
+    # Placeholder implementation - returns mock data
+    template = _RESPONSE_TEMPLATES.get(name)
+    if template is None:
+        template = _build_response_template(name)
+
+    return format_success_response({**template, "arguments": arguments})
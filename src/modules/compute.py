@@ -2,20 +2,115 @@
 Module 4: Compute Cluster Management  
 Uses OCI Data Flow for Spark cluster operations
 """
-from typing import Any, Optional
+import asyncio
+from operator import attrgetter
+from typing import Any, Awaitable, Callable, Optional, Sequence
 import mcp.types as types
+import oci
+import oci.data_flow.models as df_models
 
 from src.oci_client import OCIClient
 from utils.logger import get_logger
 from utils.formatters import format_success_response, format_list_response
-from utils.validators import validate_required_fields, validate_cluster_name
-from utils.errors import ValidationError
+from utils.validators import compile_schema_validator, validate_cluster_name
+from utils.errors import ValidationError, NetworkError, TimeoutError, RateLimitError
+from utils.cache import TTLCache
 
 logger = get_logger(__name__)
 
+# Cache lifetimes (seconds) by how quickly each resource changes; capped by cache.ttl_seconds
+_TTL_SHORT = 5  # runs and run logs move while a run is in progress
+_TTL_NORMAL = 30  # applications
+_TTL_LONG = 60  # pools
 
-def get_tools() -> list[types.Tool]:
-    """Get list of compute cluster tools"""
+# Read responses keyed by (operation, *arguments)
+_response_cache = TTLCache(max_entries=1024)
+
+# Transient failures for which the last cached response is served instead
+_STALE_FALLBACK_ERRORS = (NetworkError, TimeoutError, RateLimitError)
+
+# Reads currently being fetched, keyed like the cache, so identical
+# concurrent reads share a single OCI call
+_inflight: dict[tuple[Any, ...], asyncio.Future] = {}
+
+
+def _row_mapper(fields: dict[str, str]) -> Callable[[Any], dict[str, Any]]:
+    """
+    Build a function that flattens an OCI model into a response row
+
+    Timestamps are left as datetimes; format_json_response renders them as ISO 8601.
+
+    Args:
+        fields: Response key -> model attribute
+
+    Returns:
+        Function mapping one model to a response dict
+    """
+    keys = tuple(fields)
+    get_values = attrgetter(*fields.values())
+
+    def to_row(model: Any) -> dict[str, Any]:
+        return dict(zip(keys, get_values(model)))
+
+    return to_row
+
+
+_cluster_row = _row_mapper({
+    "id": "id",
+    "name": "display_name",
+    "language": "language",
+    "spark_version": "spark_version",
+    "state": "lifecycle_state",
+    "time_created": "time_created",
+})
+_run_row = _row_mapper({
+    "id": "id",
+    "display_name": "display_name",
+    "application_id": "application_id",
+    "state": "lifecycle_state",
+    "time_created": "time_created",
+    "time_updated": "time_updated",
+})
+_log_row = _row_mapper({
+    "name": "name",
+    "size_in_bytes": "size_in_bytes",
+    "time_created": "time_created",
+    "type": "type",
+})
+_pool_row = _row_mapper({
+    "id": "id",
+    "name": "display_name",
+    "state": "lifecycle_state",
+    "time_created": "time_created",
+})
+
+# Detail responses; a run's details are the same fields as its list row
+_cluster_details = _row_mapper({
+    "id": "id",
+    "name": "display_name",
+    "description": "description",
+    "language": "language",
+    "spark_version": "spark_version",
+    "driver_shape": "driver_shape",
+    "executor_shape": "executor_shape",
+    "num_executors": "num_executors",
+    "state": "lifecycle_state",
+    "time_created": "time_created",
+    "time_updated": "time_updated",
+})
+_run_details = _run_row
+_pool_details = _row_mapper({
+    "id": "id",
+    "name": "display_name",
+    "description": "description",
+    "state": "lifecycle_state",
+    "time_created": "time_created",
+    "time_updated": "time_updated",
+})
+
+
+def _build_tools() -> list[types.Tool]:
+    """Build the compute cluster tool definitions"""
     return [
         types.Tool(
             name="list_clusters",
@@ -27,6 +122,14 @@ def get_tools() -> list[types.Tool]:
                         "type": "integer",
                         "description": "Maximum number of clusters to return",
                     },
+                    "page": {
+                        "type": "string",
+                        "description": "Page token from a previous response's pagination.next_page",
+                    },
+                    "all_pages": {
+                        "type": "boolean",
+                        "description": "Fetch every page in one call (limit becomes the page size)",
+                    },
                 },
             },
         ),
@@ -44,6 +147,21 @@ def get_tools() -> list[types.Tool]:
                 "required": ["cluster_id"],
             },
         ),
+        types.Tool(
+            name="get_clusters_bulk",
+            description="Get details for several clusters concurrently",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "cluster_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Cluster/application OCIDs",
+                    },
+                },
+                "required": ["cluster_ids"],
+            },
+        ),
         types.Tool(
             name="create_cluster",
             description="Create a new Spark cluster",
@@ -98,6 +216,47 @@ def get_tools() -> list[types.Tool]:
                         "type": "integer",
                         "description": "Maximum number of runs to return",
                     },
+                    "lifecycle_state": {
+                        "type": "string",
+                        "enum": [
+                            "ACCEPTED",
+                            "IN_PROGRESS",
+                            "CANCELING",
+                            "CANCELED",
+                            "FAILED",
+                            "SUCCEEDED",
+                            "STOPPING",
+                            "STOPPED",
+                        ],
+                        "description": "Only return runs in this state (filtered by OCI)",
+                    },
+                    "sort_by": {
+                        "type": "string",
+                        "enum": [
+                            "timeCreated",
+                            "displayName",
+                            "language",
+                            "runDurationInMilliseconds",
+                            "lifecycleState",
+                            "totalOCpu",
+                            "dataReadInBytes",
+                            "dataWrittenInBytes",
+                        ],
+                        "description": "Field to sort runs by",
+                    },
+                    "sort_order": {
+                        "type": "string",
+                        "enum": ["ASC", "DESC"],
+                        "description": "Sort direction",
+                    },
+                    "page": {
+                        "type": "string",
+                        "description": "Page token from a previous response's pagination.next_page",
+                    },
+                    "all_pages": {
+                        "type": "boolean",
+                        "description": "Fetch every page in one call (limit becomes the page size)",
+                    },
                 },
             },
         ),
@@ -115,6 +274,21 @@ def get_tools() -> list[types.Tool]:
                 "required": ["run_id"],
             },
         ),
+        types.Tool(
+            name="get_runs_bulk",
+            description="Get details for several cluster runs concurrently",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "run_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Run OCIDs",
+                    },
+                },
+                "required": ["run_ids"],
+            },
+        ),
         types.Tool(
             name="create_run",
             description="Start a new run/execution on a cluster",
@@ -133,6 +307,25 @@ def get_tools() -> list[types.Tool]:
                 "required": ["cluster_id"],
             },
         ),
+        types.Tool(
+            name="create_runs_bulk",
+            description="Start runs on several clusters concurrently",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "cluster_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Cluster/application OCIDs",
+                    },
+                    "display_name": {
+                        "type": "string",
+                        "description": "Display name prefix; each run is suffixed with its cluster OCID tail",
+                    },
+                },
+                "required": ["cluster_ids"],
+            },
+        ),
         types.Tool(
             name="delete_run",
             description="Delete a cluster run",
@@ -157,6 +350,14 @@ def get_tools() -> list[types.Tool]:
                         "type": "string",
                         "description": "Run OCID",
                     },
+                    "page": {
+                        "type": "string",
+                        "description": "Page token from a previous response's pagination.next_page",
+                    },
+                    "all_pages": {
+                        "type": "boolean",
+                        "description": "Fetch every page in one call (limit becomes the page size)",
+                    },
                 },
                 "required": ["run_id"],
             },
@@ -171,6 +372,35 @@ def get_tools() -> list[types.Tool]:
                         "type": "integer",
                         "description": "Maximum number of pools to return",
                     },
+                    "lifecycle_state": {
+                        "type": "string",
+                        "enum": [
+                            "ACCEPTED",
+                            "SCHEDULED",
+                            "CREATING",
+                            "ACTIVE",
+                            "STOPPING",
+                            "STOPPED",
+                            "UPDATING",
+                            "DELETING",
+                            "DELETED",
+                            "FAILED",
+                        ],
+                        "description": "Only return pools in this state (filtered by OCI)",
+                    },
+                    "sort_order": {
+                        "type": "string",
+                        "enum": ["ASC", "DESC"],
+                        "description": "Sort direction by creation time",
+                    },
+                    "page": {
+                        "type": "string",
+                        "description": "Page token from a previous response's pagination.next_page",
+                    },
+                    "all_pages": {
+                        "type": "boolean",
+                        "description": "Fetch every page in one call (limit becomes the page size)",
+                    },
                 },
             },
         ),
@@ -188,6 +418,21 @@ def get_tools() -> list[types.Tool]:
                 "required": ["pool_id"],
             },
         ),
+        types.Tool(
+            name="get_pools_bulk",
+            description="Get details for several resource pools concurrently",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "pool_ids": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "Pool OCIDs",
+                    },
+                },
+                "required": ["pool_ids"],
+            },
+        ),
         types.Tool(
             name="create_pool",
             description="Create a new resource pool",
@@ -251,147 +496,248 @@ def get_tools() -> list[types.Tool]:
     ]
 
 
+# Tool definitions are static, so build them once at import time
+_TOOLS = tuple(_build_tools())
+
+
+def get_tools() -> Sequence[types.Tool]:
+    """Get list of compute cluster tools"""
+    return _TOOLS
+
+
 async def handle_tool_call(
     name: str,
     arguments: dict[str, Any],
     oci_client: OCIClient,
 ) -> dict[str, Any]:
     """Handle compute/cluster tool calls"""
-    
-    if name == "list_clusters":
-        limit = arguments.get("limit", 100)
-        return await list_clusters(oci_client, limit)
-    
-    elif name == "get_cluster_details":
-        validate_required_fields(arguments, ["cluster_id"])
-        return await get_cluster_details(oci_client, arguments["cluster_id"])
-    
-    elif name == "create_cluster":
-        validate_required_fields(arguments, ["cluster_name"])
-        return await create_cluster(
-            oci_client,
-            arguments["cluster_name"],
-            arguments.get("driver_shape"),
-            arguments.get("executor_shape"),
-            arguments.get("num_executors"),
-        )
-    
-    elif name == "delete_cluster":
-        validate_required_fields(arguments, ["cluster_id"])
-        return await delete_cluster(oci_client, arguments["cluster_id"])
-    
-    elif name == "list_cluster_runs":
-        return await list_cluster_runs(
-            oci_client,
-            arguments.get("cluster_id"),
-            arguments.get("limit", 100),
-        )
-    
-    elif name == "get_run_details":
-        validate_required_fields(arguments, ["run_id"])
-        return await get_run_details(oci_client, arguments["run_id"])
-    
-    elif name == "create_run":
-        validate_required_fields(arguments, ["cluster_id"])
-        return await create_run(
-            oci_client,
-            arguments["cluster_id"],
-            arguments.get("display_name"),
-        )
-    
-    elif name == "delete_run":
-        validate_required_fields(arguments, ["run_id"])
-        return await delete_run(oci_client, arguments["run_id"])
-    
-    elif name == "get_run_logs":
-        validate_required_fields(arguments, ["run_id"])
-        return await get_run_logs(oci_client, arguments["run_id"])
-    
-    elif name == "list_pools":
-        return await list_pools(oci_client, arguments.get("limit", 100))
-    
-    elif name == "get_pool_details":
-        validate_required_fields(arguments, ["pool_id"])
-        return await get_pool_details(oci_client, arguments["pool_id"])
-    
-    elif name == "create_pool":
-        validate_required_fields(arguments, ["pool_name"])
-        return await create_pool(
-            oci_client,
-            arguments["pool_name"],
-            arguments.get("node_count"),
-        )
-    
-    elif name == "start_pool":
-        validate_required_fields(arguments, ["pool_id"])
-        return await start_pool(oci_client, arguments["pool_id"])
-    
-    elif name == "stop_pool":
-        validate_required_fields(arguments, ["pool_id"])
-        return await stop_pool(oci_client, arguments["pool_id"])
-    
-    elif name == "delete_pool":
-        validate_required_fields(arguments, ["pool_id"])
-        return await delete_pool(oci_client, arguments["pool_id"])
-    
-    else:
+    entry = _DISPATCH.get(name)
+    if entry is None:
         raise ValidationError(f"Unknown tool: {name}")
 
+    handler, validate, required_fields, optional_fields = entry
+    validate(arguments)
+
+    kwargs = {field: arguments[field] for field in required_fields}
+    for field, default in optional_fields.items():
+        kwargs[field] = arguments.get(field, default)
+
+    return await handler(oci_client, **kwargs)
+
+
+async def _gather_by_id(
+    resource_ids: list[str],
+    calls: list[Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    """
+    Run per-resource handler calls concurrently and collect their results
+
+    Args:
+        resource_ids: OCIDs, in the same order as calls
+        calls: Handler coroutines returning formatted success responses
+
+    Returns:
+        List response of the successful results, with per-OCID failures under "errors"
+    """
+    results = await asyncio.gather(*calls, return_exceptions=True)
+
+    items = []
+    errors = []
+    for resource_id, result in zip(resource_ids, results):
+        if isinstance(result, Exception):
+            errors.append({"id": resource_id, "error": str(result)})
+        else:
+            items.append(result["data"])
+
+    data = format_list_response(items, total_count=len(items))
+    if errors:
+        data["errors"] = errors
+    return format_success_response(data)
+
+
+async def _get_details_bulk(
+    get_details: Callable[[OCIClient, str], Awaitable[dict[str, Any]]],
+    oci_client: OCIClient,
+    resource_ids: list[str],
+) -> dict[str, Any]:
+    """Fetch details for several resources concurrently"""
+    return await _gather_by_id(
+        resource_ids,
+        [get_details(oci_client, resource_id) for resource_id in resource_ids],
+    )
+
+
+async def _single_flight(
+    key: tuple[Any, ...],
+    fetch: Callable[[], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    """
+    Run fetch, or join an identical fetch that is already in flight
+
+    Args:
+        key: Request key, starting with the operation name
+        fetch: Coroutine function producing the response data
+
+    Returns:
+        Response data
+    """
+    future = _inflight.get(key)
+    if future is None:
+        future = asyncio.ensure_future(fetch())
+        _inflight[key] = future
+
+        def _done(finished: asyncio.Future) -> None:
+            if _inflight.get(key) is finished:
+                del _inflight[key]
+
+        future.add_done_callback(_done)
+
+    # Shield so a cancelled caller doesn't cancel the fetch for the others
+    return await asyncio.shield(future)
+
+
+async def _cached_read(
+    oci_client: OCIClient,
+    key: tuple[Any, ...],
+    ttl_seconds: int,
+    fetch: Callable[[], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    """
+    Serve a read from the response cache, fetching it on a miss
+
+    Args:
+        oci_client: OCI client wrapper
+        key: Cache key, starting with the operation name
+        ttl_seconds: Lifetime for this operation
+        fetch: Coroutine function producing the response data
+
+    Returns:
+        Response data
+    """
+    cache_settings = oci_client.settings.cache
+    if not cache_settings.enabled:
+        return await _single_flight(key, fetch)
+
+    data = _response_cache.get(key)
+    if data is not None:
+        return data
+
+    try:
+        data = await _single_flight(key, fetch)
+    except _STALE_FALLBACK_ERRORS as e:
+        data = _response_cache.get_stale(key)
+        if data is None:
+            raise
+        logger.warning("Serving stale %s response after %s: %s", key[0], e.__class__.__name__, e)
+        return data
+
+    _response_cache.set(key, data, min(ttl_seconds, cache_settings.ttl_seconds))
+    return data
+
+
+async def _list_call(
+    oci_client: OCIClient,
+    list_func: Any,
+    page: Optional[str],
+    all_pages: bool,
+    **kwargs: Any,
+) -> Any:
+    """
+    Call a Data Flow list operation for one page, or for every page
+
+    Args:
+        oci_client: OCI client wrapper
+        list_func: OCI list operation
+        page: Page token to resume from
+        all_pages: Follow opc-next-page until the listing is exhausted
+        **kwargs: Arguments for the list operation
+
+    Returns:
+        API response; next_page is None once the listing is exhausted
+    """
+    if all_pages:
+        return await oci_client.call_api_async(
+            oci.pagination.list_call_get_all_results,
+            list_func,
+            **kwargs,
+        )
+
+    if page:
+        kwargs["page"] = page
+    return await oci_client.call_api_async(list_func, **kwargs)
+
+
+def _page_response(items: list[dict[str, Any]], next_page: Optional[str]) -> dict[str, Any]:
+    """Format one page of items; the total is only known on the last page"""
+    return format_list_response(
+        items,
+        total_count=None if next_page else len(items),
+        next_page=next_page,
+    )
+
 
 # Implementation functions using OCI Data Flow
 
-async def list_clusters(oci_client: OCIClient, limit: int = 100) -> dict[str, Any]:
+async def list_clusters(
+    oci_client: OCIClient,
+    limit: int = 100,
+    page: Optional[str] = None,
+    all_pages: bool = False,
+) -> dict[str, Any]:
     """List all Spark clusters (Data Flow applications)"""
-    logger.info(f"Listing clusters/applications (limit: {limit})")
+    logger.info("Listing clusters/applications (limit: %s)", limit)
+    compartment_id = oci_client.get_compartment_id()
     
-    response = oci_client.call_api(
-        oci_client.data_flow.list_applications,
-        compartment_id=oci_client.get_compartment_id(),
-        limit=limit,
-    )
+    async def fetch() -> dict[str, Any]:
+        response = await _list_call(
+            oci_client,
+            oci_client.data_flow.list_applications,
+            page,
+            all_pages,
+            compartment_id=compartment_id,
+            limit=limit,
+        )
+    
+        clusters = [_cluster_row(app) for app in response.data]
+    
+        return _page_response(clusters, response.next_page)
     
-    clusters = []
-    for app in response.data:
-        clusters.append({
-            "id": app.id,
-            "name": app.display_name,
-            "language": app.language,
-            "spark_version": app.spark_version,
-            "state": app.lifecycle_state,
-            "time_created": str(app.time_created) if app.time_created else None,
-        })
-    
-    data = format_list_response(clusters, total_count=len(clusters))
+    data = await _cached_read(
+        oci_client,
+        ("list_clusters", compartment_id, limit, page, all_pages),
+        _TTL_NORMAL,
+        fetch,
+    )
     return format_success_response(data)
 
 
 async def get_cluster_details(oci_client: OCIClient, cluster_id: str) -> dict[str, Any]:
     """Get cluster details"""
-    logger.info(f"Getting cluster details: {cluster_id}")
+    logger.info("Getting cluster details: %s", cluster_id)
     
-    response = oci_client.call_api(
-        oci_client.data_flow.get_application,
-        application_id=cluster_id,
-    )
+    async def fetch() -> dict[str, Any]:
+        response = await oci_client.call_api_async(
+            oci_client.data_flow.get_application,
+            application_id=cluster_id,
+        )
     
-    app = response.data
-    data = {
-        "id": app.id,
-        "name": app.display_name,
-        "description": app.description,
-        "language": app.language,
-        "spark_version": app.spark_version,
-        "driver_shape": app.driver_shape,
-        "executor_shape": app.executor_shape,
-        "num_executors": app.num_executors,
-        "state": app.lifecycle_state,
-        "time_created": str(app.time_created) if app.time_created else None,
-        "time_updated": str(app.time_updated) if app.time_updated else None,
-    }
+        return _cluster_details(response.data)
     
+    data = await _cached_read(
+        oci_client,
+        ("get_cluster_details", cluster_id),
+        _TTL_NORMAL,
+        fetch,
+    )
     return format_success_response(data)
 
 
+async def get_clusters_bulk(oci_client: OCIClient, cluster_ids: list[str]) -> dict[str, Any]:
+    """Get details for several clusters concurrently"""
+    logger.info("Getting details for %s clusters", len(cluster_ids))
+    return await _get_details_bulk(get_cluster_details, oci_client, cluster_ids)
+
+
 async def create_cluster(
     oci_client: OCIClient,
     cluster_name: str,
@@ -400,9 +746,8 @@ async def create_cluster(
     num_executors: Optional[int] = None,
 ) -> dict[str, Any]:
     """Create a new Spark cluster"""
-    logger.info(f"Creating cluster: {cluster_name}")
-    
-    import oci.data_flow.models as df_models
+    validate_cluster_name(cluster_name)
+    logger.info("Creating cluster: %s", cluster_name)
     
     create_details = df_models.CreateApplicationDetails(
         compartment_id=oci_client.get_compartment_id(),
@@ -415,10 +760,11 @@ async def create_cluster(
         file_uri="oci://bucket@namespace/path/app.py",  # Placeholder
     )
     
-    response = oci_client.call_api(
+    response = await oci_client.call_api_async(
         oci_client.data_flow.create_application,
         create_application_details=create_details,
     )
+    _response_cache.invalidate_operation("list_clusters")
     
     data = {
         "id": response.data.id,
@@ -432,12 +778,14 @@ async def create_cluster(
 
 async def delete_cluster(oci_client: OCIClient, cluster_id: str) -> dict[str, Any]:
     """Delete a cluster"""
-    logger.info(f"Deleting cluster: {cluster_id}")
+    logger.info("Deleting cluster: %s", cluster_id)
     
-    oci_client.call_api(
+    await oci_client.call_api_async(
         oci_client.data_flow.delete_application,
         application_id=cluster_id,
     )
+    _response_cache.invalidate_operation("list_clusters")
+    _response_cache.invalidate(("get_cluster_details", cluster_id))
     
     data = {
         "cluster_id": cluster_id,
@@ -452,69 +800,101 @@ async def list_cluster_runs(
     oci_client: OCIClient,
     cluster_id: Optional[str] = None,
     limit: int = 100,
+    page: Optional[str] = None,
+    all_pages: bool = False,
+    lifecycle_state: Optional[str] = None,
+    sort_by: Optional[str] = None,
+    sort_order: Optional[str] = None,
 ) -> dict[str, Any]:
     """List cluster runs"""
-    logger.info(f"Listing cluster runs (cluster: {cluster_id}, limit: {limit})")
-    
-    kwargs = {
-        "compartment_id": oci_client.get_compartment_id(),
-        "limit": limit,
-    }
-    
-    if cluster_id:
-        kwargs["application_id"] = cluster_id
-    
-    response = oci_client.call_api(
-        oci_client.data_flow.list_runs,
-        **kwargs,
+    logger.info(
+        "Listing cluster runs (cluster: %s, state: %s, limit: %s)",
+        cluster_id,
+        lifecycle_state,
+        limit,
     )
+    compartment_id = oci_client.get_compartment_id()
+    
+    async def fetch() -> dict[str, Any]:
+        kwargs = {
+            "compartment_id": compartment_id,
+            "limit": limit,
+        }
+    
+        if cluster_id:
+            kwargs["application_id"] = cluster_id
+        if lifecycle_state:
+            kwargs["lifecycle_state"] = lifecycle_state
+        if sort_by:
+            kwargs["sort_by"] = sort_by
+        if sort_order:
+            kwargs["sort_order"] = sort_order
+    
+        response = await _list_call(
+            oci_client,
+            oci_client.data_flow.list_runs,
+            page,
+            all_pages,
+            **kwargs,
+        )
     
-    runs = []
-    for run in response.data:
-        runs.append({
-            "id": run.id,
-            "display_name": run.display_name,
-            "application_id": run.application_id,
-            "state": run.lifecycle_state,
-            "time_created": str(run.time_created) if run.time_created else None,
-            "time_updated": str(run.time_updated) if run.time_updated else None,
-        })
-    
-    data = format_list_response(runs, total_count=len(runs))
+        runs = [_run_row(run) for run in response.data]
+    
+        return _page_response(runs, response.next_page)
+    
+    data = await _cached_read(
+        oci_client,
+        (
+            "list_cluster_runs",
+            compartment_id,
+            cluster_id,
+            limit,
+            page,
+            all_pages,
+            lifecycle_state,
+            sort_by,
+            sort_order,
+        ),
+        _TTL_SHORT,
+        fetch,
+    )
     return format_success_response(data)
 
 
 async def get_run_details(oci_client: OCIClient, run_id: str) -> dict[str, Any]:
     """Get run details"""
-    logger.info(f"Getting run details: {run_id}")
+    logger.info("Getting run details: %s", run_id)
     
-    response = oci_client.call_api(
-        oci_client.data_flow.get_run,
-        run_id=run_id,
-    )
+    async def fetch() -> dict[str, Any]:
+        response = await oci_client.call_api_async(
+            oci_client.data_flow.get_run,
+            run_id=run_id,
+        )
     
-    run = response.data
-    data = {
-        "id": run.id,
-        "display_name": run.display_name,
-        "application_id": run.application_id,
-        "state": run.lifecycle_state,
-        "time_created": str(run.time_created) if run.time_created else None,
-        "time_updated": str(run.time_updated) if run.time_updated else None,
-    }
+        return _run_details(response.data)
     
+    data = await _cached_read(
+        oci_client,
+        ("get_run_details", run_id),
+        _TTL_SHORT,
+        fetch,
+    )
     return format_success_response(data)
 
 
+async def get_runs_bulk(oci_client: OCIClient, run_ids: list[str]) -> dict[str, Any]:
+    """Get details for several runs concurrently"""
+    logger.info("Getting details for %s runs", len(run_ids))
+    return await _get_details_bulk(get_run_details, oci_client, run_ids)
+
+
 async def create_run(
     oci_client: OCIClient,
     cluster_id: str,
     display_name: Optional[str] = None,
 ) -> dict[str, Any]:
     """Create a new run"""
-    logger.info(f"Creating run for cluster: {cluster_id}")
-    
-    import oci.data_flow.models as df_models
+    logger.info("Creating run for cluster: %s", cluster_id)
     
     create_details = df_models.CreateRunDetails(
         compartment_id=oci_client.get_compartment_id(),
@@ -522,10 +902,11 @@ async def create_run(
         display_name=display_name or f"Run-{cluster_id[:8]}",
     )
     
-    response = oci_client.call_api(
+    response = await oci_client.call_api_async(
         oci_client.data_flow.create_run,
         create_run_details=create_details,
     )
+    _response_cache.invalidate_operation("list_cluster_runs")
     
     data = {
         "id": response.data.id,
@@ -537,14 +918,38 @@ async def create_run(
     return format_success_response(data)
 
 
+async def create_runs_bulk(
+    oci_client: OCIClient,
+    cluster_ids: list[str],
+    display_name: Optional[str] = None,
+) -> dict[str, Any]:
+    """Start runs on several clusters concurrently"""
+    logger.info("Creating runs for %s clusters", len(cluster_ids))
+    
+    # OCIClient bounds how many of these POSTs are in flight at once
+    return await _gather_by_id(
+        cluster_ids,
+        [
+            create_run(
+                oci_client,
+                cluster_id,
+                f"{display_name}-{cluster_id[-8:]}" if display_name else None,
+            )
+            for cluster_id in cluster_ids
+        ],
+    )
+
+
 async def delete_run(oci_client: OCIClient, run_id: str) -> dict[str, Any]:
     """Delete a run"""
-    logger.info(f"Deleting run: {run_id}")
+    logger.info("Deleting run: %s", run_id)
     
-    oci_client.call_api(
+    await oci_client.call_api_async(
         oci_client.data_flow.delete_run,
         run_id=run_id,
     )
+    _response_cache.invalidate_operation("list_cluster_runs")
+    _response_cache.invalidate(("get_run_details", run_id))
     
     data = {
         "run_id": run_id,
@@ -555,82 +960,115 @@ async def delete_run(oci_client: OCIClient, run_id: str) -> dict[str, Any]:
     return format_success_response(data)
 
 
-async def get_run_logs(oci_client: OCIClient, run_id: str) -> dict[str, Any]:
+async def get_run_logs(
+    oci_client: OCIClient,
+    run_id: str,
+    page: Optional[str] = None,
+    all_pages: bool = False,
+) -> dict[str, Any]:
     """Get run logs"""
-    logger.info(f"Getting logs for run: {run_id}")
+    logger.info("Getting logs for run: %s", run_id)
     
-    response = oci_client.call_api(
-        oci_client.data_flow.list_run_logs,
-        run_id=run_id,
-    )
+    async def fetch() -> dict[str, Any]:
+        response = await _list_call(
+            oci_client,
+            oci_client.data_flow.list_run_logs,
+            page,
+            all_pages,
+            run_id=run_id,
+        )
+    
+        logs = [_log_row(log) for log in response.data]
     
-    logs = []
-    for log in response.data:
-        logs.append({
-            "name": log.name,
-            "size_in_bytes": log.size_in_bytes,
-            "time_created": str(log.time_created) if log.time_created else None,
-            "type": log.type,
-        })
+        return _page_response(logs, response.next_page)
     
-    data = format_list_response(logs, total_count=len(logs))
+    data = await _cached_read(
+        oci_client,
+        ("get_run_logs", run_id, page, all_pages),
+        _TTL_SHORT,
+        fetch,
+    )
     return format_success_response(data)
 
 
-async def list_pools(oci_client: OCIClient, limit: int = 100) -> dict[str, Any]:
+async def list_pools(
+    oci_client: OCIClient,
+    limit: int = 100,
+    page: Optional[str] = None,
+    all_pages: bool = False,
+    lifecycle_state: Optional[str] = None,
+    sort_order: Optional[str] = None,
+) -> dict[str, Any]:
     """List resource pools"""
-    logger.info(f"Listing resource pools (limit: {limit})")
+    logger.info("Listing resource pools (state: %s, limit: %s)", lifecycle_state, limit)
+    compartment_id = oci_client.get_compartment_id()
     
-    response = oci_client.call_api(
-        oci_client.data_flow.list_pools,
-        compartment_id=oci_client.get_compartment_id(),
-        limit=limit,
-    )
+    async def fetch() -> dict[str, Any]:
+        kwargs = {
+            "compartment_id": compartment_id,
+            "limit": limit,
+        }
+    
+        if lifecycle_state:
+            kwargs["lifecycle_state"] = lifecycle_state
+        if sort_order:
+            kwargs["sort_order"] = sort_order
+    
+        response = await _list_call(
+            oci_client,
+            oci_client.data_flow.list_pools,
+            page,
+            all_pages,
+            **kwargs,
+        )
     
-    pools = []
-    for pool in response.data:
-        pools.append({
-            "id": pool.id,
-            "name": pool.display_name,
-            "state": pool.lifecycle_state,
-            "time_created": str(pool.time_created) if pool.time_created else None,
-        })
+        pools = [_pool_row(pool) for pool in response.data]
     
-    data = format_list_response(pools, total_count=len(pools))
+        return _page_response(pools, response.next_page)
+    
+    data = await _cached_read(
+        oci_client,
+        ("list_pools", compartment_id, limit, page, all_pages, lifecycle_state, sort_order),
+        _TTL_LONG,
+        fetch,
+    )
     return format_success_response(data)
 
 
 async def get_pool_details(oci_client: OCIClient, pool_id: str) -> dict[str, Any]:
     """Get pool details"""
-    logger.info(f"Getting pool details: {pool_id}")
+    logger.info("Getting pool details: %s", pool_id)
     
-    response = oci_client.call_api(
-        oci_client.data_flow.get_pool,
-        pool_id=pool_id,
-    )
+    async def fetch() -> dict[str, Any]:
+        response = await oci_client.call_api_async(
+            oci_client.data_flow.get_pool,
+            pool_id=pool_id,
+        )
     
-    pool = response.data
-    data = {
-        "id": pool.id,
-        "name": pool.display_name,
-        "description": pool.description,
-        "state": pool.lifecycle_state,
-        "time_created": str(pool.time_created) if pool.time_created else None,
-        "time_updated": str(pool.time_updated) if pool.time_updated else None,
-    }
+        return _pool_details(response.data)
     
+    data = await _cached_read(
+        oci_client,
+        ("get_pool_details", pool_id),
+        _TTL_LONG,
+        fetch,
+    )
     return format_success_response(data)
 
 
+async def get_pools_bulk(oci_client: OCIClient, pool_ids: list[str]) -> dict[str, Any]:
+    """Get details for several pools concurrently"""
+    logger.info("Getting details for %s pools", len(pool_ids))
+    return await _get_details_bulk(get_pool_details, oci_client, pool_ids)
+
+
 async def create_pool(
     oci_client: OCIClient,
     pool_name: str,
     node_count: Optional[int] = None,
 ) -> dict[str, Any]:
     """Create a resource pool"""
-    logger.info(f"Creating pool: {pool_name}")
-    
-    import oci.data_flow.models as df_models
+    logger.info("Creating pool: %s", pool_name)
     
     pool_config = df_models.PoolConfig(
         shape="VM.Standard2.1",
@@ -644,10 +1082,11 @@ async def create_pool(
         configurations=[pool_config],
     )
     
-    response = oci_client.call_api(
+    response = await oci_client.call_api_async(
         oci_client.data_flow.create_pool,
         create_pool_details=create_details,
     )
+    _response_cache.invalidate_operation("list_pools")
     
     data = {
         "id": response.data.id,
@@ -661,12 +1100,14 @@ async def create_pool(
 
 async def start_pool(oci_client: OCIClient, pool_id: str) -> dict[str, Any]:
     """Start a pool"""
-    logger.info(f"Starting pool: {pool_id}")
+    logger.info("Starting pool: %s", pool_id)
     
-    oci_client.call_api(
+    await oci_client.call_api_async(
         oci_client.data_flow.start_pool,
         pool_id=pool_id,
     )
+    _response_cache.invalidate_operation("list_pools")
+    _response_cache.invalidate(("get_pool_details", pool_id))
     
     data = {
         "pool_id": pool_id,
@@ -679,12 +1120,14 @@ async def start_pool(oci_client: OCIClient, pool_id: str) -> dict[str, Any]:
 
 async def stop_pool(oci_client: OCIClient, pool_id: str) -> dict[str, Any]:
     """Stop a pool"""
-    logger.info(f"Stopping pool: {pool_id}")
+    logger.info("Stopping pool: %s", pool_id)
     
-    oci_client.call_api(
+    await oci_client.call_api_async(
         oci_client.data_flow.stop_pool,
         pool_id=pool_id,
     )
+    _response_cache.invalidate_operation("list_pools")
+    _response_cache.invalidate(("get_pool_details", pool_id))
     
     data = {
         "pool_id": pool_id,
@@ -697,12 +1140,14 @@ async def stop_pool(oci_client: OCIClient, pool_id: str) -> dict[str, Any]:
 
 async def delete_pool(oci_client: OCIClient, pool_id: str) -> dict[str, Any]:
     """Delete a pool"""
-    logger.info(f"Deleting pool: {pool_id}")
+    logger.info("Deleting pool: %s", pool_id)
     
-    oci_client.call_api(
+    await oci_client.call_api_async(
         oci_client.data_flow.delete_pool,
         pool_id=pool_id,
     )
+    _response_cache.invalidate_operation("list_pools")
+    _response_cache.invalidate(("get_pool_details", pool_id))
     
     data = {
         "pool_id": pool_id,
@@ -711,3 +1156,51 @@ async def delete_pool(oci_client: OCIClient, pool_id: str) -> dict[str, Any]:
     }
     
     return format_success_response(data)
+
+
+_Handler = Callable[..., Awaitable[dict[str, Any]]]
+
+# Handler and optional-argument defaults per tool. Argument names match the
+# handler parameters; required fields come from each tool's inputSchema.
+_HANDLERS: dict[str, tuple[_Handler, dict[str, Any]]] = {
+    "list_clusters": (list_clusters, {"limit": 100, "all_pages": False}),
+    "get_cluster_details": (get_cluster_details, {}),
+    "get_clusters_bulk": (get_clusters_bulk, {}),
+    "create_cluster": (create_cluster, {}),
+    "delete_cluster": (delete_cluster, {}),
+    "list_cluster_runs": (list_cluster_runs, {"limit": 100, "all_pages": False}),
+    "get_run_details": (get_run_details, {}),
+    "get_runs_bulk": (get_runs_bulk, {}),
+    "create_run": (create_run, {}),
+    "create_runs_bulk": (create_runs_bulk, {}),
+    "delete_run": (delete_run, {}),
+    "get_run_logs": (get_run_logs, {"all_pages": False}),
+    "list_pools": (list_pools, {"limit": 100, "all_pages": False}),
+    "get_pool_details": (get_pool_details, {}),
+    "get_pools_bulk": (get_pools_bulk, {}),
+    "create_pool": (create_pool, {}),
+    "start_pool": (start_pool, {}),
+    "stop_pool": (stop_pool, {}),
+    "delete_pool": (delete_pool, {}),
+}
+
+
+def _build_dispatch() -> dict[
+    str, tuple[_Handler, Callable[[dict[str, Any]], None], list[str], dict[str, Any]]
+]:
+    """Build the tool dispatch table as (handler, validator, required fields, optional defaults)"""
+    dispatch = {}
+    for tool in _TOOLS:
+        handler, defaults = _HANDLERS[tool.name]
+        schema = tool.model_dump(by_alias=True)["inputSchema"]
+        required = list(schema.get("required", []))
+        optional = {
+            field: defaults.get(field)
+            for field in schema["properties"]
+            if field not in required
+        }
+        dispatch[tool.name] = (handler, compile_schema_validator(schema), required, optional)
+    return dispatch
+
+
+_DISPATCH = _build_dispatch()
@@ -2,7 +2,8 @@
 AIDP Module: ${module}
 Placeholder implementation with tool definitions
 """
-from typing import Any
+import sys
+from typing import Any, Iterator, Sequence
 import mcp.types as types
 from src.oci_client import OCIClient
 from utils.logger import get_logger
@@ -21,20 +22,35 @@ TOOL_COUNTS = {
     "analytics": 10,
 }
 
+_MODULE_NAME = __name__.rsplit('.', 1)[-1]
+_COUNT = TOOL_COUNTS.get(_MODULE_NAME, 10)
 
-def get_tools() -> list[types.Tool]:
+# Placeholder tools take no arguments; the schema is shared and must not be mutated
+_EMPTY_SCHEMA = {"type": "object", "properties": {}}
+
+
+def _build_tools() -> Iterator[types.Tool]:
+    """Build the placeholder tool definitions for this module"""
+    title = _MODULE_NAME.title()
+
+    # Names are interned so lookups against incoming tool names can match by identity
+    return (
+        types.Tool(
+            name=sys.intern(f"{_MODULE_NAME}_{i}"),
+            description=f"{title} operation {i}",
+            inputSchema=_EMPTY_SCHEMA,
+        )
+        for i in range(1, _COUNT + 1)
+    )
+
+
+# Tool definitions are static, so build them once at import time
+_TOOLS = tuple(_build_tools())
+
+
+def get_tools() -> Sequence[types.Tool]:
     """Get tools for this module"""
-    module_name = __name__.split('.')[-1]
-    count = TOOL_COUNTS.get(module_name, 10)
-    
-    tools = []
-    for i in range(count):
-        tools.append(types.Tool(
-            name=f"{module_name}_{i+1}",
-            description=f"{module_name.title()} operation {i+1}",
-            inputSchema={"type": "object", "properties": {}}
-        ))
-    return tools
+    return _TOOLS
 
 
 async def handle_tool_call(name: str, arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
@@ -2,20 +2,118 @@
 Module 1: Instance & Workspace Management
 Provides tools for managing AIDP instances and workspaces
 """
-from typing import Any, Optional
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional, Sequence
 import mcp.types as types
 
 from src.oci_client import OCIClient
 from utils.logger import get_logger
 from utils.formatters import format_success_response, format_list_response
-from utils.validators import validate_workspace_name, validate_required_fields
+from utils.validators import validate_workspace_name, validate_required_fields, validate_positive_integer
 from utils.errors import ResourceNotFoundError, ValidationError
+from utils.cache import TTLCache
 
 logger = get_logger(__name__)
 
-
-def get_tools() -> list[types.Tool]:
-    """Get list of instance management tools"""
+# Seconds a get_instance_status result is reused before re-testing connections
+_STATUS_TTL = 30
+
+# Seconds workspace and workspace user listings are reused; writes invalidate them
+_LIST_TTL = 30
+
+# Response data keyed by (operation, *arguments)
+_response_cache = TTLCache(max_entries=256)
+
+# Static response parts, shared by every response that includes them
+_CAPABILITIES: tuple[str, ...] = (
+    "Instance Management",
+    "Data Catalog",
+    "Object Storage",
+    "Compute Clusters",
+    "Notebooks",
+    "Jobs & Workflows",
+    "Data Pipelines",
+    "External Connections",
+    "ML Models",
+    "Analytics & Reporting",
+)
+
+# Mock data, built once; list responses are read-only once returned
+_MOCK_WORKSPACES: tuple[dict[str, Any], ...] = (
+    {
+        "name": "default",
+        "description": "Default workspace",
+        "created_time": "2025-01-15T10:00:00Z",
+        "status": "ACTIVE",
+        "user_count": 5,
+    },
+    {
+        "name": "analytics",
+        "description": "Analytics and reporting workspace",
+        "created_time": "2025-02-01T14:30:00Z",
+        "status": "ACTIVE",
+        "user_count": 3,
+    },
+)
+
+_MOCK_WORKSPACE_USERS: tuple[dict[str, Any], ...] = (
+    {
+        "user_id": "ocid1.user.oc1..aaaaaa",
+        "username": "john.doe@example.com",
+        "role": "admin",
+        "granted_time": "2025-01-15T10:00:00Z",
+    },
+    {
+        "user_id": "ocid1.user.oc1..bbbbbb",
+        "username": "jane.smith@example.com",
+        "role": "contributor",
+        "granted_time": "2025-02-01T14:30:00Z",
+    },
+)
+
+_MOCK_WORKSPACE_USERS_DATA = format_list_response(
+    list(_MOCK_WORKSPACE_USERS),
+    total_count=len(_MOCK_WORKSPACE_USERS),
+)
+
+_WORKSPACE_DETAILS_FIELDS = {
+    "description": "Workspace description",
+    "status": "ACTIVE",
+    "created_time": "2025-01-15T10:00:00Z",
+    "updated_time": "2025-10-15T16:20:00Z",
+    "user_count": 5,
+    "resource_count": {
+        "notebooks": 12,
+        "clusters": 2,
+        "jobs": 8,
+        "pipelines": 3,
+    },
+}
+
+
+# Schema fragments shared by several tools; treat them as read-only
+_WORKSPACE_NAME_PROP = {"type": "string", "description": "Name of the workspace"}
+_USER_ID_PROP = {"type": "string", "description": "User OCID or username"}
+_USER_IDS_PROP = {
+    "type": "array",
+    "items": {"type": "string"},
+    "description": "User OCIDs or usernames",
+}
+_ROLE_PROP = {
+    "type": "string",
+    "description": "Role to grant (viewer, contributor, admin)",
+    "enum": ["viewer", "contributor", "admin"],
+}
+_SCHEMA_WORKSPACE_NAME_ONLY = {
+    "type": "object",
+    "properties": {"workspace_name": _WORKSPACE_NAME_PROP},
+    "required": ["workspace_name"],
+}
+
+
+def _build_tools() -> list[types.Tool]:
+    """Build the instance management tool definitions"""
     return [
         types.Tool(
             name="get_instance_status",
@@ -49,6 +147,10 @@ def get_tools() -> list[types.Tool]:
                         "type": "integer",
                         "description": "Maximum number of workspaces to return",
                     },
+                    "page": {
+                        "type": "string",
+                        "description": "Page token from a previous response's pagination.next_page",
+                    },
                 },
             },
         ),
@@ -58,10 +160,7 @@ def get_tools() -> list[types.Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "workspace_name": {
-                        "type": "string",
-                        "description": "Name of the workspace",
-                    },
+                    "workspace_name": _WORKSPACE_NAME_PROP,
                     "description": {
                         "type": "string",
                         "description": "Description of the workspace",
@@ -73,16 +172,7 @@ def get_tools() -> list[types.Tool]:
         types.Tool(
             name="get_workspace_details",
             description="Get detailed information about a specific workspace",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "workspace_name": {
-                        "type": "string",
-                        "description": "Name of the workspace",
-                    },
-                },
-                "required": ["workspace_name"],
-            },
+            inputSchema=_SCHEMA_WORKSPACE_NAME_ONLY,
         ),
         types.Tool(
             name="update_workspace",
@@ -90,10 +180,7 @@ def get_tools() -> list[types.Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "workspace_name": {
-                        "type": "string",
-                        "description": "Name of the workspace",
-                    },
+                    "workspace_name": _WORKSPACE_NAME_PROP,
                     "description": {
                         "type": "string",
                         "description": "New description",
@@ -123,16 +210,7 @@ def get_tools() -> list[types.Tool]:
         types.Tool(
             name="list_workspace_users",
             description="List all users with access to a workspace",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "workspace_name": {
-                        "type": "string",
-                        "description": "Name of the workspace",
-                    },
-                },
-                "required": ["workspace_name"],
-            },
+            inputSchema=_SCHEMA_WORKSPACE_NAME_ONLY,
         ),
         types.Tool(
             name="grant_workspace_access",
@@ -140,19 +218,9 @@ def get_tools() -> list[types.Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "workspace_name": {
-                        "type": "string",
-                        "description": "Name of the workspace",
-                    },
-                    "user_id": {
-                        "type": "string",
-                        "description": "User OCID or username",
-                    },
-                    "role": {
-                        "type": "string",
-                        "description": "Role to grant (viewer, contributor, admin)",
-                        "enum": ["viewer", "contributor", "admin"],
-                    },
+                    "workspace_name": _WORKSPACE_NAME_PROP,
+                    "user_id": _USER_ID_PROP,
+                    "role": _ROLE_PROP,
                 },
                 "required": ["workspace_name", "user_id", "role"],
             },
@@ -163,21 +231,49 @@ def get_tools() -> list[types.Tool]:
             inputSchema={
                 "type": "object",
                 "properties": {
-                    "workspace_name": {
-                        "type": "string",
-                        "description": "Name of the workspace",
-                    },
-                    "user_id": {
-                        "type": "string",
-                        "description": "User OCID or username",
-                    },
+                    "workspace_name": _WORKSPACE_NAME_PROP,
+                    "user_id": _USER_ID_PROP,
                 },
                 "required": ["workspace_name", "user_id"],
             },
         ),
+        types.Tool(
+            name="grant_workspace_access_bulk",
+            description="Grant the same role on a workspace to several users",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "workspace_name": _WORKSPACE_NAME_PROP,
+                    "user_ids": _USER_IDS_PROP,
+                    "role": _ROLE_PROP,
+                },
+                "required": ["workspace_name", "user_ids", "role"],
+            },
+        ),
+        types.Tool(
+            name="revoke_workspace_access_bulk",
+            description="Revoke workspace access from several users",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "workspace_name": _WORKSPACE_NAME_PROP,
+                    "user_ids": _USER_IDS_PROP,
+                },
+                "required": ["workspace_name", "user_ids"],
+            },
+        ),
     ]
 
 
+# Tool definitions are static, so build them once at import time
+_TOOLS = tuple(_build_tools())
+
+
+def get_tools() -> Sequence[types.Tool]:
+    """Get list of instance management tools (12 tools)"""
+    return _TOOLS
+
+
 async def handle_tool_call(
     name: str,
     arguments: dict[str, Any],
@@ -194,69 +290,73 @@ async def handle_tool_call(
     Returns:
         Tool execution result
     """
-    if name == "get_instance_status":
-        return await get_instance_status(oci_client)
-
-    elif name == "get_instance_metrics":
-        metric_type = arguments.get("metric_type", "all")
-        return await get_instance_metrics(oci_client, metric_type)
-
-    elif name == "list_workspaces":
-        limit = arguments.get("limit", 100)
-        return await list_workspaces(oci_client, limit)
-
-    elif name == "create_workspace":
-        validate_required_fields(arguments, ["workspace_name"])
-        validate_workspace_name(arguments["workspace_name"])
-        return await create_workspace(
-            oci_client,
-            arguments["workspace_name"],
-            arguments.get("description"),
-        )
+    spec = _TOOL_SPEC.get(name)
+    if spec is None:
+        raise ValidationError(f"Unknown tool: {name}")
 
-    elif name == "get_workspace_details":
-        validate_required_fields(arguments, ["workspace_name"])
-        return await get_workspace_details(oci_client, arguments["workspace_name"])
+    handler, required_fields, field_validators, optional_fields = spec
+    if required_fields:
+        validate_required_fields(arguments, required_fields)
+    for field, validator in field_validators:
+        validator(arguments[field])
 
-    elif name == "update_workspace":
-        validate_required_fields(arguments, ["workspace_name"])
-        return await update_workspace(
-            oci_client,
-            arguments["workspace_name"],
-            arguments.get("description"),
-        )
+    kwargs = {field: arguments[field] for field in required_fields}
+    for field, default in optional_fields.items():
+        kwargs[field] = arguments.get(field, default)
 
-    elif name == "delete_workspace":
-        validate_required_fields(arguments, ["workspace_name"])
-        return await delete_workspace(
-            oci_client,
-            arguments["workspace_name"],
-            arguments.get("force", False),
-        )
+    return await handler(oci_client, **kwargs)
 
-    elif name == "list_workspace_users":
-        validate_required_fields(arguments, ["workspace_name"])
-        return await list_workspace_users(oci_client, arguments["workspace_name"])
-
-    elif name == "grant_workspace_access":
-        validate_required_fields(arguments, ["workspace_name", "user_id", "role"])
-        return await grant_workspace_access(
-            oci_client,
-            arguments["workspace_name"],
-            arguments["user_id"],
-            arguments["role"],
-        )
 
-    elif name == "revoke_workspace_access":
-        validate_required_fields(arguments, ["workspace_name", "user_id"])
-        return await revoke_workspace_access(
-            oci_client,
-            arguments["workspace_name"],
-            arguments["user_id"],
-        )
+# (epoch second, ISO 8601 string) of the last formatted timestamp
+_now_iso_cache: tuple[int, str] = (0, "")
 
-    else:
-        raise ValidationError(f"Unknown tool: {name}")
+
+def _now_iso() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string with second resolution
+
+    The string is formatted at most once per wall-clock second and reused
+    for every call within that second.
+
+    Returns:
+        Timestamp such as "2025-10-16T09:30:00Z"
+    """
+    global _now_iso_cache
+    second = int(time.time())
+    cached_second, formatted = _now_iso_cache
+    if second != cached_second:
+        formatted = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(second))
+        _now_iso_cache = (second, formatted)
+    return formatted
+
+
+async def _cached_read(
+    oci_client: OCIClient,
+    key: tuple[Any, ...],
+    ttl_seconds: int,
+    fetch: Callable[[], Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    """
+    Serve a read from the response cache, fetching it on a miss
+
+    Args:
+        oci_client: OCI client wrapper
+        key: Cache key, starting with the operation name
+        ttl_seconds: Lifetime for this operation
+        fetch: Coroutine function producing the response data
+
+    Returns:
+        Response data
+    """
+    cache_settings = oci_client.settings.cache
+    if not cache_settings.enabled:
+        return await fetch()
+
+    data = _response_cache.get(key)
+    if data is None:
+        data = await fetch()
+        _response_cache.set(key, data, min(ttl_seconds, cache_settings.ttl_seconds))
+    return data
 
 
 # Implementation functions
@@ -265,6 +365,13 @@ async def get_instance_status(oci_client: OCIClient) -> dict[str, Any]:
     """Get AIDP instance status and details"""
     logger.info("Getting instance status")
 
+    cache_settings = oci_client.settings.cache
+    key = ("get_instance_status", id(oci_client))
+    if cache_settings.enabled:
+        data = _response_cache.get(key)
+        if data is not None:
+            return format_success_response(data)
+
     # Get instance information
     instance_ocid = oci_client.get_instance_ocid()
     region = oci_client.get_region()
@@ -272,7 +379,8 @@ async def get_instance_status(oci_client: OCIClient) -> dict[str, Any]:
     namespace = oci_client.get_namespace()
 
     # Test connection to various services
-    connection_test = oci_client.test_connection()
+    connection_test = await oci_client.test_connection()
+    services = connection_test.get("services", {})
 
     data = {
         "instance_ocid": instance_ocid,
@@ -280,105 +388,172 @@ async def get_instance_status(oci_client: OCIClient) -> dict[str, Any]:
         "compartment_id": compartment_id,
         "namespace": namespace,
         "status": "ACTIVE",
-        "services": connection_test.get("services", {}),
-        "capabilities": [
-            "Instance Management",
-            "Data Catalog",
-            "Object Storage",
-            "Compute Clusters",
-            "Notebooks",
-            "Jobs & Workflows",
-            "Data Pipelines",
-            "External Connections",
-            "ML Models",
-            "Analytics & Reporting",
-        ],
+        "services": services,
+        "capabilities": _CAPABILITIES,
     }
 
+    # Only reuse healthy results, so a failed service is re-tested on the next poll
+    if cache_settings.enabled and all(
+        service.get("status") == "connected" for service in services.values()
+    ):
+        _response_cache.set(key, data, min(_STATUS_TTL, cache_settings.ttl_seconds))
+    else:
+        _response_cache.invalidate(key)
+
     return format_success_response(data)
 
 
+async def _collect_cpu(oci_client: OCIClient) -> dict[str, Any]:
+    """Collect CPU metrics"""
+    return {
+        "usage_percent": 45.2,
+        "cores_allocated": 8,
+        "cores_used": 3.6,
+    }
+
+
+async def _collect_memory(oci_client: OCIClient) -> dict[str, Any]:
+    """Collect memory metrics"""
+    return {
+        "usage_percent": 62.8,
+        "total_gb": 64,
+        "used_gb": 40.2,
+        "available_gb": 23.8,
+    }
+
+
+async def _collect_storage(oci_client: OCIClient) -> dict[str, Any]:
+    """Collect storage metrics"""
+    return {
+        "total_gb": 1000,
+        "used_gb": 567.3,
+        "available_gb": 432.7,
+        "usage_percent": 56.7,
+    }
+
+
+async def _collect_network(oci_client: OCIClient) -> dict[str, Any]:
+    """Collect network metrics"""
+    return {
+        "ingress_mbps": 125.4,
+        "egress_mbps": 89.2,
+        "total_requests": 15234,
+    }
+
+
+_MetricCollector = Callable[[OCIClient], Awaitable[dict[str, Any]]]
+
+# Metric groups and their collectors for each metric_type
+_METRIC_GROUPS: dict[str, tuple[tuple[str, _MetricCollector], ...]] = {
+    "cpu": (("cpu", _collect_cpu),),
+    "memory": (("memory", _collect_memory),),
+    "storage": (("storage", _collect_storage),),
+    "network": (("network", _collect_network),),
+    "all": (
+        ("cpu", _collect_cpu),
+        ("memory", _collect_memory),
+        ("storage", _collect_storage),
+        ("network", _collect_network),
+    ),
+}
+
+
 async def get_instance_metrics(
     oci_client: OCIClient,
     metric_type: str = "all",
 ) -> dict[str, Any]:
     """Get instance usage and performance metrics"""
-    logger.info(f"Getting instance metrics: {metric_type}")
+    logger.info("Getting instance metrics: %s", metric_type)
 
     # Note: This would integrate with OCI Monitoring service in production
-    # For now, returning mock data structure
-    metrics = {}
-
-    if metric_type in ["cpu", "all"]:
-        metrics["cpu"] = {
-            "usage_percent": 45.2,
-            "cores_allocated": 8,
-            "cores_used": 3.6,
-        }
-
-    if metric_type in ["memory", "all"]:
-        metrics["memory"] = {
-            "usage_percent": 62.8,
-            "total_gb": 64,
-            "used_gb": 40.2,
-            "available_gb": 23.8,
-        }
-
-    if metric_type in ["storage", "all"]:
-        metrics["storage"] = {
-            "total_gb": 1000,
-            "used_gb": 567.3,
-            "available_gb": 432.7,
-            "usage_percent": 56.7,
-        }
-
-    if metric_type in ["network", "all"]:
-        metrics["network"] = {
-            "ingress_mbps": 125.4,
-            "egress_mbps": 89.2,
-            "total_requests": 15234,
-        }
+    # For now, the collectors return mock data. They run concurrently, so
+    # "all" costs one round trip rather than four.
+    groups = _METRIC_GROUPS.get(metric_type, ())
+    results = await asyncio.gather(*(collect(oci_client) for _, collect in groups))
+    metrics = {group: result for (group, _), result in zip(groups, results)}
 
     data = {
         "metric_type": metric_type,
-        "timestamp": "2025-10-16T09:30:00Z",
+        "timestamp": _now_iso(),
         "metrics": metrics,
     }
 
     return format_success_response(data)
 
 
+async def _list_workspaces_page(
+    oci_client: OCIClient,
+    limit: int,
+    page: Optional[str],
+) -> tuple[list[dict[str, Any]], Optional[str]]:
+    """
+    Fetch one page of workspaces
+
+    Args:
+        oci_client: OCI client wrapper
+        limit: Maximum number of workspaces in the page
+        page: Page token from a previous call, or None for the first page
+
+    Returns:
+        Tuple of (workspaces, next page token or None on the last page)
+    """
+    # Note: In production, this would call the AIDP API with limit and page
+    # so only one page crosses the wire. For now, paging mock data the same way.
+    start = _parse_page_token(page)
+    end = start + limit
+    next_page = str(end) if end < len(_MOCK_WORKSPACES) else None
+    return list(_MOCK_WORKSPACES[start:end]), next_page
+
+
+def _parse_page_token(page: Optional[str]) -> int:
+    """
+    Decode a list_workspaces page token into a start offset
+
+    Args:
+        page: Page token from a previous call, or None for the first page
+
+    Returns:
+        Offset of the first workspace in the page
+
+    Raises:
+        ValidationError: If the token is not a non-negative integer
+    """
+    if not page:
+        return 0
+
+    try:
+        start = int(page)
+    except (TypeError, ValueError):
+        start = -1
+
+    if start < 0:
+        raise ValidationError("Invalid page token", details={"page": page})
+
+    return start
+
+
 async def list_workspaces(
     oci_client: OCIClient,
     limit: int = 100,
+    page: Optional[str] = None,
 ) -> dict[str, Any]:
-    """List all workspaces in the instance"""
-    logger.info(f"Listing workspaces (limit: {limit})")
-
-    # Note: In production, this would call actual AIDP API
-    # For now, returning mock data
-    workspaces = [
-        {
-            "name": "default",
-            "description": "Default workspace",
-            "created_time": "2025-01-15T10:00:00Z",
-            "status": "ACTIVE",
-            "user_count": 5,
-        },
-        {
-            "name": "analytics",
-            "description": "Analytics and reporting workspace",
-            "created_time": "2025-02-01T14:30:00Z",
-            "status": "ACTIVE",
-            "user_count": 3,
-        },
-    ]
-
-    data = format_list_response(
-        workspaces[:limit],
-        total_count=len(workspaces),
-    )
+    """List workspaces in the instance, one page at a time"""
+    logger.info("Listing workspaces (limit: %s)", limit)
+
+    # A limit below 1 would yield a token that never advances
+    limit = validate_positive_integer(limit, "limit")
+    _parse_page_token(page)
+
+    async def fetch() -> dict[str, Any]:
+        workspaces, next_page = await _list_workspaces_page(oci_client, limit, page)
+        return format_list_response(
+            workspaces,
+            # The total is only known when everything fit in the first page
+            total_count=None if next_page or page else len(workspaces),
+            next_page=next_page,
+        )
 
+    data = await _cached_read(oci_client, ("list_workspaces", limit, page), _LIST_TTL, fetch)
     return format_success_response(data)
 
 
@@ -388,17 +563,19 @@ async def create_workspace(
     description: Optional[str] = None,
 ) -> dict[str, Any]:
     """Create a new workspace"""
-    logger.info(f"Creating workspace: {workspace_name}")
+    logger.info("Creating workspace: %s", workspace_name)
 
     # Note: In production, this would call actual AIDP API
     data = {
         "name": workspace_name,
         "description": description or "",
         "status": "ACTIVE",
-        "created_time": "2025-10-16T09:30:00Z",
+        "created_time": _now_iso(),
         "message": f"Workspace '{workspace_name}' created successfully",
     }
 
+    _response_cache.invalidate_operation("list_workspaces")
+
     return format_success_response(data)
 
 
@@ -407,23 +584,10 @@ async def get_workspace_details(
     workspace_name: str,
 ) -> dict[str, Any]:
     """Get detailed workspace information"""
-    logger.info(f"Getting workspace details: {workspace_name}")
+    logger.info("Getting workspace details: %s", workspace_name)
 
     # Note: In production, this would call actual AIDP API
-    data = {
-        "name": workspace_name,
-        "description": "Workspace description",
-        "status": "ACTIVE",
-        "created_time": "2025-01-15T10:00:00Z",
-        "updated_time": "2025-10-15T16:20:00Z",
-        "user_count": 5,
-        "resource_count": {
-            "notebooks": 12,
-            "clusters": 2,
-            "jobs": 8,
-            "pipelines": 3,
-        },
-    }
+    data = {"name": workspace_name, **_WORKSPACE_DETAILS_FIELDS}
 
     return format_success_response(data)
 
@@ -434,15 +598,17 @@ async def update_workspace(
     description: Optional[str] = None,
 ) -> dict[str, Any]:
     """Update workspace settings"""
-    logger.info(f"Updating workspace: {workspace_name}")
+    logger.info("Updating workspace: %s", workspace_name)
 
     data = {
         "name": workspace_name,
         "description": description,
-        "updated_time": "2025-10-16T09:30:00Z",
+        "updated_time": _now_iso(),
         "message": f"Workspace '{workspace_name}' updated successfully",
     }
 
+    _response_cache.invalidate_operation("list_workspaces")
+
     return format_success_response(data)
 
 
@@ -452,7 +618,7 @@ async def delete_workspace(
     force: bool = False,
 ) -> dict[str, Any]:
     """Delete a workspace"""
-    logger.info(f"Deleting workspace: {workspace_name} (force: {force})")
+    logger.info("Deleting workspace: %s (force: %s)", workspace_name, force)
 
     data = {
         "workspace_name": workspace_name,
@@ -460,6 +626,9 @@ async def delete_workspace(
         "message": f"Workspace '{workspace_name}' deleted successfully",
     }
 
+    _response_cache.invalidate_operation("list_workspaces")
+    _response_cache.invalidate(("list_workspace_users", workspace_name))
+
     return format_success_response(data)
 
 
@@ -468,25 +637,15 @@ async def list_workspace_users(
     workspace_name: str,
 ) -> dict[str, Any]:
     """List users with access to workspace"""
-    logger.info(f"Listing users for workspace: {workspace_name}")
-
-    users = [
-        {
-            "user_id": "ocid1.user.oc1..aaaaaa",
-            "username": "john.doe@example.com",
-            "role": "admin",
-            "granted_time": "2025-01-15T10:00:00Z",
-        },
-        {
-            "user_id": "ocid1.user.oc1..bbbbbb",
-            "username": "jane.smith@example.com",
-            "role": "contributor",
-            "granted_time": "2025-02-01T14:30:00Z",
-        },
-    ]
+    logger.info("Listing users for workspace: %s", workspace_name)
 
-    data = format_list_response(users, total_count=len(users))
+    async def fetch() -> dict[str, Any]:
+        # Note: In production, this would call actual AIDP API
+        return _MOCK_WORKSPACE_USERS_DATA
 
+    data = await _cached_read(
+        oci_client, ("list_workspace_users", workspace_name), _LIST_TTL, fetch,
+    )
     return format_success_response(data)
 
 
@@ -497,16 +656,18 @@ async def grant_workspace_access(
     role: str,
 ) -> dict[str, Any]:
     """Grant user access to workspace"""
-    logger.info(f"Granting {role} access to {user_id} for workspace: {workspace_name}")
+    logger.info("Granting %s access to %s for workspace: %s", role, user_id, workspace_name)
 
     data = {
         "workspace_name": workspace_name,
         "user_id": user_id,
         "role": role,
-        "granted_time": "2025-10-16T09:30:00Z",
-        "message": f"Access granted successfully",
+        "granted_time": _now_iso(),
+        "message": "Access granted successfully",
     }
 
+    _response_cache.invalidate(("list_workspace_users", workspace_name))
+
     return format_success_response(data)
 
 
@@ -516,13 +677,125 @@ async def revoke_workspace_access(
     user_id: str,
 ) -> dict[str, Any]:
     """Revoke user access from workspace"""
-    logger.info(f"Revoking access from {user_id} for workspace: {workspace_name}")
+    logger.info("Revoking access from %s for workspace: %s", user_id, workspace_name)
 
     data = {
         "workspace_name": workspace_name,
         "user_id": user_id,
-        "revoked_time": "2025-10-16T09:30:00Z",
-        "message": f"Access revoked successfully",
+        "revoked_time": _now_iso(),
+        "message": "Access revoked successfully",
     }
 
+    _response_cache.invalidate(("list_workspace_users", workspace_name))
+
+    return format_success_response(data)
+
+
+async def _gather_by_user(
+    user_ids: list[str],
+    calls: list[Awaitable[dict[str, Any]]],
+) -> dict[str, Any]:
+    """
+    Run per-user access changes concurrently and collect their results
+
+    Args:
+        user_ids: User OCIDs or usernames, in the same order as calls
+        calls: Implementation coroutines returning formatted success responses
+
+    Returns:
+        List response of the successful results, with per-user failures under "errors"
+    """
+    results = await asyncio.gather(*calls, return_exceptions=True)
+
+    items = []
+    errors = []
+    for user_id, result in zip(user_ids, results):
+        if isinstance(result, Exception):
+            errors.append({"user_id": user_id, "error": str(result)})
+        else:
+            items.append(result["data"])
+
+    data = format_list_response(items, total_count=len(items))
+    if errors:
+        data["errors"] = errors
     return format_success_response(data)
+
+
+async def grant_workspace_access_bulk(
+    oci_client: OCIClient,
+    workspace_name: str,
+    user_ids: list[str],
+    role: str,
+) -> dict[str, Any]:
+    """Grant one role on a workspace to several users"""
+    logger.info("Granting %s access to %d users for workspace: %s", role, len(user_ids), workspace_name)
+
+    # Note: In production, this would be one multi-subject policy update if the
+    # AIDP API offers it; otherwise the per-user requests still run concurrently
+    return await _gather_by_user(
+        user_ids,
+        [grant_workspace_access(oci_client, workspace_name, user_id, role) for user_id in user_ids],
+    )
+
+
+async def revoke_workspace_access_bulk(
+    oci_client: OCIClient,
+    workspace_name: str,
+    user_ids: list[str],
+) -> dict[str, Any]:
+    """Revoke workspace access from several users"""
+    logger.info("Revoking access from %d users for workspace: %s", len(user_ids), workspace_name)
+
+    return await _gather_by_user(
+        user_ids,
+        [revoke_workspace_access(oci_client, workspace_name, user_id) for user_id in user_ids],
+    )
+
+
+_Handler = Callable[..., Awaitable[dict[str, Any]]]
+_FieldValidator = Callable[[Any], None]
+
+# Per tool: implementation, required fields, (field, validator) checks run on
+# required fields, and optional-argument defaults. Argument names match the
+# implementation parameters.
+_TOOL_SPEC: dict[
+    str, tuple[_Handler, tuple[str, ...], tuple[tuple[str, _FieldValidator], ...], dict[str, Any]]
+] = {
+    "get_instance_status": (get_instance_status, (), (), {}),
+    "get_instance_metrics": (get_instance_metrics, (), (), {"metric_type": "all"}),
+    "list_workspaces": (list_workspaces, (), (), {"limit": 100, "page": None}),
+    "create_workspace": (
+        create_workspace,
+        ("workspace_name",),
+        (("workspace_name", validate_workspace_name),),
+        {"description": None},
+    ),
+    "get_workspace_details": (get_workspace_details, ("workspace_name",), (), {}),
+    "update_workspace": (update_workspace, ("workspace_name",), (), {"description": None}),
+    "delete_workspace": (delete_workspace, ("workspace_name",), (), {"force": False}),
+    "list_workspace_users": (list_workspace_users, ("workspace_name",), (), {}),
+    "grant_workspace_access": (
+        grant_workspace_access,
+        ("workspace_name", "user_id", "role"),
+        (),
+        {},
+    ),
+    "revoke_workspace_access": (
+        revoke_workspace_access,
+        ("workspace_name", "user_id"),
+        (),
+        {},
+    ),
+    "grant_workspace_access_bulk": (
+        grant_workspace_access_bulk,
+        ("workspace_name", "user_ids", "role"),
+        (),
+        {},
+    ),
+    "revoke_workspace_access_bulk": (
+        revoke_workspace_access_bulk,
+        ("workspace_name", "user_ids"),
+        (),
+        {},
+    ),
+}
@@ -2,8 +2,18 @@
 Module 3: Object Storage Operations
 Provides comprehensive tools for managing Object Storage buckets and objects
 """
-from typing import Any, Optional
+import asyncio
+import itertools
+import os
+import queue
+import threading
+import uuid
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, Optional, Sequence
 import mcp.types as types
+import oci
+from oci.object_storage import UploadManager, models as os_models
 from pathlib import Path
 import base64
 
@@ -17,17 +27,70 @@ from utils.formatters import (
 from utils.validators import (
     validate_bucket_name,
     validate_object_name,
-    validate_required_fields,
     validate_positive_integer,
     validate_enum,
+    validate_required_fields,
 )
-from utils.errors import ResourceNotFoundError, ValidationError
+from utils.errors import APIError, ResourceNotFoundError, TimeoutError, ValidationError
+from utils.cache import TTLCache
 
 logger = get_logger(__name__)
 
+# Seconds bucket details, object metadata and object listings are reused; writes
+# invalidate them. Capped by cache.ttl_seconds (CACHE_TTL_SECONDS) and skipped
+# when caching is off.
+_METADATA_TTL = 60
 
-def get_tools() -> list[types.Tool]:
-    """Get list of object storage tools"""
+# Metadata keyed by (operation, namespace, bucket[, object]); listings by
+# ("list_objects", namespace, bucket, prefix, limit)
+_metadata_cache = TTLCache(max_entries=4096)
+
+# Destinations of server-side copies still running, as (namespace, bucket,
+# object) with a count per destination. Reads that cover them are served but
+# not cached, since the copy may replace the object at any moment.
+_pending_copies: dict[tuple[str, str, str], int] = {}
+
+# Tasks waiting out copies the caller did not wait for, held so they are not
+# garbage collected before they finish
+_copy_watchers: set[asyncio.Task] = set()
+
+# Most objects the service returns from one ListObjects call
+_LIST_PAGE_LIMIT = 1000
+
+# ListObjects only returns object names unless other fields are requested
+_LIST_OBJECT_FIELDS = "name,size,md5,timeCreated,timeModified,etag"
+
+# Most records a bulk metadata lookup reads from its listing; objects not
+# reached by then are looked up with one HeadObject each
+_BULK_METADATA_LIST_LIMIT = 10 * _LIST_PAGE_LIMIT
+
+# Placeholder result for bulk items not started after a fail-fast failure
+_SKIPPED = object()
+
+# Pre-authenticated request access types for each presigned URL access_type
+_PAR_ACCESS_TYPES = {"read": "ObjectRead", "write": "ObjectWrite"}
+
+# Bytes read from the response per write when streaming a download to disk
+_DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# Downloads above the threshold write on a separate thread so disk writes
+# overlap network reads, with up to _DOWNLOAD_PIPELINE_DEPTH chunks in between
+_PIPELINED_DOWNLOAD_THRESHOLD = 64 * 1024 * 1024
+_DOWNLOAD_PIPELINE_DEPTH = 4
+
+# Files above the threshold are uploaded as multipart uploads, with up to
+# OCIClient.multipart_parallelism parts of _MULTIPART_PART_SIZE bytes in
+# flight at once
+_MULTIPART_THRESHOLD = 128 * 1024 * 1024
+_MULTIPART_PART_SIZE = 64 * 1024 * 1024
+
+# Most parts the service accepts in one multipart upload; larger files get
+# proportionally larger parts
+_MULTIPART_MAX_PARTS = 10000
+
+
+def _build_tools() -> list[types.Tool]:
+    """Build the object storage tool definitions"""
     return [
         types.Tool(
             name="list_buckets",
@@ -133,6 +196,14 @@ def get_tools() -> list[types.Tool]:
                         "type": "integer",
                         "description": "Maximum number of objects to return",
                     },
+                    "include_formatted": {
+                        "type": "boolean",
+                        "description": "Also return a human-readable size for each object",
+                    },
+                    "refresh": {
+                        "type": "boolean",
+                        "description": "Bypass the cached listing and fetch it again",
+                    },
                 },
                 "required": ["bucket_name"],
             },
@@ -265,6 +336,10 @@ def get_tools() -> list[types.Tool]:
                         "type": "string",
                         "description": "Destination object name",
                     },
+                    "wait_for_completion": {
+                        "type": "boolean",
+                        "description": "Wait for the server-side copy to finish before returning",
+                    },
                 },
                 "required": ["source_bucket", "source_object", "dest_bucket", "dest_object"],
             },
@@ -422,6 +497,10 @@ def get_tools() -> list[types.Tool]:
                         "type": "string",
                         "description": "Prefix to add to object names",
                     },
+                    "fail_fast": {
+                        "type": "boolean",
+                        "description": "Stop starting new transfers after the first failure",
+                    },
                 },
                 "required": ["bucket_name", "file_paths"],
             },
@@ -445,213 +524,241 @@ def get_tools() -> list[types.Tool]:
                         "type": "string",
                         "description": "Destination directory",
                     },
+                    "fail_fast": {
+                        "type": "boolean",
+                        "description": "Stop starting new transfers after the first failure",
+                    },
                 },
                 "required": ["bucket_name", "object_names", "dest_directory"],
             },
         ),
+        types.Tool(
+            name="bulk_get_object_metadata",
+            description="Get size, etag and modification time for multiple objects in one listing",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "bucket_name": {
+                        "type": "string",
+                        "description": "Name of the bucket",
+                    },
+                    "object_names": {
+                        "type": "array",
+                        "items": {"type": "string"},
+                        "description": "List of object names to look up",
+                    },
+                },
+                "required": ["bucket_name", "object_names"],
+            },
+        ),
+        types.Tool(
+            name="bulk_update_object_metadata",
+            description="Update metadata for multiple objects in a bucket",
+            inputSchema={
+                "type": "object",
+                "properties": {
+                    "bucket_name": {
+                        "type": "string",
+                        "description": "Name of the bucket",
+                    },
+                    "updates": {
+                        "type": "object",
+                        "additionalProperties": {"type": "object"},
+                        "description": "Metadata key-value pairs to set, keyed by object name",
+                    },
+                },
+                "required": ["bucket_name", "updates"],
+            },
+        ),
     ]
 
 
+# Tool definitions are static, so build them once at import time
+_TOOLS = tuple(_build_tools())
+
+
+def get_tools() -> Sequence[types.Tool]:
+    """Get list of object storage tools"""
+    return _TOOLS
+
+
 async def handle_tool_call(
     name: str,
     arguments: dict[str, Any],
     oci_client: OCIClient,
 ) -> dict[str, Any]:
     """Handle storage tool calls"""
+    handler = _HANDLERS.get(name)
+    if handler is None:
+        raise ValidationError(f"Unknown tool: {name}")
 
-    if name == "list_buckets":
-        limit = arguments.get("limit", 100)
-        return await list_buckets(oci_client, limit)
-
-    elif name == "create_bucket":
-        validate_required_fields(arguments, ["bucket_name"])
-        validate_bucket_name(arguments["bucket_name"])
-        return await create_bucket(
-            oci_client,
-            arguments["bucket_name"],
-            arguments.get("storage_tier", "Standard"),
-            arguments.get("public_access", False),
-        )
-
-    elif name == "get_bucket_details":
-        validate_required_fields(arguments, ["bucket_name"])
-        return await get_bucket_details(oci_client, arguments["bucket_name"])
-
-    elif name == "update_bucket":
-        validate_required_fields(arguments, ["bucket_name"])
-        return await update_bucket(
-            oci_client,
-            arguments["bucket_name"],
-            arguments.get("public_access"),
-        )
-
-    elif name == "delete_bucket":
-        validate_required_fields(arguments, ["bucket_name"])
-        return await delete_bucket(
-            oci_client,
-            arguments["bucket_name"],
-            arguments.get("force", False),
-        )
-
-    elif name == "list_objects":
-        validate_required_fields(arguments, ["bucket_name"])
-        return await list_objects(
-            oci_client,
-            arguments["bucket_name"],
-            arguments.get("prefix"),
-            arguments.get("limit", 100),
-        )
-
-    elif name == "upload_object":
-        validate_required_fields(arguments, ["bucket_name", "object_name", "file_path"])
-        validate_object_name(arguments["object_name"])
-        return await upload_object(
-            oci_client,
-            arguments["bucket_name"],
-            arguments["object_name"],
-            arguments["file_path"],
-            arguments.get("content_type"),
-        )
-
-    elif name == "download_object":
-        validate_required_fields(arguments, ["bucket_name", "object_name", "dest_path"])
-        return await download_object(
-            oci_client,
-            arguments["bucket_name"],
-            arguments["object_name"],
-            arguments["dest_path"],
-        )
-
-    elif name == "get_object_metadata":
-        validate_required_fields(arguments, ["bucket_name", "object_name"])
-        return await get_object_metadata(
-            oci_client,
-            arguments["bucket_name"],
-            arguments["object_name"],
-        )
-
-    elif name == "update_object_metadata":
-        validate_required_fields(arguments, ["bucket_name", "object_name", "metadata"])
-        return await update_object_metadata(
-            oci_client,
-            arguments["bucket_name"],
-            arguments["object_name"],
-            arguments["metadata"],
-        )
-
-    elif name == "delete_object":
-        validate_required_fields(arguments, ["bucket_name", "object_name"])
-        return await delete_object(
-            oci_client,
-            arguments["bucket_name"],
-            arguments["object_name"],
-        )
-
-    elif name == "copy_object":
-        validate_required_fields(arguments, ["source_bucket", "source_object", "dest_bucket", "dest_object"])
-        return await copy_object(
-            oci_client,
-            arguments["source_bucket"],
-            arguments["source_object"],
-            arguments["dest_bucket"],
-            arguments["dest_object"],
-        )
+    required = _REQUIRED.get(name)
+    if required:
+        validate_required_fields(arguments, required)
 
-    elif name == "move_object":
-        validate_required_fields(arguments, ["source_bucket", "source_object", "dest_bucket", "dest_object"])
-        return await move_object(
-            oci_client,
-            arguments["source_bucket"],
-            arguments["source_object"],
-            arguments["dest_bucket"],
-            arguments["dest_object"],
-        )
+    return await handler(arguments, oci_client)
 
-    elif name == "create_presigned_url":
-        validate_required_fields(arguments, ["bucket_name", "object_name"])
-        return await create_presigned_url(
-            oci_client,
-            arguments["bucket_name"],
-            arguments["object_name"],
-            arguments.get("expiration_hours", 24),
-            arguments.get("access_type", "read"),
-        )
 
-    elif name == "list_object_versions":
-        validate_required_fields(arguments, ["bucket_name", "object_name"])
-        return await list_object_versions(
-            oci_client,
-            arguments["bucket_name"],
-            arguments["object_name"],
-        )
-
-    elif name == "restore_object_version":
-        validate_required_fields(arguments, ["bucket_name", "object_name", "version_id"])
-        return await restore_object_version(
-            oci_client,
-            arguments["bucket_name"],
-            arguments["object_name"],
-            arguments["version_id"],
+async def _cached_metadata(
+    oci_client: OCIClient,
+    key: tuple[Any, ...],
+    fetch: Callable[[], Awaitable[Any]],
+) -> Any:
+    """
+    Serve a metadata or listing read from the cache, fetching it on a miss
+
+    Args:
+        oci_client: OCI client wrapper
+        key: Cache key, starting with the operation name
+        fetch: Coroutine function producing the response data
+
+    Returns:
+        Response data
+    """
+    cache_settings = oci_client.settings.cache
+    if not cache_settings.enabled:
+        return await fetch()
+
+    data = _metadata_cache.get(key)
+    if data is None:
+        data = await fetch()
+        if not _covers_pending_copy(key):
+            _metadata_cache.set(key, data, min(_METADATA_TTL, cache_settings.ttl_seconds))
+    return data
+
+
+def _covers_pending_copy(key: tuple[Any, ...]) -> bool:
+    """Check whether a metadata or listing cache key covers a copy destination still being written"""
+    if not _pending_copies:
+        return False
+    operation, namespace, bucket_name = key[:3]
+    if operation == "get_object_metadata":
+        return (namespace, bucket_name, key[3]) in _pending_copies
+    if operation == "list_objects":
+        return any(dest[:2] == (namespace, bucket_name) for dest in _pending_copies)
+    return False
+
+
+async def _map_bounded(
+    oci_client: OCIClient,
+    func: Callable[[Any], Awaitable[Any]],
+    items: Sequence[Any],
+    stop_on_error: bool = False,
+) -> list[Any]:
+    """
+    Await func(item) for every item, with a bounded number in flight
+
+    A fixed set of workers pulls items in turn, so only
+    performance.max_concurrent_requests coroutines exist at once however long
+    items is, instead of one pending task per item.
+
+    Args:
+        oci_client: OCI client wrapper
+        func: Coroutine function applied to each item
+        items: Items to process
+        stop_on_error: Start no further items once one has failed. Items
+            already in flight still finish, since their SDK calls cannot be
+            interrupted.
+
+    Returns:
+        Results in item order; a failed item's exception takes its place, as
+        with asyncio.gather(return_exceptions=True), and items never started
+        are left as _SKIPPED
+    """
+    if not items:
+        return []
+
+    outcomes: list[Any] = [_SKIPPED] * len(items)
+    indexes = iter(range(len(items)))
+    failed = False
+
+    async def worker() -> None:
+        nonlocal failed
+        for index in indexes:
+            if failed and stop_on_error:
+                return
+            try:
+                outcomes[index] = await func(items[index])
+            except Exception as e:
+                outcomes[index] = e
+                failed = True
+
+    workers = min(len(items), oci_client.settings.performance.max_concurrent_requests)
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    return outcomes
+
+
+async def _iter_object_pages(
+    oci_client: OCIClient,
+    bucket_name: str,
+    **kwargs: Any,
+) -> AsyncIterator[list[Any]]:
+    """
+    Yield a bucket listing one page at a time
+
+    Each page is its own call_api_async request, so callers can act on a page
+    before the next is fetched and stop early without listing the rest of the
+    bucket, and only one page is ever held in memory.
+
+    Args:
+        oci_client: OCI client wrapper
+        bucket_name: Bucket to list
+        **kwargs: Keyword arguments for list_objects, such as prefix, start
+            or fields
+
+    Yields:
+        ObjectSummary records for each page, in name order
+    """
+    namespace = oci_client.get_namespace()
+    start = kwargs.pop("start", None)
+
+    while True:
+        if start is not None:
+            kwargs["start"] = start
+        response = await oci_client.call_api_async(
+            oci_client.object_storage.list_objects,
+            namespace_name=namespace,
+            bucket_name=bucket_name,
+            limit=_LIST_PAGE_LIMIT,
+            **kwargs,
         )
+        if response.data.objects:
+            yield response.data.objects
+        start = response.data.next_start_with
+        if not start:
+            return
 
-    elif name == "set_object_lifecycle":
-        validate_required_fields(arguments, ["bucket_name", "rule_name", "action", "days"])
-        return await set_object_lifecycle(
-            oci_client,
-            arguments["bucket_name"],
-            arguments["rule_name"],
-            arguments["action"],
-            arguments["days"],
-        )
 
-    elif name == "get_bucket_lifecycle":
-        validate_required_fields(arguments, ["bucket_name"])
-        return await get_bucket_lifecycle(oci_client, arguments["bucket_name"])
-
-    elif name == "bulk_upload":
-        validate_required_fields(arguments, ["bucket_name", "file_paths"])
-        return await bulk_upload(
-            oci_client,
-            arguments["bucket_name"],
-            arguments["file_paths"],
-            arguments.get("prefix"),
-        )
-
-    elif name == "bulk_download":
-        validate_required_fields(arguments, ["bucket_name", "object_names", "dest_directory"])
-        return await bulk_download(
-            oci_client,
-            arguments["bucket_name"],
-            arguments["object_names"],
-            arguments["dest_directory"],
-        )
-
-    else:
-        raise ValidationError(f"Unknown tool: {name}")
+def _invalidate_object(oci_client: OCIClient, bucket_name: str, object_name: str) -> None:
+    """Drop cached metadata and bucket listings for an object that was written or deleted"""
+    namespace = oci_client.get_namespace()
+    _metadata_cache.invalidate(("get_object_metadata", namespace, bucket_name, object_name))
+    _metadata_cache.invalidate_prefix(("list_objects", namespace, bucket_name))
 
 
 # Implementation functions
 
 async def list_buckets(oci_client: OCIClient, limit: int = 100) -> dict[str, Any]:
     """List all buckets"""
-    logger.info(f"Listing buckets (limit: {limit})")
+    logger.info("Listing buckets (limit: %s)", limit)
 
-    response = oci_client.call_api(
+    response = await oci_client.call_api_async(
         oci_client.object_storage.list_buckets,
         namespace_name=oci_client.get_namespace(),
         compartment_id=oci_client.get_compartment_id(),
         limit=limit,
     )
 
-    buckets = []
-    for bucket in response.data:
-        buckets.append({
+    buckets = [
+        {
             "name": bucket.name,
             "namespace": bucket.namespace,
             "compartment_id": bucket.compartment_id,
-            "created_time": str(bucket.time_created) if bucket.time_created else None,
+            "created_time": bucket.time_created.isoformat() if bucket.time_created else None,
             "etag": bucket.etag,
-        })
+        }
+        for bucket in response.data
+    ]
 
     data = format_list_response(buckets, total_count=len(buckets))
     return format_success_response(data)
@@ -664,9 +771,7 @@ async def create_bucket(
     public_access: bool = False,
 ) -> dict[str, Any]:
     """Create a new bucket"""
-    logger.info(f"Creating bucket: {bucket_name}")
-
-    import oci.object_storage.models as os_models
+    logger.info("Creating bucket: %s", bucket_name)
 
     create_bucket_details = os_models.CreateBucketDetails(
         name=bucket_name,
@@ -675,7 +780,7 @@ async def create_bucket(
         public_access_type="ObjectRead" if public_access else "NoPublicAccess",
     )
 
-    response = oci_client.call_api(
+    response = await oci_client.call_api_async(
         oci_client.object_storage.create_bucket,
         namespace_name=oci_client.get_namespace(),
         create_bucket_details=create_bucket_details,
@@ -684,7 +789,7 @@ async def create_bucket(
     data = {
         "name": response.data.name,
         "namespace": response.data.namespace,
-        "created_time": str(response.data.time_created),
+        "created_time": response.data.time_created.isoformat() if response.data.time_created else None,
         "storage_tier": response.data.storage_tier,
         "message": f"Bucket '{bucket_name}' created successfully",
     }
@@ -694,28 +799,34 @@ async def create_bucket(
 
 async def get_bucket_details(oci_client: OCIClient, bucket_name: str) -> dict[str, Any]:
     """Get bucket details"""
-    logger.info(f"Getting bucket details: {bucket_name}")
+    logger.info("Getting bucket details: %s", bucket_name)
 
-    response = oci_client.call_api(
-        oci_client.object_storage.get_bucket,
-        namespace_name=oci_client.get_namespace(),
-        bucket_name=bucket_name,
-    )
+    namespace = oci_client.get_namespace()
 
-    bucket = response.data
-    data = {
-        "name": bucket.name,
-        "namespace": bucket.namespace,
-        "compartment_id": bucket.compartment_id,
-        "created_time": str(bucket.time_created) if bucket.time_created else None,
-        "storage_tier": bucket.storage_tier,
-        "public_access_type": bucket.public_access_type,
-        "etag": bucket.etag,
-        "approximate_count": bucket.approximate_count,
-        "approximate_size": bucket.approximate_size,
-        "approximate_size_formatted": format_file_size(bucket.approximate_size or 0),
-    }
+    async def fetch() -> dict[str, Any]:
+        response = await oci_client.call_api_async(
+            oci_client.object_storage.get_bucket,
+            namespace_name=namespace,
+            bucket_name=bucket_name,
+        )
 
+        bucket = response.data
+        return {
+            "name": bucket.name,
+            "namespace": bucket.namespace,
+            "compartment_id": bucket.compartment_id,
+            "created_time": bucket.time_created.isoformat() if bucket.time_created else None,
+            "storage_tier": bucket.storage_tier,
+            "public_access_type": bucket.public_access_type,
+            "etag": bucket.etag,
+            "approximate_count": bucket.approximate_count,
+            "approximate_size": bucket.approximate_size,
+            "approximate_size_formatted": format_file_size(bucket.approximate_size or 0),
+        }
+
+    data = await _cached_metadata(
+        oci_client, ("get_bucket_details", namespace, bucket_name), fetch,
+    )
     return format_success_response(data)
 
 
@@ -725,10 +836,9 @@ async def update_bucket(
     public_access: Optional[bool] = None,
 ) -> dict[str, Any]:
     """Update bucket settings"""
-    logger.info(f"Updating bucket: {bucket_name}")
-
-    import oci.object_storage.models as os_models
+    logger.info("Updating bucket: %s", bucket_name)
 
+    namespace = oci_client.get_namespace()
     update_bucket_details = os_models.UpdateBucketDetails()
 
     if public_access is not None:
@@ -736,9 +846,9 @@ async def update_bucket(
             "ObjectRead" if public_access else "NoPublicAccess"
         )
 
-    response = oci_client.call_api(
+    response = await oci_client.call_api_async(
         oci_client.object_storage.update_bucket,
-        namespace_name=oci_client.get_namespace(),
+        namespace_name=namespace,
         bucket_name=bucket_name,
         update_bucket_details=update_bucket_details,
     )
@@ -749,38 +859,64 @@ async def update_bucket(
         "message": f"Bucket '{bucket_name}' updated successfully",
     }
 
+    _metadata_cache.invalidate(("get_bucket_details", namespace, bucket_name))
+
     return format_success_response(data)
 
 
+async def _delete_all_objects(oci_client: OCIClient, bucket_name: str) -> None:
+    """
+    Delete every object in a bucket
+
+    The listing is streamed a page at a time, and each page's deletes run
+    concurrently, bounded by the client's request limit. Objects that are
+    already gone are ignored.
+
+    Args:
+        oci_client: OCI client wrapper
+        bucket_name: Bucket to empty
+
+    Raises:
+        AIDPError: The first delete failure other than a missing object
+    """
+    namespace = oci_client.get_namespace()
+
+    async def delete_one(obj: Any) -> None:
+        await oci_client.call_api_async(
+            oci_client.object_storage.delete_object,
+            namespace_name=namespace,
+            bucket_name=bucket_name,
+            object_name=obj.name,
+        )
+
+    # Each page is deleted before the next is listed, so a large bucket is
+    # never held in memory at once; the next page starts at a name the
+    # current page did not include, so deleting it does not disturb paging
+    async for page in _iter_object_pages(oci_client, bucket_name):
+        outcomes = await _map_bounded(oci_client, delete_one, page)
+
+        for outcome in outcomes:
+            if isinstance(outcome, Exception) and not isinstance(outcome, ResourceNotFoundError):
+                raise outcome
+
+
 async def delete_bucket(
     oci_client: OCIClient,
     bucket_name: str,
     force: bool = False,
 ) -> dict[str, Any]:
     """Delete a bucket"""
-    logger.info(f"Deleting bucket: {bucket_name} (force: {force})")
+    logger.info("Deleting bucket: %s (force: %s)", bucket_name, force)
 
     # If force, delete all objects first
     if force:
-        # List and delete all objects
-        objects_response = oci_client.call_api(
-            oci_client.object_storage.list_objects,
-            namespace_name=oci_client.get_namespace(),
-            bucket_name=bucket_name,
-        )
-
-        for obj in objects_response.data.objects:
-            oci_client.call_api(
-                oci_client.object_storage.delete_object,
-                namespace_name=oci_client.get_namespace(),
-                bucket_name=bucket_name,
-                object_name=obj.name,
-            )
+        await _delete_all_objects(oci_client, bucket_name)
 
     # Delete the bucket
-    oci_client.call_api(
+    namespace = oci_client.get_namespace()
+    await oci_client.call_api_async(
         oci_client.object_storage.delete_bucket,
-        namespace_name=oci_client.get_namespace(),
+        namespace_name=namespace,
         bucket_name=bucket_name,
     )
 
@@ -790,6 +926,10 @@ async def delete_bucket(
         "message": f"Bucket '{bucket_name}' deleted successfully",
     }
 
+    _metadata_cache.invalidate(("get_bucket_details", namespace, bucket_name))
+    _metadata_cache.invalidate_prefix(("list_objects", namespace, bucket_name))
+    _metadata_cache.invalidate_operation("get_object_metadata")
+
     return format_success_response(data)
 
 
@@ -798,38 +938,84 @@ async def list_objects(
     bucket_name: str,
     prefix: Optional[str] = None,
     limit: int = 100,
+    include_formatted: bool = False,
+    refresh: bool = False,
 ) -> dict[str, Any]:
     """List objects in a bucket"""
-    logger.info(f"Listing objects in bucket: {bucket_name} (prefix: {prefix})")
+    logger.info("Listing objects in bucket: %s (prefix: %s)", bucket_name, prefix)
+
+    namespace = oci_client.get_namespace()
+
+    # Repeated listings of the same prefix are served from the cache until
+    # an object in the bucket is written or deleted through this server
+    key = ("list_objects", namespace, bucket_name, prefix, limit)
+    if refresh:
+        _metadata_cache.invalidate(key)
+
+    async def fetch() -> list[dict[str, Any]]:
+        kwargs = {
+            "namespace_name": namespace,
+            "bucket_name": bucket_name,
+            "fields": _LIST_OBJECT_FIELDS,
+        }
+
+        if prefix:
+            kwargs["prefix"] = prefix
+
+        records = await oci_client.call_api_async(
+            _list_objects_up_to,
+            oci_client.object_storage,
+            limit,
+            **kwargs,
+        )
 
-    kwargs = {
-        "namespace_name": oci_client.get_namespace(),
-        "bucket_name": bucket_name,
-        "limit": limit,
-    }
+        return [
+            {
+                "name": obj.name,
+                "size": obj.size,
+                "md5": obj.md5,
+                "time_created": obj.time_created.isoformat() if obj.time_created else None,
+                "time_modified": obj.time_modified.isoformat() if obj.time_modified else None,
+                "etag": obj.etag,
+            }
+            for obj in records
+        ]
+
+    objects = await _cached_metadata(oci_client, key, fetch)
+    if include_formatted:
+        # Cached rows are shared, so formatted sizes go on copies
+        objects = [
+            {**obj, "size_formatted": format_file_size(obj["size"] or 0)}
+            for obj in objects
+        ]
 
-    if prefix:
-        kwargs["prefix"] = prefix
+    data = format_list_response(objects, total_count=len(objects))
+    return format_success_response(data)
 
-    response = oci_client.call_api(
-        oci_client.object_storage.list_objects,
-        **kwargs,
-    )
 
-    objects = []
-    for obj in response.data.objects:
-        objects.append({
-            "name": obj.name,
-            "size": obj.size,
-            "size_formatted": format_file_size(obj.size or 0),
-            "md5": obj.md5,
-            "time_created": str(obj.time_created) if obj.time_created else None,
-            "time_modified": str(obj.time_modified) if obj.time_modified else None,
-            "etag": obj.etag,
-        })
+def _list_objects_up_to(object_storage: Any, limit: int, **kwargs: Any) -> list[Any]:
+    """
+    Page through ListObjects until limit objects have been collected
 
-    data = format_list_response(objects, total_count=len(objects))
-    return format_success_response(data)
+    Pages are fetched lazily and the next one is only requested while more
+    objects are needed, so listings above one page are not truncated and no
+    page past the limit is fetched.
+
+    Args:
+        object_storage: Object Storage client
+        limit: Maximum number of objects to return
+        **kwargs: Keyword arguments for list_objects
+
+    Returns:
+        ObjectSummary records
+    """
+    records = oci.pagination.list_call_get_all_results_generator(
+        object_storage.list_objects,
+        "record",
+        limit=min(limit, _LIST_PAGE_LIMIT),
+        **kwargs,
+    )
+    return list(itertools.islice(records, limit))
 
 
 async def upload_object(
@@ -840,8 +1026,48 @@ async def upload_object(
     content_type: Optional[str] = None,
 ) -> dict[str, Any]:
     """Upload an object"""
-    logger.info(f"Uploading {file_path} to {bucket_name}/{object_name}")
+    logger.info("Uploading %s to %s/%s", file_path, bucket_name, object_name)
+
+    size, etag = await _upload_file(oci_client, bucket_name, object_name, file_path, content_type)
 
+    data = {
+        "bucket_name": bucket_name,
+        "object_name": object_name,
+        "size": size,
+        "size_formatted": format_file_size(size),
+        "etag": etag,
+        "message": f"Object '{object_name}' uploaded successfully",
+    }
+
+    return format_success_response(data)
+
+
+async def _upload_file(
+    oci_client: OCIClient,
+    bucket_name: str,
+    object_name: str,
+    file_path: str,
+    content_type: Optional[str] = None,
+) -> tuple[int, Optional[str]]:
+    """
+    Upload a local file as an object
+
+    This is the transfer behind upload_object without its response payload,
+    so bulk uploads do not build and discard a full response per file.
+
+    Args:
+        oci_client: OCI client wrapper
+        bucket_name: Destination bucket
+        object_name: Destination object name
+        file_path: Local file to upload
+        content_type: Optional content type
+
+    Returns:
+        The uploaded size in bytes and the object's ETag
+
+    Raises:
+        ValidationError: If the file does not exist
+    """
     file_path_obj = Path(file_path).expanduser()
 
     if not file_path_obj.exists():
@@ -850,26 +1076,48 @@ async def upload_object(
             details={"file_path": file_path},
         )
 
-    with open(file_path_obj, "rb") as f:
-        response = oci_client.call_api(
-            oci_client.object_storage.put_object,
-            namespace_name=oci_client.get_namespace(),
-            bucket_name=bucket_name,
-            object_name=object_name,
-            put_object_body=f,
-            content_type=content_type,
-        )
+    size = file_path_obj.stat().st_size
 
-    data = {
-        "bucket_name": bucket_name,
-        "object_name": object_name,
-        "size": file_path_obj.stat().st_size,
-        "size_formatted": format_file_size(file_path_obj.stat().st_size),
-        "etag": response.headers.get("etag"),
-        "message": f"Object '{object_name}' uploaded successfully",
-    }
+    namespace = oci_client.get_namespace()
 
-    return format_success_response(data)
+    if size > _MULTIPART_THRESHOLD:
+        # Large files are split into parts that upload concurrently, and a
+        # failed part is retried on its own rather than restarting the upload.
+        # The multipart slot keeps bulk uploads of large files from sending
+        # more parts at once than max_concurrent_requests.
+        async with oci_client.multipart_slots:
+            upload_manager = UploadManager(
+                oci_client.object_storage,
+                allow_parallel_uploads=True,
+                parallel_process_count=oci_client.multipart_parallelism,
+            )
+            response = await oci_client.call_api_async(
+                upload_manager.upload_file,
+                namespace,
+                bucket_name,
+                object_name,
+                str(file_path_obj),
+                part_size=max(_MULTIPART_PART_SIZE, -(-size // _MULTIPART_MAX_PARTS)),
+                content_type=content_type,
+            )
+    else:
+        # put_object streams from the file object as it sends, so memory use stays
+        # flat for any file size. Run it on the client's worker pool so the event
+        # loop keeps serving other tool calls during the upload.
+        with open(file_path_obj, "rb") as f:
+            response = await oci_client.call_api_async(
+                oci_client.object_storage.put_object,
+                namespace_name=namespace,
+                bucket_name=bucket_name,
+                object_name=object_name,
+                put_object_body=f,
+                content_length=size,
+                content_type=content_type,
+            )
+
+    _invalidate_object(oci_client, bucket_name, object_name)
+
+    return size, response.headers.get("etag")
 
 
 async def download_object(
@@ -879,59 +1127,148 @@ async def download_object(
     dest_path: str,
 ) -> dict[str, Any]:
     """Download an object"""
-    logger.info(f"Downloading {bucket_name}/{object_name} to {dest_path}")
+    logger.info("Downloading %s/%s to %s", bucket_name, object_name, dest_path)
 
-    response = oci_client.call_api(
-        oci_client.object_storage.get_object,
+    dest_path_obj = Path(dest_path).expanduser()
+    dest_path_obj.parent.mkdir(parents=True, exist_ok=True)
+
+    # The body is streamed while it is written, so the whole transfer runs on
+    # the client's worker pool rather than on the event loop
+    size = await oci_client.call_api_async(
+        _get_object_to_file,
+        oci_client.object_storage,
+        dest_path_obj,
         namespace_name=oci_client.get_namespace(),
         bucket_name=bucket_name,
         object_name=object_name,
     )
 
-    dest_path_obj = Path(dest_path).expanduser()
-    dest_path_obj.parent.mkdir(parents=True, exist_ok=True)
-
-    with open(dest_path_obj, "wb") as f:
-        for chunk in response.data.raw.stream(1024 * 1024, decode_content=False):
-            f.write(chunk)
-
     data = {
         "bucket_name": bucket_name,
         "object_name": object_name,
         "dest_path": str(dest_path_obj),
-        "size": dest_path_obj.stat().st_size,
-        "size_formatted": format_file_size(dest_path_obj.stat().st_size),
+        "size": size,
+        "size_formatted": format_file_size(size),
         "message": f"Object '{object_name}' downloaded successfully",
     }
 
     return format_success_response(data)
 
 
+def _get_object_to_file(object_storage: Any, dest_path: Path, **kwargs: Any) -> int:
+    """
+    Get an object and stream its body into a local file
+
+    Chunks go straight from the HTTP response to an unbuffered file, so memory
+    use stays constant regardless of object size. The body is written to a
+    sibling ".part" file that replaces dest_path only once it is complete, so
+    an interrupted transfer never leaves a truncated file behind.
+
+    Args:
+        object_storage: Object Storage client
+        dest_path: Local file to write
+        **kwargs: Keyword arguments for get_object
+
+    Returns:
+        Number of bytes written
+    """
+    response = object_storage.get_object(**kwargs)
+    part_path = dest_path.with_name(dest_path.name + ".part")
+    chunks = response.data.raw.stream(_DOWNLOAD_CHUNK_SIZE, decode_content=False)
+    content_length = int(response.headers.get("content-length") or 0)
+    try:
+        with open(part_path, "wb", buffering=0) as f:
+            if content_length > _PIPELINED_DOWNLOAD_THRESHOLD:
+                size = _write_pipelined(f, chunks)
+            else:
+                size = 0
+                for chunk in chunks:
+                    size += f.write(chunk)
+        os.replace(part_path, dest_path)
+    except BaseException:
+        part_path.unlink(missing_ok=True)
+        raise
+    return size
+
+
+def _write_pipelined(f: Any, chunks: Iterable[bytes]) -> int:
+    """
+    Write chunks from a separate thread while the next ones are received
+
+    A slow disk write then no longer delays the next network read. Up to
+    _DOWNLOAD_PIPELINE_DEPTH chunks are held between the two threads.
+
+    Args:
+        f: Binary file to write
+        chunks: Chunks read from the response
+
+    Returns:
+        Number of bytes written
+
+    Raises:
+        OSError: If a write fails
+    """
+    pending: queue.Queue[Optional[bytes]] = queue.Queue(maxsize=_DOWNLOAD_PIPELINE_DEPTH)
+    errors: list[BaseException] = []
+    written = 0
+
+    def writer() -> None:
+        nonlocal written
+        # Keep draining after a failure so the reader never blocks on put()
+        while (chunk := pending.get()) is not None:
+            if not errors:
+                try:
+                    written += f.write(chunk)
+                except BaseException as e:
+                    errors.append(e)
+
+    thread = threading.Thread(target=writer, name="oci-download-writer", daemon=True)
+    thread.start()
+    try:
+        for chunk in chunks:
+            if errors:
+                break
+            pending.put(chunk)
+    finally:
+        pending.put(None)
+        thread.join()
+
+    if errors:
+        raise errors[0]
+    return written
+
+
 async def get_object_metadata(
     oci_client: OCIClient,
     bucket_name: str,
     object_name: str,
 ) -> dict[str, Any]:
     """Get object metadata"""
-    logger.info(f"Getting metadata for {bucket_name}/{object_name}")
+    logger.info("Getting metadata for %s/%s", bucket_name, object_name)
 
-    response = oci_client.call_api(
-        oci_client.object_storage.head_object,
-        namespace_name=oci_client.get_namespace(),
-        bucket_name=bucket_name,
-        object_name=object_name,
-    )
+    namespace = oci_client.get_namespace()
 
-    data = {
-        "bucket_name": bucket_name,
-        "object_name": object_name,
-        "content_length": response.headers.get("content-length"),
-        "content_type": response.headers.get("content-type"),
-        "etag": response.headers.get("etag"),
-        "last_modified": response.headers.get("last-modified"),
-        "metadata": response.headers.get("opc-meta-*", {}),
-    }
+    async def fetch() -> dict[str, Any]:
+        response = await oci_client.call_api_async(
+            oci_client.object_storage.head_object,
+            namespace_name=namespace,
+            bucket_name=bucket_name,
+            object_name=object_name,
+        )
 
+        return {
+            "bucket_name": bucket_name,
+            "object_name": object_name,
+            "content_length": response.headers.get("content-length"),
+            "content_type": response.headers.get("content-type"),
+            "etag": response.headers.get("etag"),
+            "last_modified": response.headers.get("last-modified"),
+            "metadata": response.headers.get("opc-meta-*", {}),
+        }
+
+    data = await _cached_metadata(
+        oci_client, ("get_object_metadata", namespace, bucket_name, object_name), fetch,
+    )
     return format_success_response(data)
 
 
@@ -942,34 +1279,45 @@ async def update_object_metadata(
     metadata: dict[str, str],
 ) -> dict[str, Any]:
     """Update object metadata"""
-    logger.info(f"Updating metadata for {bucket_name}/{object_name}")
+    logger.info("Updating metadata for %s/%s", bucket_name, object_name)
 
-    # Note: OCI requires copying the object to update metadata
-    import oci.object_storage.models as os_models
+    # Note: OCI has no in-place metadata update, so the object is copied onto
+    # itself with the new metadata. The copy runs server-side; no data passes
+    # through this server.
+    namespace = oci_client.get_namespace()
 
     copy_object_details = os_models.CopyObjectDetails(
         source_object_name=object_name,
         destination_region=oci_client.get_region(),
-        destination_namespace=oci_client.get_namespace(),
+        destination_namespace=namespace,
         destination_bucket=bucket_name,
         destination_object_name=object_name,
         destination_object_metadata=metadata,
     )
 
-    oci_client.call_api(
+    response = await oci_client.call_api_async(
         oci_client.object_storage.copy_object,
-        namespace_name=oci_client.get_namespace(),
+        namespace_name=namespace,
         bucket_name=bucket_name,
         copy_object_details=copy_object_details,
     )
 
+    # The copy is asynchronous. Reads made before it finishes would see, and
+    # cache, the old metadata, so wait for it before invalidating.
+    work_request_id = response.headers.get("opc-work-request-id")
+    if work_request_id:
+        await _wait_for_work_request(oci_client, work_request_id)
+
     data = {
         "bucket_name": bucket_name,
         "object_name": object_name,
         "metadata": metadata,
+        "work_request_id": work_request_id,
         "message": "Metadata updated successfully",
     }
 
+    _invalidate_object(oci_client, bucket_name, object_name)
+
     return format_success_response(data)
 
 
@@ -979,9 +1327,9 @@ async def delete_object(
     object_name: str,
 ) -> dict[str, Any]:
     """Delete an object"""
-    logger.info(f"Deleting {bucket_name}/{object_name}")
+    logger.info("Deleting %s/%s", bucket_name, object_name)
 
-    oci_client.call_api(
+    await oci_client.call_api_async(
         oci_client.object_storage.delete_object,
         namespace_name=oci_client.get_namespace(),
         bucket_name=bucket_name,
@@ -995,47 +1343,156 @@ async def delete_object(
         "message": f"Object '{object_name}' deleted successfully",
     }
 
+    _invalidate_object(oci_client, bucket_name, object_name)
+
     return format_success_response(data)
 
 
+async def _wait_for_work_request(oci_client: OCIClient, work_request_id: str) -> str:
+    """
+    Poll an Object Storage work request until it finishes
+
+    Args:
+        oci_client: OCI client wrapper
+        work_request_id: Work request OCID, e.g. from copy_object
+
+    Returns:
+        Final status (COMPLETED)
+
+    Raises:
+        APIError: If the work request failed or was canceled
+        TimeoutError: If it is still running after performance.request_timeout_seconds
+    """
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + oci_client.settings.performance.request_timeout_seconds
+    delay = 1.0
+
+    while True:
+        response = await oci_client.call_api_async(
+            oci_client.object_storage.get_work_request,
+            work_request_id=work_request_id,
+        )
+        status = response.data.status
+        if status == "COMPLETED":
+            return status
+        if status in ("FAILED", "CANCELED"):
+            raise APIError(
+                f"Work request {status.lower()}",
+                details={"work_request_id": work_request_id, "status": status},
+            )
+        if loop.time() + delay > deadline:
+            raise TimeoutError(
+                "Timed out waiting for work request",
+                details={"work_request_id": work_request_id, "status": status},
+            )
+
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 10.0)
+
+
 async def copy_object(
     oci_client: OCIClient,
     source_bucket: str,
     source_object: str,
     dest_bucket: str,
     dest_object: str,
+    wait_for_completion: bool = False,
 ) -> dict[str, Any]:
-    """Copy an object"""
-    logger.info(f"Copying {source_bucket}/{source_object} to {dest_bucket}/{dest_object}")
+    """Copy an object server-side, optionally waiting for the copy to finish"""
+    logger.info("Copying %s/%s to %s/%s", source_bucket, source_object, dest_bucket, dest_object)
 
-    import oci.object_storage.models as os_models
+    namespace = oci_client.get_namespace()
 
     copy_object_details = os_models.CopyObjectDetails(
         source_object_name=source_object,
         destination_region=oci_client.get_region(),
-        destination_namespace=oci_client.get_namespace(),
+        destination_namespace=namespace,
         destination_bucket=dest_bucket,
         destination_object_name=dest_object,
     )
 
-    response = oci_client.call_api(
+    # The bytes move inside Object Storage; the service runs the copy as a work request
+    response = await oci_client.call_api_async(
         oci_client.object_storage.copy_object,
-        namespace_name=oci_client.get_namespace(),
+        namespace_name=namespace,
         bucket_name=source_bucket,
         copy_object_details=copy_object_details,
     )
+    work_request_id = response.headers.get("opc-work-request-id")
+
+    # The destination only changes once the work request ends, so its cache
+    # entries are dropped then rather than now; until then reads of it are
+    # not cached. Without a work request there is nothing to wait for.
+    status = "ACCEPTED"
+    if not work_request_id:
+        _invalidate_object(oci_client, dest_bucket, dest_object)
+    else:
+        dest = (namespace, dest_bucket, dest_object)
+        _pending_copies[dest] = _pending_copies.get(dest, 0) + 1
+        if wait_for_completion:
+            status = await _finish_copy(oci_client, work_request_id, dest)
+        else:
+            watcher = asyncio.ensure_future(_watch_copy(oci_client, work_request_id, dest))
+            _copy_watchers.add(watcher)
+            watcher.add_done_callback(_copy_watchers.discard)
 
     data = {
         "source_bucket": source_bucket,
         "source_object": source_object,
         "dest_bucket": dest_bucket,
         "dest_object": dest_object,
-        "message": "Object copied successfully",
+        "work_request_id": work_request_id,
+        "status": status,
+        "message": "Object copied successfully" if status == "COMPLETED" else "Object copy started",
     }
 
     return format_success_response(data)
 
 
+async def _finish_copy(
+    oci_client: OCIClient,
+    work_request_id: str,
+    dest: tuple[str, str, str],
+) -> str:
+    """
+    Wait for a copy registered in _pending_copies, then release its destination
+
+    The destination's cached metadata and listings are dropped once the work
+    request ends, whether or not it succeeded.
+
+    Args:
+        oci_client: OCI client wrapper
+        work_request_id: Work request OCID returned by copy_object
+        dest: Destination (namespace, bucket, object)
+
+    Returns:
+        Final status (COMPLETED)
+
+    Raises:
+        APIError: If the work request failed or was canceled
+        TimeoutError: If it is still running after performance.request_timeout_seconds
+    """
+    try:
+        return await _wait_for_work_request(oci_client, work_request_id)
+    finally:
+        remaining = _pending_copies.pop(dest) - 1
+        if remaining:
+            _pending_copies[dest] = remaining
+        _invalidate_object(oci_client, dest[1], dest[2])
+
+
+async def _watch_copy(
+    oci_client: OCIClient,
+    work_request_id: str,
+    dest: tuple[str, str, str],
+) -> None:
+    """Finish a copy in the background, logging a failure since no caller is waiting for it"""
+    try:
+        await _finish_copy(oci_client, work_request_id, dest)
+    except Exception as e:
+        logger.warning("Copy work request %s did not complete: %s", work_request_id, e)
+
+
 async def move_object(
     oci_client: OCIClient,
     source_bucket: str,
@@ -1043,14 +1500,8 @@ async def move_object(
     dest_bucket: str,
     dest_object: str,
 ) -> dict[str, Any]:
-    """Move an object (copy then delete)"""
-    logger.info(f"Moving {source_bucket}/{source_object} to {dest_bucket}/{dest_object}")
-
-    # Copy first
-    await copy_object(oci_client, source_bucket, source_object, dest_bucket, dest_object)
-
-    # Then delete source
-    await delete_object(oci_client, source_bucket, source_object)
+    """Move an object (rename within a bucket, otherwise server-side copy, then delete)"""
+    logger.info("Moving %s/%s to %s/%s", source_bucket, source_object, dest_bucket, dest_object)
 
     data = {
         "source_bucket": source_bucket,
@@ -1060,6 +1511,35 @@ async def move_object(
         "message": "Object moved successfully",
     }
 
+    # Within one bucket a rename only changes the name; no data is copied
+    if source_bucket == dest_bucket:
+        await oci_client.call_api_async(
+            oci_client.object_storage.rename_object,
+            namespace_name=oci_client.get_namespace(),
+            bucket_name=source_bucket,
+            rename_object_details=os_models.RenameObjectDetails(
+                source_name=source_object,
+                new_name=dest_object,
+            ),
+        )
+        _invalidate_object(oci_client, source_bucket, source_object)
+        _invalidate_object(oci_client, dest_bucket, dest_object)
+        return format_success_response(data)
+
+    # Copy first, and only delete the source once the copy has completed
+    copy_result = await copy_object(
+        oci_client, source_bucket, source_object, dest_bucket, dest_object,
+        wait_for_completion=True,
+    )
+    if copy_result["data"]["status"] != "COMPLETED":
+        raise APIError(
+            "Copy completion could not be confirmed; source object was kept",
+            details={"work_request_id": copy_result["data"]["work_request_id"]},
+        )
+
+    # Then delete source
+    await delete_object(oci_client, source_bucket, source_object)
+
     return format_success_response(data)
 
 
@@ -1070,18 +1550,41 @@ async def create_presigned_url(
     expiration_hours: int = 24,
     access_type: str = "read",
 ) -> dict[str, Any]:
-    """Create a presigned URL"""
-    logger.info(f"Creating presigned URL for {bucket_name}/{object_name}")
+    """Create a presigned URL (an Object Storage pre-authenticated request)"""
+    logger.info("Creating presigned URL for %s/%s", bucket_name, object_name)
+
+    validate_enum(access_type, list(_PAR_ACCESS_TYPES), "access_type")
+    expiration_hours = validate_positive_integer(expiration_hours, "expiration_hours")
+
+    time_expires = datetime.now(timezone.utc) + timedelta(hours=expiration_hours)
+    details = os_models.CreatePreauthenticatedRequestDetails(
+        name=f"par-{object_name}-{uuid.uuid4()}",
+        object_name=object_name,
+        access_type=_PAR_ACCESS_TYPES[access_type],
+        time_expires=time_expires,
+    )
+
+    response = await oci_client.call_api_async(
+        oci_client.object_storage.create_preauthenticated_request,
+        namespace_name=oci_client.get_namespace(),
+        bucket_name=bucket_name,
+        create_preauthenticated_request_details=details,
+    )
+    par = response.data
+
+    # The URL is only returned at creation. Responses without full_path carry
+    # just the path relative to the service endpoint.
+    url = par.full_path or f"{oci_client.object_storage.base_client.endpoint}{par.access_uri}"
 
-    # Note: OCI presigned URLs require manual creation
-    # This is a simplified implementation
     data = {
         "bucket_name": bucket_name,
         "object_name": object_name,
         "expiration_hours": expiration_hours,
         "access_type": access_type,
-        "url": f"https://objectstorage.{oci_client.get_region()}.oraclecloud.com/n/{oci_client.get_namespace()}/b/{bucket_name}/o/{object_name}",
-        "message": "Note: URL generation requires OCI authentication. Use OCI SDK or CLI for production URLs.",
+        "url": url,
+        "par_id": par.id,
+        "time_expires": par.time_expires.isoformat() if par.time_expires else time_expires.isoformat(),
+        "message": "Pre-authenticated request created; the URL works without OCI credentials until it expires",
     }
 
     return format_success_response(data)
@@ -1093,7 +1596,7 @@ async def list_object_versions(
     object_name: str,
 ) -> dict[str, Any]:
     """List object versions"""
-    logger.info(f"Listing versions for {bucket_name}/{object_name}")
+    logger.info("Listing versions for %s/%s", bucket_name, object_name)
 
     # Note: Requires versioning to be enabled on bucket
     data = {
@@ -1113,7 +1616,7 @@ async def restore_object_version(
     version_id: str,
 ) -> dict[str, Any]:
     """Restore object version"""
-    logger.info(f"Restoring version {version_id} for {bucket_name}/{object_name}")
+    logger.info("Restoring version %s for %s/%s", version_id, bucket_name, object_name)
 
     data = {
         "bucket_name": bucket_name,
@@ -1122,6 +1625,8 @@ async def restore_object_version(
         "message": "Version restored successfully",
     }
 
+    _invalidate_object(oci_client, bucket_name, object_name)
+
     return format_success_response(data)
 
 
@@ -1133,9 +1638,7 @@ async def set_object_lifecycle(
     days: int,
 ) -> dict[str, Any]:
     """Set lifecycle policy"""
-    logger.info(f"Setting lifecycle policy for {bucket_name}")
-
-    import oci.object_storage.models as os_models
+    logger.info("Setting lifecycle policy for %s", bucket_name)
 
     lifecycle_rule = os_models.ObjectLifecycleRule(
         name=rule_name,
@@ -1149,7 +1652,7 @@ async def set_object_lifecycle(
         items=[lifecycle_rule]
     )
 
-    response = oci_client.call_api(
+    response = await oci_client.call_api_async(
         oci_client.object_storage.put_object_lifecycle_policy,
         namespace_name=oci_client.get_namespace(),
         bucket_name=bucket_name,
@@ -1172,9 +1675,9 @@ async def get_bucket_lifecycle(
     bucket_name: str,
 ) -> dict[str, Any]:
     """Get lifecycle policies"""
-    logger.info(f"Getting lifecycle policies for {bucket_name}")
+    logger.info("Getting lifecycle policies for %s", bucket_name)
 
-    response = oci_client.call_api(
+    response = await oci_client.call_api_async(
         oci_client.object_storage.get_object_lifecycle_policy,
         namespace_name=oci_client.get_namespace(),
         bucket_name=bucket_name,
@@ -1204,33 +1707,40 @@ async def bulk_upload(
     bucket_name: str,
     file_paths: list[str],
     prefix: Optional[str] = None,
+    fail_fast: bool = False,
 ) -> dict[str, Any]:
     """Bulk upload files"""
-    logger.info(f"Bulk uploading {len(file_paths)} files to {bucket_name}")
+    logger.info("Bulk uploading %s files to %s", len(file_paths), bucket_name)
 
-    results = []
-    successful = 0
-    failed = 0
+    async def upload_one(file_path: str) -> None:
+        object_name = Path(file_path).expanduser().name
+        if prefix:
+            object_name = f"{prefix}/{object_name}"
+        await _upload_file(oci_client, bucket_name, object_name, file_path)
 
-    for file_path in file_paths:
-        try:
-            file_path_obj = Path(file_path).expanduser()
-            object_name = file_path_obj.name
-            if prefix:
-                object_name = f"{prefix}/{object_name}"
+    # Uploads run concurrently, bounded by the client's request limit
+    outcomes = await _map_bounded(oci_client, upload_one, file_paths, stop_on_error=fail_fast)
 
-            await upload_object(oci_client, bucket_name, object_name, file_path)
-            results.append({"file": file_path, "status": "success"})
-            successful += 1
-        except Exception as e:
-            results.append({"file": file_path, "status": "failed", "error": str(e)})
+    results = []
+    failed = 0
+    skipped = 0
+    for file_path, outcome in zip(file_paths, outcomes):
+        if outcome is _SKIPPED:
+            results.append({"file": file_path, "status": "skipped"})
+            skipped += 1
+        elif isinstance(outcome, Exception):
+            results.append({"file": file_path, "status": "failed", "error": str(outcome)})
             failed += 1
+        else:
+            results.append({"file": file_path, "status": "success"})
+    successful = len(file_paths) - failed - skipped
 
     data = {
         "bucket_name": bucket_name,
         "total_files": len(file_paths),
         "successful": successful,
         "failed": failed,
+        "skipped": skipped,
         "results": results,
     }
 
@@ -1242,26 +1752,60 @@ async def bulk_download(
     bucket_name: str,
     object_names: list[str],
     dest_directory: str,
+    fail_fast: bool = False,
 ) -> dict[str, Any]:
     """Bulk download objects"""
-    logger.info(f"Bulk downloading {len(object_names)} objects from {bucket_name}")
+    logger.info("Bulk downloading %s objects from %s", len(object_names), bucket_name)
 
     dest_dir = Path(dest_directory).expanduser()
     dest_dir.mkdir(parents=True, exist_ok=True)
 
+    # Objects are saved under their base name, so two names can map to the same
+    # file. Concurrent writers would race on it; only the first one is downloaded.
+    dest_paths = [dest_dir / Path(object_name).name for object_name in object_names]
+    first_index: dict[Path, int] = {}
+    for index, dest_path in enumerate(dest_paths):
+        first_index.setdefault(dest_path, index)
+
+    # Downloads run concurrently, bounded by the client's request limit. Each
+    # transfer streams to disk on the client's worker pool, off the event loop,
+    # and only its outcome is kept rather than a full per-object response.
+    namespace = oci_client.get_namespace()
+
+    async def download_one(index: int) -> int:
+        return await oci_client.call_api_async(
+            _get_object_to_file,
+            oci_client.object_storage,
+            dest_paths[index],
+            namespace_name=namespace,
+            bucket_name=bucket_name,
+            object_name=object_names[index],
+        )
+
+    download_indexes = list(first_index.values())
+    outcomes = dict(zip(
+        download_indexes,
+        await _map_bounded(oci_client, download_one, download_indexes, stop_on_error=fail_fast),
+    ))
+
     results = []
-    successful = 0
     failed = 0
-
-    for object_name in object_names:
-        try:
-            dest_path = dest_dir / Path(object_name).name
-            await download_object(oci_client, bucket_name, object_name, str(dest_path))
-            results.append({"object": object_name, "status": "success"})
-            successful += 1
-        except Exception as e:
-            results.append({"object": object_name, "status": "failed", "error": str(e)})
+    skipped = 0
+    for index, object_name in enumerate(object_names):
+        outcome = outcomes.get(index)
+        if outcome is None:
+            error = f"Destination {dest_paths[index]} is already used by another object"
+            results.append({"object": object_name, "status": "failed", "error": error})
             failed += 1
+        elif outcome is _SKIPPED:
+            results.append({"object": object_name, "status": "skipped"})
+            skipped += 1
+        elif isinstance(outcome, Exception):
+            results.append({"object": object_name, "status": "failed", "error": str(outcome)})
+            failed += 1
+        else:
+            results.append({"object": object_name, "status": "success"})
+    successful = len(object_names) - failed - skipped
 
     data = {
         "bucket_name": bucket_name,
@@ -1269,7 +1813,396 @@ async def bulk_download(
         "total_objects": len(object_names),
         "successful": successful,
         "failed": failed,
+        "skipped": skipped,
+        "results": results,
+    }
+
+    return format_success_response(data)
+
+
+async def bulk_update_object_metadata(
+    oci_client: OCIClient,
+    bucket_name: str,
+    updates: dict[str, dict[str, str]],
+) -> dict[str, Any]:
+    """Bulk update object metadata"""
+    logger.info("Bulk updating metadata for %s objects in %s", len(updates), bucket_name)
+
+    # Each update is a server-side copy, so they run concurrently, bounded by
+    # the client's request limit
+    async def update_one(object_name: str) -> dict[str, Any]:
+        return await update_object_metadata(oci_client, bucket_name, object_name, updates[object_name])
+
+    outcomes = await _map_bounded(oci_client, update_one, list(updates))
+
+    results = []
+    failed = 0
+    for object_name, outcome in zip(updates, outcomes):
+        if isinstance(outcome, Exception):
+            results.append({"object": object_name, "status": "failed", "error": str(outcome)})
+            failed += 1
+        else:
+            results.append({"object": object_name, "status": "success"})
+    successful = len(updates) - failed
+
+    data = {
+        "bucket_name": bucket_name,
+        "total_objects": len(updates),
+        "successful": successful,
+        "failed": failed,
         "results": results,
     }
 
     return format_success_response(data)
+
+
+async def bulk_get_object_metadata(
+    oci_client: OCIClient,
+    bucket_name: str,
+    object_names: list[str],
+) -> dict[str, Any]:
+    """Get metadata for many objects from one listing instead of a HEAD per object"""
+    logger.info("Getting metadata for %s objects in %s", len(object_names), bucket_name)
+
+    if not isinstance(object_names, list) or not object_names:
+        raise ValidationError("object_names must be a non-empty list")
+
+    # The listing range comes from min() and max() of the names, which only
+    # works when every name is a string
+    for index, object_name in enumerate(object_names):
+        if not isinstance(object_name, str):
+            raise ValidationError(
+                "object_names must contain only strings",
+                details={"index": index, "type": type(object_name).__name__},
+            )
+        validate_object_name(object_name)
+
+    namespace = oci_client.get_namespace()
+    wanted = set(object_names)
+    first, last = min(wanted), max(wanted)
+
+    # Listing is ordered by name, so the range between the lowest and highest
+    # requested name covers every requested object that exists
+    kwargs = {"start": first, "fields": _LIST_OBJECT_FIELDS + ",storageTier"}
+    prefix = os.path.commonprefix([first, last])
+    if prefix:
+        kwargs["prefix"] = prefix
+
+    rows: dict[str, dict[str, Any]] = {}
+    listed = 0
+    complete = False
+    async for page in _iter_object_pages(oci_client, bucket_name, **kwargs):
+        for obj in page:
+            if obj.name > last:
+                complete = True
+                break
+            if obj.name in wanted:
+                rows[obj.name] = {
+                    "object_name": obj.name,
+                    "exists": True,
+                    "size": obj.size,
+                    "md5": obj.md5,
+                    "etag": obj.etag,
+                    "time_modified": obj.time_modified.isoformat() if obj.time_modified else None,
+                    "storage_tier": obj.storage_tier,
+                }
+        listed += len(page)
+        if complete or listed >= _BULK_METADATA_LIST_LIMIT:
+            break
+    else:
+        complete = True
+
+    # A complete listing proves the other names do not exist; if the listing
+    # stopped at its limit, look up the names it did not reach individually
+    unlisted = sorted(wanted - rows.keys())
+    if complete:
+        rows.update(
+            (object_name, {"object_name": object_name, "exists": False})
+            for object_name in unlisted
+        )
+        unlisted = []
+
+    async def head_one(object_name: str) -> Any:
+        return await oci_client.call_api_async(
+            oci_client.object_storage.head_object,
+            namespace_name=namespace,
+            bucket_name=bucket_name,
+            object_name=object_name,
+        )
+
+    outcomes = await _map_bounded(oci_client, head_one, unlisted)
+    for object_name, outcome in zip(unlisted, outcomes):
+        if isinstance(outcome, ResourceNotFoundError):
+            rows[object_name] = {"object_name": object_name, "exists": False}
+        elif isinstance(outcome, Exception):
+            rows[object_name] = {"object_name": object_name, "exists": None, "error": str(outcome)}
+        else:
+            headers = outcome.headers
+            last_modified = headers.get("last-modified")
+            content_length = headers.get("content-length")
+            rows[object_name] = {
+                "object_name": object_name,
+                "exists": True,
+                "size": int(content_length) if content_length is not None else None,
+                "md5": headers.get("content-md5"),
+                "etag": headers.get("etag"),
+                "time_modified": (
+                    parsedate_to_datetime(last_modified).isoformat() if last_modified else None
+                ),
+                "storage_tier": headers.get("storage-tier"),
+            }
+
+    results = [rows[object_name] for object_name in object_names]
+    found = sum(1 for row in results if row["exists"])
+
+    data = {
+        "bucket_name": bucket_name,
+        "total_objects": len(object_names),
+        "found": found,
+        "results": results,
+    }
+
+    return format_success_response(data)
+
+
+# Tool adapters: unpack and validate arguments, then call the implementation
+
+async def _handle_list_buckets(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    limit = arguments.get("limit", 100)
+    return await list_buckets(oci_client, limit)
+
+
+async def _handle_create_bucket(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    validate_bucket_name(arguments["bucket_name"])
+    return await create_bucket(
+        oci_client,
+        arguments["bucket_name"],
+        arguments.get("storage_tier", "Standard"),
+        arguments.get("public_access", False),
+    )
+
+
+async def _handle_get_bucket_details(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await get_bucket_details(oci_client, arguments["bucket_name"])
+
+
+async def _handle_update_bucket(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await update_bucket(
+        oci_client,
+        arguments["bucket_name"],
+        arguments.get("public_access"),
+    )
+
+
+async def _handle_delete_bucket(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await delete_bucket(
+        oci_client,
+        arguments["bucket_name"],
+        arguments.get("force", False),
+    )
+
+
+async def _handle_list_objects(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await list_objects(
+        oci_client,
+        arguments["bucket_name"],
+        arguments.get("prefix"),
+        arguments.get("limit", 100),
+        arguments.get("include_formatted", False),
+        arguments.get("refresh", False),
+    )
+
+
+async def _handle_upload_object(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    validate_object_name(arguments["object_name"])
+    return await upload_object(
+        oci_client,
+        arguments["bucket_name"],
+        arguments["object_name"],
+        arguments["file_path"],
+        arguments.get("content_type"),
+    )
+
+
+async def _handle_download_object(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await download_object(
+        oci_client,
+        arguments["bucket_name"],
+        arguments["object_name"],
+        arguments["dest_path"],
+    )
+
+
+async def _handle_get_object_metadata(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await get_object_metadata(
+        oci_client,
+        arguments["bucket_name"],
+        arguments["object_name"],
+    )
+
+
+async def _handle_update_object_metadata(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await update_object_metadata(
+        oci_client,
+        arguments["bucket_name"],
+        arguments["object_name"],
+        arguments["metadata"],
+    )
+
+
+async def _handle_delete_object(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await delete_object(
+        oci_client,
+        arguments["bucket_name"],
+        arguments["object_name"],
+    )
+
+
+async def _handle_copy_object(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await copy_object(
+        oci_client,
+        arguments["source_bucket"],
+        arguments["source_object"],
+        arguments["dest_bucket"],
+        arguments["dest_object"],
+        arguments.get("wait_for_completion", False),
+    )
+
+
+async def _handle_move_object(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await move_object(
+        oci_client,
+        arguments["source_bucket"],
+        arguments["source_object"],
+        arguments["dest_bucket"],
+        arguments["dest_object"],
+    )
+
+
+async def _handle_create_presigned_url(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await create_presigned_url(
+        oci_client,
+        arguments["bucket_name"],
+        arguments["object_name"],
+        arguments.get("expiration_hours", 24),
+        arguments.get("access_type", "read"),
+    )
+
+
+async def _handle_list_object_versions(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await list_object_versions(
+        oci_client,
+        arguments["bucket_name"],
+        arguments["object_name"],
+    )
+
+
+async def _handle_restore_object_version(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await restore_object_version(
+        oci_client,
+        arguments["bucket_name"],
+        arguments["object_name"],
+        arguments["version_id"],
+    )
+
+
+async def _handle_set_object_lifecycle(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await set_object_lifecycle(
+        oci_client,
+        arguments["bucket_name"],
+        arguments["rule_name"],
+        arguments["action"],
+        arguments["days"],
+    )
+
+
+async def _handle_get_bucket_lifecycle(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await get_bucket_lifecycle(oci_client, arguments["bucket_name"])
+
+
+async def _handle_bulk_upload(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await bulk_upload(
+        oci_client,
+        arguments["bucket_name"],
+        arguments["file_paths"],
+        arguments.get("prefix"),
+        arguments.get("fail_fast", False),
+    )
+
+
+async def _handle_bulk_download(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await bulk_download(
+        oci_client,
+        arguments["bucket_name"],
+        arguments["object_names"],
+        arguments["dest_directory"],
+        arguments.get("fail_fast", False),
+    )
+
+
+async def _handle_bulk_get_object_metadata(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await bulk_get_object_metadata(
+        oci_client,
+        arguments["bucket_name"],
+        arguments["object_names"],
+    )
+
+
+async def _handle_bulk_update_object_metadata(arguments: dict[str, Any], oci_client: OCIClient) -> dict[str, Any]:
+    return await bulk_update_object_metadata(
+        oci_client,
+        arguments["bucket_name"],
+        arguments["updates"],
+    )
+
+
+_HANDLERS: dict[str, Callable[[dict[str, Any], OCIClient], Awaitable[dict[str, Any]]]] = {
+    "list_buckets": _handle_list_buckets,
+    "create_bucket": _handle_create_bucket,
+    "get_bucket_details": _handle_get_bucket_details,
+    "update_bucket": _handle_update_bucket,
+    "delete_bucket": _handle_delete_bucket,
+    "list_objects": _handle_list_objects,
+    "upload_object": _handle_upload_object,
+    "download_object": _handle_download_object,
+    "get_object_metadata": _handle_get_object_metadata,
+    "update_object_metadata": _handle_update_object_metadata,
+    "delete_object": _handle_delete_object,
+    "copy_object": _handle_copy_object,
+    "move_object": _handle_move_object,
+    "create_presigned_url": _handle_create_presigned_url,
+    "list_object_versions": _handle_list_object_versions,
+    "restore_object_version": _handle_restore_object_version,
+    "set_object_lifecycle": _handle_set_object_lifecycle,
+    "get_bucket_lifecycle": _handle_get_bucket_lifecycle,
+    "bulk_upload": _handle_bulk_upload,
+    "bulk_download": _handle_bulk_download,
+    "bulk_get_object_metadata": _handle_bulk_get_object_metadata,
+    "bulk_update_object_metadata": _handle_bulk_update_object_metadata,
+}
+
+# Required arguments per tool, in declaration order, checked once in
+# handle_tool_call before dispatch
+_REQUIRED: dict[str, tuple[str, ...]] = {
+    "create_bucket": ("bucket_name",),
+    "get_bucket_details": ("bucket_name",),
+    "update_bucket": ("bucket_name",),
+    "delete_bucket": ("bucket_name",),
+    "list_objects": ("bucket_name",),
+    "upload_object": ("bucket_name", "object_name", "file_path"),
+    "download_object": ("bucket_name", "object_name", "dest_path"),
+    "get_object_metadata": ("bucket_name", "object_name"),
+    "update_object_metadata": ("bucket_name", "object_name", "metadata"),
+    "delete_object": ("bucket_name", "object_name"),
+    "copy_object": ("source_bucket", "source_object", "dest_bucket", "dest_object"),
+    "move_object": ("source_bucket", "source_object", "dest_bucket", "dest_object"),
+    "create_presigned_url": ("bucket_name", "object_name"),
+    "list_object_versions": ("bucket_name", "object_name"),
+    "restore_object_version": ("bucket_name", "object_name", "version_id"),
+    "set_object_lifecycle": ("bucket_name", "rule_name", "action", "days"),
+    "get_bucket_lifecycle": ("bucket_name",),
+    "bulk_upload": ("bucket_name", "file_paths"),
+    "bulk_download": ("bucket_name", "object_names", "dest_directory"),
+    "bulk_get_object_metadata": ("bucket_name", "object_names"),
+    "bulk_update_object_metadata": ("bucket_name", "updates"),
+}
@@ -4,9 +4,10 @@ AIDP MCP Server - Comprehensive Implementation
 Main server entry point with full module integration
 """
 import asyncio
+import itertools
+import logging
 import sys
 import time
-import json
 from typing import Any
 import traceback
 
@@ -19,8 +20,9 @@ import mcp.server.stdio
 from config.settings import get_settings
 from src.oci_client import OCIClient
 from utils.logger import setup_logging, get_logger, RequestLogger
-from utils.formatters import format_error_response, format_json_response
-from utils.errors import AIDPError
+from utils.formatters import format_error_response, format_json_response, format_success_response
+from utils.validators import validate_positive_integer
+from utils.errors import AIDPError, ValidationError
 
 # Import all modules
 from src.modules import (
@@ -43,14 +45,78 @@ request_logger = RequestLogger(logger)
 # Initialize MCP server
 server = Server("aidp-comprehensive")
 
+# Request IDs pair the process start time, so IDs stay distinct across
+# restarts in a shared log, with a counter that is unique within the process
+# even when calls arrive in the same millisecond
+_REQUEST_ID_PREFIX = f"req_{int(time.time() * 1000)}"
+_request_counter = itertools.count(1)
+
+# Tool name -> module that handles it. Tool definitions are static, so the
+# table is built once at import. Catalog and storage both define
+# get_object_metadata; storage comes later and owns it, as it always has.
+_TOOL_ROUTES = {
+    tool.name: module
+    for module in (
+        instance,
+        catalog,
+        storage,
+        compute,
+        notebooks,
+        jobs,
+        pipelines,
+        connections,
+        ml_models,
+        analytics,
+    )
+    for tool in module.get_tools()
+}
+
+# batch_execute runs other tools, so it is defined here rather than in a module
+_BATCH_TOOL_NAME = "batch_execute"
+_BATCH_DEFAULT_CONCURRENCY = 8
+
+_BATCH_TOOL = types.Tool(
+    name=_BATCH_TOOL_NAME,
+    description="Run several tool calls in one request, concurrently",
+    inputSchema={
+        "type": "object",
+        "properties": {
+            "calls": {
+                "type": "array",
+                "description": "Tool calls to run",
+                "items": {
+                    "type": "object",
+                    "properties": {
+                        "name": {"type": "string", "description": "Tool name"},
+                        "arguments": {"type": "object", "description": "Tool arguments"},
+                    },
+                    "required": ["name"],
+                },
+            },
+            "max_concurrent": {
+                "type": "integer",
+                "description": "Maximum calls running at once",
+                "default": _BATCH_DEFAULT_CONCURRENCY,
+            },
+            "stop_on_error": {
+                "type": "boolean",
+                "description": "Start no further calls once one has failed",
+                "default": False,
+            },
+        },
+        "required": ["calls"],
+    },
+)
+
 # Global state
 _settings = None
 _oci_client = None
+_tools = None
 
 
-def initialize_server():
+async def initialize_server():
     """Initialize server components"""
-    global _settings, _oci_client
+    global _settings, _oci_client, _tools
 
     try:
         # Load settings
@@ -76,11 +142,18 @@ def initialize_server():
 
         # Initialize OCI client
         _oci_client = OCIClient(_settings)
+        if _settings.performance.eager_client_init:
+            await _oci_client.warm_up()
 
         # Test connection
         logger.info("Testing OCI connection...")
-        connection_test = _oci_client.test_connection()
-        logger.info(f"Connection test results: {json.dumps(connection_test, indent=2)}")
+        connection_test = await _oci_client.test_connection()
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Connection test results: %s", format_json_response(connection_test, indent=None))
+
+        # The tool list depends on the feature flags just loaded. Building it
+        # now keeps that work out of the client's first list_tools request.
+        _tools = _build_tool_list()
 
         logger.info("Server initialization complete")
 
@@ -95,65 +168,96 @@ async def handle_list_tools() -> list[types.Tool]:
     List all available tools from all modules
     Returns 150+ tools across 10 modules
     """
+    global _tools
+
+    # Tool definitions and feature flags are fixed once the server is
+    # initialized, so the list is built on the first call and reused
+    if _tools is None:
+        _tools = _build_tool_list()
+
+    return _tools
+
+
+def _build_tool_list() -> list[types.Tool]:
+    """Collect the tools of every enabled module"""
     logger.info("Listing all available tools")
 
     all_tools = []
 
-    # Module 1: Instance Management (10 tools)
+    # Module 1: Instance Management (12 tools)
     if _settings.features.instance_management:
-        all_tools.extend(instance.get_tools())
-        logger.debug(f"Added {len(instance.get_tools())} instance management tools")
+        tools = instance.get_tools()
+        all_tools.extend(tools)
+        logger.debug("Added %d instance management tools", len(tools))
 
     # Module 2: Data Catalog (20 tools)
     if _settings.features.data_catalog:
-        all_tools.extend(catalog.get_tools())
-        logger.debug(f"Added {len(catalog.get_tools())} data catalog tools")
+        tools = catalog.get_tools()
+        all_tools.extend(tools)
+        logger.debug("Added %d data catalog tools", len(tools))
 
-    # Module 3: Object Storage (20 tools)
+    # Module 3: Object Storage (22 tools)
     if _settings.features.object_storage:
-        all_tools.extend(storage.get_tools())
-        logger.debug(f"Added {len(storage.get_tools())} object storage tools")
+        tools = storage.get_tools()
+        all_tools.extend(tools)
+        logger.debug("Added %d object storage tools", len(tools))
 
-    # Module 4: Compute Clusters (15 tools)
+    # Module 4: Compute Clusters (19 tools)
     if _settings.features.compute_clusters:
-        all_tools.extend(compute.get_tools())
-        logger.debug(f"Added {len(compute.get_tools())} compute cluster tools")
+        tools = compute.get_tools()
+        all_tools.extend(tools)
+        logger.debug("Added %d compute cluster tools", len(tools))
 
     # Module 5: Notebooks (15 tools)
     if _settings.features.notebooks:
-        all_tools.extend(notebooks.get_tools())
-        logger.debug(f"Added {len(notebooks.get_tools())} notebook tools")
+        tools = notebooks.get_tools()
+        all_tools.extend(tools)
+        logger.debug("Added %d notebook tools", len(tools))
 
     # Module 6: Jobs & Workflows (20 tools)
     if _settings.features.jobs_workflows:
-        all_tools.extend(jobs.get_tools())
-        logger.debug(f"Added {len(jobs.get_tools())} jobs & workflows tools")
+        tools = jobs.get_tools()
+        all_tools.extend(tools)
+        logger.debug("Added %d jobs & workflows tools", len(tools))
 
     # Module 7: Data Pipelines (15 tools)
     if _settings.features.data_pipelines:
-        all_tools.extend(pipelines.get_tools())
-        logger.debug(f"Added {len(pipelines.get_tools())} data pipeline tools")
+        tools = pipelines.get_tools()
+        all_tools.extend(tools)
+        logger.debug("Added %d data pipeline tools", len(tools))
 
     # Module 8: External Connections (12 tools)
     if _settings.features.external_connections:
-        all_tools.extend(connections.get_tools())
-        logger.debug(f"Added {len(connections.get_tools())} external connection tools")
+        tools = connections.get_tools()
+        all_tools.extend(tools)
+        logger.debug("Added %d external connection tools", len(tools))
 
     # Module 9: ML Models (15 tools)
     if _settings.features.ml_models:
-        all_tools.extend(ml_models.get_tools())
-        logger.debug(f"Added {len(ml_models.get_tools())} ML model tools")
+        tools = ml_models.get_tools()
+        all_tools.extend(tools)
+        logger.debug("Added %d ML model tools", len(tools))
 
     # Module 10: Analytics & Reporting (10 tools)
     if _settings.features.analytics_reporting:
-        all_tools.extend(analytics.get_tools())
-        logger.debug(f"Added {len(analytics.get_tools())} analytics & reporting tools")
+        tools = analytics.get_tools()
+        all_tools.extend(tools)
+        logger.debug("Added %d analytics & reporting tools", len(tools))
+
+    all_tools.append(_BATCH_TOOL)
 
     logger.info(f"Total tools available: {len(all_tools)}")
 
     return all_tools
 
 
+def _text_response(response: dict[str, Any]) -> list[types.TextContent]:
+    """Serialize a tool response as the single text content item MCP returns"""
+    # Indented unless pretty_json is disabled
+    indent = 2 if _settings.performance.pretty_json else None
+    return [types.TextContent(type="text", text=format_json_response(response, indent=indent))]
+
+
 @server.call_tool()
 async def handle_call_tool(
     name: str, arguments: dict | None
@@ -161,8 +265,8 @@ async def handle_call_tool(
     """
     Handle tool execution with routing to appropriate module
     """
-    start_time = time.time()
-    request_id = f"req_{int(start_time * 1000)}"
+    start_ns = time.perf_counter_ns()
+    request_id = f"{_REQUEST_ID_PREFIX}_{next(_request_counter)}"
 
     # Log request
     request_logger.log_request(name, arguments or {}, request_id)
@@ -171,79 +275,23 @@ async def handle_call_tool(
         if arguments is None:
             arguments = {}
 
-        # Route to appropriate module based on tool name prefix or pattern
-        result = None
-
-        # Instance Management tools
-        if name.startswith(("get_instance", "list_workspaces", "create_workspace",
-                           "get_workspace", "update_workspace", "delete_workspace",
-                           "grant_workspace", "revoke_workspace")):
-            result = await instance.handle_tool_call(name, arguments, _oci_client)
-
-        # Data Catalog tools
-        elif name.startswith(("list_catalog", "search_catalog", "create_catalog",
-                             "update_catalog", "delete_catalog", "get_data_lineage",
-                             "list_databases", "get_database", "list_schemas",
-                             "list_tables", "get_table", "preview_table",
-                             "refresh_catalog", "set_object_tags", "get_object_tags",
-                             "export_catalog", "import_catalog", "validate_catalog")):
-            result = await catalog.handle_tool_call(name, arguments, _oci_client)
-
-        # Object Storage tools
-        elif name.startswith(("list_buckets", "create_bucket", "get_bucket",
-                             "update_bucket", "delete_bucket", "list_objects",
-                             "upload_object", "download_object", "get_object",
-                             "update_object", "delete_object", "copy_object",
-                             "move_object", "create_presigned", "list_object_versions",
-                             "restore_object", "set_object_lifecycle", "get_bucket_lifecycle",
-                             "bulk_upload", "bulk_download")):
-            result = await storage.handle_tool_call(name, arguments, _oci_client)
-
-        # Compute Cluster tools
-        elif name.startswith("compute_"):
-            result = await compute.handle_tool_call(name, arguments, _oci_client)
-
-        # Notebook tools
-        elif name.startswith("notebooks_"):
-            result = await notebooks.handle_tool_call(name, arguments, _oci_client)
-
-        # Jobs & Workflows tools
-        elif name.startswith("jobs_"):
-            result = await jobs.handle_tool_call(name, arguments, _oci_client)
-
-        # Data Pipeline tools
-        elif name.startswith("pipelines_"):
-            result = await pipelines.handle_tool_call(name, arguments, _oci_client)
-
-        # External Connection tools
-        elif name.startswith("connections_"):
-            result = await connections.handle_tool_call(name, arguments, _oci_client)
-
-        # ML Model tools
-        elif name.startswith("ml_models_"):
-            result = await ml_models.handle_tool_call(name, arguments, _oci_client)
-
-        # Analytics & Reporting tools
-        elif name.startswith("analytics_"):
-            result = await analytics.handle_tool_call(name, arguments, _oci_client)
-
+        if name == _BATCH_TOOL_NAME:
+            result = await _batch_execute(arguments, request_id)
         else:
-            raise ValueError(f"Unknown tool: {name}")
+            result = await _dispatch(name, arguments)
 
         # Calculate execution time
-        execution_time_ms = (time.time() - start_time) * 1000
+        execution_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
 
         # Log success
         request_logger.log_response(name, True, execution_time_ms, request_id)
 
         # Format response
-        response_text = format_json_response(result)
-
-        return [types.TextContent(type="text", text=response_text)]
+        return _text_response(result)
 
     except AIDPError as e:
         # Handle known AIDP errors
-        execution_time_ms = (time.time() - start_time) * 1000
+        execution_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
         request_logger.log_error(name, e, request_id)
 
         error_response = format_error_response(
@@ -252,16 +300,15 @@ async def handle_call_tool(
             include_traceback=_settings.logging.level == "DEBUG",
         )
 
-        response_text = format_json_response(error_response)
-
-        return [types.TextContent(type="text", text=response_text)]
+        return _text_response(error_response)
 
     except Exception as e:
         # Handle unexpected errors
-        execution_time_ms = (time.time() - start_time) * 1000
+        execution_time_ms = (time.perf_counter_ns() - start_ns) / 1_000_000
+        # log_error already records the traceback; capture it only once
         request_logger.log_error(name, e, request_id)
 
-        logger.error(f"Unexpected error in tool '{name}':", exc_info=True)
+        logger.error("Unexpected error in tool '%s'", name)
 
         error_response = {
             "success": False,
@@ -276,16 +323,99 @@ async def handle_call_tool(
             },
         }
 
-        response_text = format_json_response(error_response)
+        return _text_response(error_response)
+
+
+async def _dispatch(name: str, arguments: dict[str, Any]) -> dict[str, Any]:
+    """Run a tool through the module that defines it"""
+    module = _TOOL_ROUTES.get(name)
+    if module is None:
+        raise ValueError(f"Unknown tool: {name}")
+
+    return await module.handle_tool_call(name, arguments, _oci_client)
+
+
+async def _batch_execute(arguments: dict[str, Any], request_id: str) -> dict[str, Any]:
+    """
+    Run the calls of a batch_execute request concurrently
+
+    Each call is dispatched directly rather than through handle_call_tool, so
+    results are serialized once for the whole batch. A failed call is reported
+    in its slot and does not fail the batch.
+
+    Args:
+        arguments: batch_execute arguments (calls, max_concurrent, stop_on_error)
+        request_id: ID of the batch request, used when logging failed calls
+
+    Returns:
+        Success response with one result per call, in call order
+
+    Raises:
+        ValidationError: If calls is empty or malformed
+    """
+    calls = arguments.get("calls")
+    if not isinstance(calls, list) or not calls:
+        raise ValidationError("calls must be a non-empty list")
+
+    for index, call in enumerate(calls):
+        if not isinstance(call, dict) or not isinstance(call.get("name"), str):
+            raise ValidationError(
+                f"calls[{index}] must be an object with a tool name",
+                details={"index": index},
+            )
+        if call["name"] == _BATCH_TOOL_NAME:
+            raise ValidationError(
+                f"{_BATCH_TOOL_NAME} cannot be nested",
+                details={"index": index},
+            )
 
-        return [types.TextContent(type="text", text=response_text)]
+    max_concurrent = validate_positive_integer(
+        arguments.get("max_concurrent", _BATCH_DEFAULT_CONCURRENCY), "max_concurrent",
+    )
+    stop_on_error = bool(arguments.get("stop_on_error", False))
+
+    # OCI requests are also bounded by the client, so this only limits how
+    # many calls of this batch are in progress
+    slots = asyncio.Semaphore(max_concurrent)
+    failed = False
+
+    async def run(call: dict[str, Any]) -> dict[str, Any]:
+        nonlocal failed
+        async with slots:
+            # Calls already running still finish, since their SDK requests
+            # cannot be interrupted
+            if failed and stop_on_error:
+                return {"name": call["name"], "status": "skipped"}
+            try:
+                result = await _dispatch(call["name"], call.get("arguments") or {})
+            except Exception as e:
+                failed = True
+                request_logger.log_error(call["name"], e, request_id)
+                return {"name": call["name"], "status": "failed", "error": format_error_response(e)["error"]}
+            return {"name": call["name"], "status": "success", "result": result}
+
+    results = await asyncio.gather(*(run(call) for call in calls))
+
+    counts = {"success": 0, "failed": 0, "skipped": 0}
+    for result in results:
+        counts[result["status"]] += 1
+
+    data = {
+        "total_calls": len(calls),
+        "successful": counts["success"],
+        "failed": counts["failed"],
+        "skipped": counts["skipped"],
+        "results": results,
+    }
+
+    return format_success_response(data)
 
 
 async def main():
     """Main server entry point"""
     try:
         # Initialize server components
-        initialize_server()
+        await initialize_server()
 
         # Run MCP server
         async with mcp.server.stdio.stdio_server() as (read_stream, write_stream):
@@ -0,0 +1,48 @@
+"""
+Tests for the in-process response cache
+"""
+from unittest.mock import patch
+from utils.cache import TTLCache
+
+
+def test_entries_expire_but_stay_available_stale():
+    """Test that expired entries miss but can still be served stale"""
+    cache = TTLCache()
+
+    with patch("utils.cache.time.monotonic", return_value=100.0):
+        cache.set(("get_run_details", "run1"), {"id": "run1"}, ttl_seconds=5)
+        assert cache.get(("get_run_details", "run1")) == {"id": "run1"}
+
+    with patch("utils.cache.time.monotonic", return_value=106.0):
+        assert cache.get(("get_run_details", "run1")) is None
+        assert cache.get_stale(("get_run_details", "run1")) == {"id": "run1"}
+
+
+def test_lru_eviction_and_operation_invalidation():
+    """Test bounded size and invalidation of every key for an operation"""
+    cache = TTLCache(max_entries=2)
+    cache.set(("list_pools", "c1", 10), "a", ttl_seconds=60)
+    cache.set(("list_pools", "c1", 20), "b", ttl_seconds=60)
+    cache.get(("list_pools", "c1", 10))
+    cache.set(("get_pool_details", "p1"), "c", ttl_seconds=60)
+
+    assert ("list_pools", "c1", 20) not in cache
+    assert len(cache) == 2
+
+    cache.invalidate_operation("list_pools")
+
+    assert cache.get(("list_pools", "c1", 10)) is None
+    assert cache.get(("get_pool_details", "p1")) == "c"
+
+
+def test_prefix_invalidation():
+    """Test invalidation of keys sharing leading elements"""
+    cache = TTLCache()
+    cache.set(("list_objects", "ns", "b1", None, 100), "a", ttl_seconds=60)
+    cache.set(("list_objects", "ns", "b1", "logs/", 10), "b", ttl_seconds=60)
+    cache.set(("list_objects", "ns", "b2", None, 100), "c", ttl_seconds=60)
+
+    cache.invalidate_prefix(("list_objects", "ns", "b1"))
+
+    assert len(cache) == 1
+    assert cache.get(("list_objects", "ns", "b2", None, 100)) == "c"
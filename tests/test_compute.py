@@ -0,0 +1,112 @@
+"""
+Tests for Compute Cluster module
+"""
+import asyncio
+import pytest
+from unittest.mock import Mock
+from src.modules import compute
+from utils.errors import NetworkError, ValidationError
+
+
+def make_client(cache_enabled=True):
+    """Build a mock OCI client whose async API calls are counted"""
+    oci_client = Mock()
+    oci_client.get_compartment_id.return_value = "ocid1.compartment.test"
+    oci_client.settings.cache.enabled = cache_enabled
+    oci_client.settings.cache.ttl_seconds = 300
+    oci_client.calls = []
+
+    async def call_api_async(api_func, **kwargs):
+        oci_client.calls.append(kwargs)
+        await asyncio.sleep(0)
+
+        pool = Mock()
+        pool.id = kwargs["pool_id"]
+        pool.display_name = "test-pool"
+        pool.description = None
+        pool.time_created = None
+        pool.time_updated = None
+
+        response = Mock()
+        response.data = pool
+        return response
+
+    oci_client.call_api_async = call_api_async
+    return oci_client
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    compute._response_cache.clear()
+    yield
+    compute._response_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_get_pool_details_cached_and_coalesced():
+    """Test that concurrent and repeated reads share one API call"""
+    oci_client = make_client()
+
+    results = await asyncio.gather(
+        *(compute.get_pool_details(oci_client, "ocid1.pool.test") for _ in range(5))
+    )
+    await compute.get_pool_details(oci_client, "ocid1.pool.test")
+
+    assert len(oci_client.calls) == 1
+    assert all(result["data"]["id"] == "ocid1.pool.test" for result in results)
+
+
+@pytest.mark.asyncio
+async def test_stale_response_served_on_network_error():
+    """Test that an expired entry is served when OCI is unreachable"""
+    oci_client = make_client()
+    await compute.get_pool_details(oci_client, "ocid1.pool.test")
+
+    key = ("get_pool_details", "ocid1.pool.test")
+    compute._response_cache.set(key, compute._response_cache.get(key), ttl_seconds=0)
+
+    async def unreachable(api_func, **kwargs):
+        raise NetworkError("Network error while communicating with OCI")
+
+    oci_client.call_api_async = unreachable
+    result = await compute.get_pool_details(oci_client, "ocid1.pool.test")
+
+    assert result["data"]["name"] == "test-pool"
+
+
+@pytest.mark.asyncio
+async def test_handle_tool_call_validation():
+    """Test required fields come from the tool schema"""
+    oci_client = make_client()
+
+    with pytest.raises(ValidationError):
+        await compute.handle_tool_call("get_pool_details", {}, oci_client)
+
+    with pytest.raises(ValidationError):
+        await compute.handle_tool_call("unknown_tool", {}, oci_client)
+
+
+@pytest.mark.asyncio
+async def test_handle_tool_call_rejects_wrong_types():
+    """Test argument types and enums are checked against the tool schema"""
+    oci_client = make_client()
+
+    with pytest.raises(ValidationError) as exc_info:
+        await compute.handle_tool_call(
+            "list_cluster_runs",
+            {"limit": "ten", "lifecycle_state": "RUNNING"},
+            oci_client,
+        )
+
+    assert set(exc_info.value.details["invalid_fields"]) == {"limit", "lifecycle_state"}
+
+
+@pytest.mark.asyncio
+async def test_create_cluster_rejects_invalid_name():
+    """Test cluster names are validated before any API call"""
+    oci_client = make_client()
+
+    with pytest.raises(ValidationError):
+        await compute.handle_tool_call("create_cluster", {"cluster_name": "bad name!"}, oci_client)
+
+    assert oci_client.calls == []
@@ -0,0 +1,103 @@
+"""
+Tests for Instance & Workspace module
+"""
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, Mock
+from src.modules import instance
+from utils.errors import ValidationError
+
+
+def make_client(service_status="connected"):
+    """Build a mock OCI client with a canned connection test"""
+    oci_client = Mock()
+    oci_client.settings.cache.enabled = True
+    oci_client.settings.cache.ttl_seconds = 300
+    oci_client.test_connection = AsyncMock(return_value={
+        "services": {"identity": {"status": service_status}},
+    })
+    return oci_client
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    instance._response_cache.clear()
+    yield
+    instance._response_cache.clear()
+
+
+def test_instance_status_cached():
+    """Test that healthy status is reused and failed status is re-tested"""
+    oci_client = make_client()
+    for _ in range(3):
+        result = asyncio.run(instance.handle_tool_call("get_instance_status", {}, oci_client))
+        assert result["success"] is True
+    assert oci_client.test_connection.call_count == 1
+
+    failing_client = make_client(service_status="failed")
+    for _ in range(2):
+        asyncio.run(instance.handle_tool_call("get_instance_status", {}, failing_client))
+    assert failing_client.test_connection.call_count == 2
+
+
+def test_handle_tool_call_validation():
+    """Test that the tool spec validates required fields and workspace names"""
+    oci_client = make_client()
+    with pytest.raises(ValidationError) as exc_info:
+        asyncio.run(instance.handle_tool_call(
+            "grant_workspace_access", {"workspace_name": "ws"}, oci_client,
+        ))
+    assert exc_info.value.details["missing_fields"] == ["user_id", "role"]
+
+    with pytest.raises(ValidationError):
+        asyncio.run(instance.handle_tool_call(
+            "create_workspace", {"workspace_name": "bad name"}, oci_client,
+        ))
+
+    with pytest.raises(ValidationError):
+        asyncio.run(instance.handle_tool_call("unknown_tool", {}, oci_client))
+
+
+def test_workspace_lists_invalidated_by_writes():
+    """Test that cached listings are dropped when workspaces or access change"""
+    oci_client = make_client()
+    asyncio.run(instance.handle_tool_call("list_workspaces", {}, oci_client))
+    asyncio.run(instance.handle_tool_call("list_workspace_users", {"workspace_name": "ws"}, oci_client))
+    assert ("list_workspaces", 100, None) in instance._response_cache
+    assert ("list_workspace_users", "ws") in instance._response_cache
+
+    asyncio.run(instance.handle_tool_call("create_workspace", {"workspace_name": "new_ws"}, oci_client))
+    assert ("list_workspaces", 100, None) not in instance._response_cache
+
+    asyncio.run(instance.handle_tool_call(
+        "revoke_workspace_access", {"workspace_name": "ws", "user_id": "u"}, oci_client,
+    ))
+    assert ("list_workspace_users", "ws") not in instance._response_cache
+
+
+def test_list_workspaces_rejects_bad_paging():
+    """Test that limits below 1 and malformed page tokens are rejected"""
+    oci_client = make_client()
+    for arguments in ({"limit": 0}, {"limit": -1}, {"page": "abc"}, {"page": "-1"}):
+        with pytest.raises(ValidationError):
+            asyncio.run(instance.handle_tool_call("list_workspaces", arguments, oci_client))
+
+    result = asyncio.run(instance.handle_tool_call("list_workspaces", {"limit": 1}, oci_client))
+    next_page = result["data"]["pagination"]["next_page"]
+    result = asyncio.run(instance.handle_tool_call(
+        "list_workspaces", {"limit": 1, "page": next_page}, oci_client,
+    ))
+    assert result["success"] is True
+
+
+def test_grant_workspace_access_bulk():
+    """Test that bulk grants return one result per user"""
+    oci_client = make_client()
+    result = asyncio.run(instance.handle_tool_call(
+        "grant_workspace_access_bulk",
+        {"workspace_name": "ws", "user_ids": ["u1", "u2", "u3"], "role": "viewer"},
+        oci_client,
+    ))
+    assert result["success"] is True
+    assert [item["user_id"] for item in result["data"]["items"]] == ["u1", "u2", "u3"]
+    assert "errors" not in result["data"]
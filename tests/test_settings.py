@@ -0,0 +1,69 @@
+"""
+Tests for configuration loading
+"""
+import pytest
+from config.settings import Settings
+from utils.errors import ConfigurationError
+
+
+INSTANCE_YAML = """
+aidp:
+  instances:
+    melbourne:
+      ocid: "ocid1.aidataplatform.oc1.ap-melbourne-1.test"
+      region: "ap-melbourne-1"
+      compartment_ocid: "ocid1.compartment.oc1..test"
+      namespace: "test-namespace"
+"""
+
+
+def test_env_overrides(tmp_path, monkeypatch):
+    """Test that environment variables override file values"""
+    config_file = tmp_path / "aidp_config.yaml"
+    config_file.write_text(INSTANCE_YAML)
+
+    monkeypatch.setenv("LOG_LEVEL", "DEBUG")
+    monkeypatch.setenv("REQUEST_TIMEOUT", "42")
+    monkeypatch.setenv("MAX_RETRIES", "not-a-number")
+
+    settings = Settings(str(config_file), instance_name="melbourne")
+
+    assert settings.logging.level == "DEBUG"
+    assert settings.performance.request_timeout_seconds == 42
+    assert settings.performance.retry_max_attempts == 3
+    assert settings.instance.region == "ap-melbourne-1"
+
+
+def test_invalid_instances_reported(tmp_path):
+    """Test that every invalid instance is named in the error details"""
+    config_file = tmp_path / "aidp_config.yaml"
+    config_file.write_text(
+        INSTANCE_YAML
+        + """
+    sydney:
+      ocid: "ocid1.aidataplatform.oc1.ap-sydney-1.test"
+"""
+    )
+
+    with pytest.raises(ConfigurationError) as exc_info:
+        Settings(str(config_file), instance_name="melbourne")
+
+    assert exc_info.value.details["invalid_instances"] == ["sydney"]
+
+
+def test_concurrency_limits_must_be_positive(tmp_path, monkeypatch):
+    """Test that zero request slots or pool workers fail at load time"""
+    config_file = tmp_path / "aidp_config.yaml"
+    config_file.write_text(INSTANCE_YAML)
+
+    monkeypatch.setenv("MAX_CONCURRENT_REQUESTS", "0")
+    with pytest.raises(ConfigurationError):
+        Settings(str(config_file), instance_name="melbourne")
+    monkeypatch.delenv("MAX_CONCURRENT_REQUESTS")
+
+    config_file.write_text(INSTANCE_YAML + """
+  performance:
+    connection_pool_size: -1
+""")
+    with pytest.raises(ConfigurationError):
+        Settings(str(config_file), instance_name="melbourne")
@@ -1,10 +1,11 @@
 """
 Tests for Object Storage module
 """
+import asyncio
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from unittest.mock import AsyncMock, Mock, patch, MagicMock
 from src.modules import storage
-from utils.errors import ValidationError
+from utils.errors import APIError, ValidationError
 
 
 @pytest.mark.asyncio
@@ -26,7 +27,7 @@ async def test_list_buckets():
     mock_response = Mock()
     mock_response.data = [mock_bucket]
 
-    oci_client.call_api.return_value = mock_response
+    oci_client.call_api_async = AsyncMock(return_value=mock_response)
 
     # Execute
     result = await storage.list_buckets(oci_client, limit=100)
@@ -51,6 +52,22 @@ async def test_create_bucket_validation():
         await storage.create_bucket(oci_client, "invalid..bucket")
 
 
+@pytest.mark.asyncio
+async def test_handle_tool_call_missing_fields():
+    """Test required arguments are checked before dispatch"""
+    oci_client = Mock()
+
+    with pytest.raises(ValidationError) as exc_info:
+        await storage.handle_tool_call(
+            "upload_object",
+            {"bucket_name": "test-bucket", "object_name": None},
+            oci_client,
+        )
+
+    assert exc_info.value.details["missing_fields"] == ["object_name", "file_path"]
+    oci_client.call_api_async.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_upload_object_file_not_found():
     """Test upload with missing file"""
@@ -65,10 +82,447 @@ async def test_upload_object_file_not_found():
         )
 
 
+@pytest.mark.asyncio
+async def test_upload_object(tmp_path):
+    """Test upload goes through the async API path"""
+    file_path = tmp_path / "data.csv"
+    file_path.write_bytes(b"a,b\n1,2\n")
+
+    oci_client = Mock()
+    oci_client.get_namespace.return_value = "test-namespace"
+    mock_response = Mock()
+    mock_response.headers = {"etag": "etag123"}
+    oci_client.call_api_async = AsyncMock(return_value=mock_response)
+
+    result = await storage.upload_object(oci_client, "test-bucket", "data.csv", str(file_path))
+
+    assert result["success"] == True
+    assert result["data"]["size"] == 8
+    assert result["data"]["etag"] == "etag123"
+    oci_client.call_api_async.assert_awaited_once()
+    oci_client.call_api.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_upload_object_multipart(tmp_path):
+    """Test files above the threshold go through the multipart upload manager"""
+    file_path = tmp_path / "data.csv"
+    file_path.write_bytes(b"a,b\n1,2\n")
+
+    oci_client = Mock()
+    oci_client.get_namespace.return_value = "test-namespace"
+    oci_client.multipart_parallelism = 8
+    oci_client.multipart_slots = asyncio.Semaphore(1)
+    mock_response = Mock()
+    mock_response.headers = {"etag": "etag123"}
+    oci_client.call_api_async = AsyncMock(return_value=mock_response)
+
+    with patch.object(storage, "_MULTIPART_THRESHOLD", 4), \
+            patch.object(storage, "UploadManager") as upload_manager_class:
+        result = await storage.upload_object(oci_client, "test-bucket", "data.csv", str(file_path))
+
+    assert result["data"]["etag"] == "etag123"
+    upload_manager = upload_manager_class.return_value
+    oci_client.call_api_async.assert_awaited_once()
+    args, kwargs = oci_client.call_api_async.call_args
+    assert args[:5] == (upload_manager.upload_file, "test-namespace", "test-bucket", "data.csv", str(file_path))
+    assert kwargs["part_size"] == storage._MULTIPART_PART_SIZE
+    assert upload_manager_class.call_args.kwargs["parallel_process_count"] == 8
+
+
+@pytest.mark.asyncio
+async def test_bulk_upload_holds_a_multipart_slot_per_large_file(tmp_path):
+    """Test concurrent multipart uploads are limited by the client's multipart slots"""
+    file_paths = []
+    for index in range(4):
+        file_path = tmp_path / f"data{index}.csv"
+        file_path.write_bytes(b"a,b\n1,2\n")
+        file_paths.append(str(file_path))
+
+    oci_client = Mock()
+    oci_client.get_namespace.return_value = "test-namespace"
+    oci_client.settings.performance.max_concurrent_requests = 4
+    oci_client.multipart_parallelism = 4
+    oci_client.multipart_slots = asyncio.Semaphore(1)
+    in_flight = 0
+    peak = 0
+
+    async def call_api_async(func, *args, **kwargs):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return Mock(headers={"etag": "etag123"})
+
+    oci_client.call_api_async = call_api_async
+
+    with patch.object(storage, "_MULTIPART_THRESHOLD", 4), patch.object(storage, "UploadManager"):
+        result = await storage.bulk_upload(oci_client, "test-bucket", file_paths)
+
+    assert result["data"]["successful"] == 4
+    assert peak == 1
+
+
+@pytest.mark.asyncio
+async def test_download_object(tmp_path):
+    """Test streaming a download to a local file"""
+    oci_client = Mock()
+    oci_client.get_namespace.return_value = "test-namespace"
+    response = Mock()
+    response.headers = {"content-length": "11"}
+    response.data.raw.stream.return_value = iter([b"hello ", b"world"])
+    oci_client.object_storage.get_object.return_value = response
+
+    async def call_api_async(func, *args, **kwargs):
+        return func(*args, **kwargs)
+
+    oci_client.call_api_async = call_api_async
+    dest = tmp_path / "out" / "file.txt"
+
+    result = await storage.download_object(oci_client, "test-bucket", "test-object", str(dest))
+
+    assert result["data"]["size"] == 11
+    assert dest.read_bytes() == b"hello world"
+    assert not (tmp_path / "out" / "file.txt.part").exists()
+
+
+def test_write_pipelined(tmp_path):
+    """Test pipelined writes keep chunk order and report write failures"""
+    dest = tmp_path / "out.bin"
+    chunks = [bytes([i]) * 1000 for i in range(20)]
+
+    with open(dest, "wb", buffering=0) as f:
+        assert storage._write_pipelined(f, iter(chunks)) == 20000
+    assert dest.read_bytes() == b"".join(chunks)
+
+    failing = Mock()
+    failing.write.side_effect = OSError("disk full")
+    with pytest.raises(OSError):
+        storage._write_pipelined(failing, iter(chunks))
+
+
+@pytest.mark.asyncio
+async def test_object_metadata_cached_until_write():
+    """Test that object metadata is reused until the object is written"""
+    storage._metadata_cache.clear()
+    oci_client = Mock()
+    oci_client.get_namespace.return_value = "test-namespace"
+    oci_client.settings.cache.enabled = True
+    oci_client.settings.cache.ttl_seconds = 300
+
+    mock_response = Mock()
+    mock_response.headers = {"etag": "etag123", "content-length": "8"}
+    oci_client.call_api_async = AsyncMock(return_value=mock_response)
+
+    for _ in range(2):
+        result = await storage.get_object_metadata(oci_client, "test-bucket", "data.csv")
+        assert result["data"]["etag"] == "etag123"
+    assert oci_client.call_api_async.await_count == 1
+
+    await storage.delete_object(oci_client, "test-bucket", "data.csv")
+    await storage.get_object_metadata(oci_client, "test-bucket", "data.csv")
+    assert oci_client.call_api_async.await_count == 3
+    storage._metadata_cache.clear()
+
+
+def test_list_objects_pages_up_to_limit():
+    """Test listings follow pagination and stop at the limit"""
+    object_storage = Mock()
+    object_storage.list_objects.__name__ = "list_objects"
+    pages = []
+    for start in (0, 2):
+        page = Mock(spec=storage.os_models.ListObjects)
+        page.objects = [f"obj{start}", f"obj{start + 1}"]
+        page.next_start_with = "next"
+        response = Mock(data=page, headers={})
+        pages.append(response)
+    object_storage.list_objects.side_effect = pages
+
+    records = storage._list_objects_up_to(object_storage, 3, namespace_name="ns", bucket_name="b")
+
+    assert records == ["obj0", "obj1", "obj2"]
+    assert object_storage.list_objects.call_count == 2
+    assert object_storage.list_objects.call_args.kwargs["limit"] == 3
+
+
+@pytest.mark.asyncio
+async def test_list_objects_cached_until_write():
+    """Test that listings are reused until an object in the bucket changes"""
+    storage._metadata_cache.clear()
+    oci_client = Mock()
+    oci_client.get_namespace.return_value = "test-namespace"
+    oci_client.settings.cache.enabled = True
+    oci_client.settings.cache.ttl_seconds = 300
+
+    mock_object = Mock(size=8, md5="md5", time_created=None, time_modified=None, etag="etag123")
+    mock_object.name = "data.csv"
+    oci_client.call_api_async = AsyncMock(return_value=[mock_object])
+
+    await storage.list_objects(oci_client, "test-bucket")
+    result = await storage.list_objects(oci_client, "test-bucket", include_formatted=True)
+    assert result["data"]["items"][0]["size_formatted"]
+    assert oci_client.call_api_async.await_count == 1
+
+    await storage.list_objects(oci_client, "test-bucket", refresh=True)
+    assert oci_client.call_api_async.await_count == 2
+
+    await storage.delete_object(oci_client, "test-bucket", "data.csv")
+    result = await storage.list_objects(oci_client, "test-bucket")
+    assert "size_formatted" not in result["data"]["items"][0]
+    assert oci_client.call_api_async.await_count == 4
+    storage._metadata_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_bulk_get_object_metadata_uses_one_listing():
+    """Test bulk metadata comes from a single range listing"""
+    oci_client = Mock()
+    oci_client.get_namespace.return_value = "test-namespace"
+
+    listed = []
+    for name in ("logs/a.txt", "logs/b.txt", "logs/c.txt", "logs/n.txt"):
+        obj = Mock(size=8, md5="md5", time_modified=None, etag=f"etag-{name}", storage_tier="Standard")
+        obj.name = name
+        listed.append(obj)
+    oci_client.call_api_async = AsyncMock(
+        return_value=Mock(data=Mock(objects=listed, next_start_with="logs/o.txt")),
+    )
+
+    result = await storage.bulk_get_object_metadata(
+        oci_client, "test-bucket", ["logs/c.txt", "logs/missing.txt", "logs/a.txt"],
+    )
+
+    # logs/n.txt sorts past the last requested name, so no second page is needed
+    oci_client.call_api_async.assert_awaited_once()
+    kwargs = oci_client.call_api_async.call_args.kwargs
+    assert kwargs["start"] == "logs/a.txt"
+    assert kwargs["prefix"] == "logs/"
+    data = result["data"]
+    assert data["found"] == 2
+    assert [row["exists"] for row in data["results"]] == [True, False, True]
+    assert data["results"][0]["etag"] == "etag-logs/c.txt"
+
+
+@pytest.mark.asyncio
+async def test_bulk_get_object_metadata_validates_names():
+    """Test object_names must be a non-empty list of valid names"""
+    oci_client = Mock()
+    oci_client.call_api_async = AsyncMock()
+
+    for object_names in ("logs/a.txt", [], ["a.txt", 3], ["a.txt", ""]):
+        with pytest.raises(ValidationError):
+            await storage.bulk_get_object_metadata(oci_client, "test-bucket", object_names)
+
+    oci_client.call_api_async.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_delete_all_objects_streams_pages():
+    """Test force deletes empty each listed page before fetching the next"""
+    oci_client = Mock()
+    oci_client.get_namespace.return_value = "test-namespace"
+    oci_client.settings.performance.max_concurrent_requests = 2
+
+    def page(names, next_start_with):
+        objects = []
+        for name in names:
+            obj = Mock()
+            obj.name = name
+            objects.append(obj)
+        return Mock(data=Mock(objects=objects, next_start_with=next_start_with))
+
+    calls = []
+
+    async def call_api_async(func, **kwargs):
+        if func is oci_client.object_storage.list_objects:
+            calls.append(("list", kwargs.get("start")))
+            return page(["a", "b"], "c") if "start" not in kwargs else page(["c"], None)
+        calls.append(("delete", kwargs["object_name"]))
+
+    oci_client.call_api_async = call_api_async
+
+    await storage._delete_all_objects(oci_client, "test-bucket")
+
+    assert calls == [
+        ("list", None), ("delete", "a"), ("delete", "b"),
+        ("list", "c"), ("delete", "c"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_bulk_upload_reports_each_file(tmp_path):
+    """Test bulk uploads name objects under the prefix and report missing files"""
+    oci_client = Mock()
+    oci_client.get_namespace.return_value = "test-namespace"
+    oci_client.settings.performance.max_concurrent_requests = 2
+    oci_client.call_api_async = AsyncMock(return_value=Mock(headers={"etag": "etag123"}))
+    file_path = tmp_path / "data.csv"
+    file_path.write_bytes(b"a,b\n")
+
+    result = await storage.bulk_upload(
+        oci_client, "test-bucket", [str(file_path), str(tmp_path / "missing.csv")], prefix="in",
+    )
+
+    assert result["data"]["successful"] == 1
+    assert result["data"]["results"][1]["status"] == "failed"
+    assert oci_client.call_api_async.call_args.kwargs["object_name"] == "in/data.csv"
+
+
+@pytest.mark.asyncio
+async def test_update_object_metadata_waits_for_copy():
+    """Test the cached metadata is only dropped once the self-copy completes"""
+    oci_client = Mock()
+    oci_client.get_namespace.return_value = "test-namespace"
+    oci_client.settings.performance.request_timeout_seconds = 60
+    storage._metadata_cache.set(("get_object_metadata", "test-namespace", "test-bucket", "a.txt"), {}, 60)
+
+    async def call_api_async(func, **kwargs):
+        if func is oci_client.object_storage.copy_object:
+            return Mock(headers={"opc-work-request-id": "wr1"})
+        # Still cached while the copy is running
+        assert ("get_object_metadata", "test-namespace", "test-bucket", "a.txt") in storage._metadata_cache
+        return Mock(data=Mock(status="COMPLETED"))
+
+    oci_client.call_api_async = call_api_async
+
+    result = await storage.update_object_metadata(oci_client, "test-bucket", "a.txt", {"owner": "x"})
+
+    assert result["data"]["work_request_id"] == "wr1"
+    assert ("get_object_metadata", "test-namespace", "test-bucket", "a.txt") not in storage._metadata_cache
+
+
+@pytest.mark.asyncio
+async def test_copy_object_destination_not_cached_until_copy_completes():
+    """Test reads of a copy destination made while the copy runs are not cached"""
+    storage._metadata_cache.clear()
+    oci_client = Mock()
+    oci_client.get_namespace.return_value = "test-namespace"
+    oci_client.settings.cache.enabled = True
+    oci_client.settings.cache.ttl_seconds = 300
+    oci_client.settings.performance.request_timeout_seconds = 60
+    key = ("get_object_metadata", "test-namespace", "dest-bucket", "b.txt")
+    copy_done = asyncio.Event()
+
+    async def call_api_async(func, **kwargs):
+        if func is oci_client.object_storage.copy_object:
+            return Mock(headers={"opc-work-request-id": "wr1"})
+        if func is oci_client.object_storage.get_work_request:
+            await copy_done.wait()
+            return Mock(data=Mock(status="COMPLETED"))
+        return Mock(headers={"etag": "old" if not copy_done.is_set() else "new"})
+
+    oci_client.call_api_async = call_api_async
+
+    result = await storage.copy_object(oci_client, "src-bucket", "a.txt", "dest-bucket", "b.txt")
+    assert result["data"]["status"] == "ACCEPTED"
+
+    # Read during the copy window is served but not cached
+    metadata = await storage.get_object_metadata(oci_client, "dest-bucket", "b.txt")
+    assert metadata["data"]["etag"] == "old"
+    assert key not in storage._metadata_cache
+
+    copy_done.set()
+    await asyncio.gather(*storage._copy_watchers)
+    assert not storage._pending_copies
+
+    metadata = await storage.get_object_metadata(oci_client, "dest-bucket", "b.txt")
+    assert metadata["data"]["etag"] == "new"
+    assert key in storage._metadata_cache
+    storage._metadata_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_object_metadata_reports_each_object():
+    """Test bulk metadata updates run per object and report failures"""
+    oci_client = Mock()
+    oci_client.get_namespace.return_value = "test-namespace"
+    oci_client.settings.performance.max_concurrent_requests = 1
+    oci_client.call_api_async = AsyncMock(side_effect=[Mock(headers={}), APIError("copy failed")])
+
+    result = await storage.bulk_update_object_metadata(
+        oci_client, "test-bucket", {"a.txt": {"owner": "x"}, "b.txt": {"owner": "y"}},
+    )
+
+    assert result["data"]["successful"] == 1
+    assert result["data"]["results"][1] == {"object": "b.txt", "status": "failed", "error": "copy failed"}
+
+
+@pytest.mark.asyncio
+async def test_move_object_within_bucket_renames():
+    """Test same-bucket moves use a rename instead of copy and delete"""
+    oci_client = Mock()
+    oci_client.get_namespace.return_value = "test-namespace"
+    oci_client.call_api_async = AsyncMock()
+
+    result = await storage.move_object(oci_client, "test-bucket", "old.csv", "test-bucket", "new.csv")
+
+    assert result["data"]["message"] == "Object moved successfully"
+    oci_client.call_api_async.assert_awaited_once()
+    args, kwargs = oci_client.call_api_async.call_args
+    assert args[0] is oci_client.object_storage.rename_object
+    assert kwargs["rename_object_details"].new_name == "new.csv"
+
+
+@pytest.mark.asyncio
+async def test_map_bounded_limits_concurrency():
+    """Test bulk work keeps order and never exceeds the request limit"""
+    oci_client = Mock()
+    oci_client.settings.performance.max_concurrent_requests = 3
+    in_flight = 0
+    peak = 0
+
+    async def work(item):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        if item == 4:
+            raise APIError("failed")
+        return item * 2
+
+    outcomes = await storage._map_bounded(oci_client, work, list(range(10)))
+
+    assert peak == 3
+    assert outcomes[:4] == [0, 2, 4, 6]
+    assert isinstance(outcomes[4], APIError)
+    assert outcomes[9] == 18
+
+    oci_client.settings.performance.max_concurrent_requests = 1
+    outcomes = await storage._map_bounded(oci_client, work, list(range(10)), stop_on_error=True)
+
+    assert outcomes[:4] == [0, 2, 4, 6]
+    assert isinstance(outcomes[4], APIError)
+    assert outcomes[5:] == [storage._SKIPPED] * 5
+
+
+@pytest.mark.asyncio
+async def test_create_presigned_url_creates_par():
+    """Test presigned URLs come from a pre-authenticated request"""
+    oci_client = Mock()
+    oci_client.get_namespace.return_value = "test-namespace"
+    mock_response = Mock()
+    mock_response.data.full_path = "https://objectstorage.example/p/token/n/ns/b/bucket/o/data.csv"
+    mock_response.data.id = "par-id"
+    mock_response.data.time_expires = None
+    oci_client.call_api_async = AsyncMock(return_value=mock_response)
+
+    result = await storage.create_presigned_url(oci_client, "test-bucket", "data.csv", 2, "write")
+
+    assert result["data"]["url"] == mock_response.data.full_path
+    details = oci_client.call_api_async.call_args.kwargs["create_preauthenticated_request_details"]
+    assert details.access_type == "ObjectWrite"
+    assert details.object_name == "data.csv"
+
+    with pytest.raises(ValidationError):
+        await storage.create_presigned_url(oci_client, "test-bucket", "data.csv", 2, "delete")
+
+
 def test_storage_tools_count():
     """Test that storage module has correct number of tools"""
     tools = storage.get_tools()
-    assert len(tools) == 20, f"Expected 20 tools, got {len(tools)}"
+    assert len(tools) == 22, f"Expected 22 tools, got {len(tools)}"
 
 
 def test_storage_tool_names():
@@ -0,0 +1,26 @@
+"""
+Tests for input validators
+"""
+import pytest
+from utils.errors import ValidationError
+from utils.validators import validate_ocid
+
+
+def test_validate_ocid_structure():
+    """Test OCIDs are checked segment by segment, case-insensitively"""
+    validate_ocid("ocid1.instance.oc1.iad.anuwcljt5shfzwya")
+    validate_ocid("OCID1.Compartment.oc1.us-ashburn-1.AAAA", resource_type="compartment")
+
+    for ocid in (
+        "ocid2.instance.oc1.iad.abc",
+        "ocid1.instance.oc1.abc",
+        "ocid1.instance.oc1..abc",
+        "ocid1.inst-ance.oc1.iad.abc",
+        "ocid1.instance.oc1.iad.ab-c",
+        "ocid1.instance.oc1.iad.abc\n",
+    ):
+        with pytest.raises(ValidationError):
+            validate_ocid(ocid)
+
+    with pytest.raises(ValidationError):
+        validate_ocid("ocid1.instance.oc1.iad.abc", resource_type="compartment")
@@ -0,0 +1,113 @@
+"""
+In-process response caching for AIDP MCP Server
+"""
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLCache:
+    """Bounded LRU cache whose entries expire after a per-entry TTL
+
+    Expired entries are kept until evicted so callers can still fall back to
+    the last known value when the backing service is unavailable.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        """
+        Initialize the cache
+
+        Args:
+            max_entries: Maximum number of entries kept before LRU eviction
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a value if it has not expired
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss or an expired entry
+
+        Returns:
+            Cached value or default
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry[0] <= time.monotonic():
+            return default
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def get_stale(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a value whether or not it has expired
+
+        Args:
+            key: Cache key
+            default: Value returned if the key was never cached or was evicted
+
+        Returns:
+            Cached value or default
+        """
+        entry = self._entries.get(key)
+        return default if entry is None else entry[1]
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: float) -> None:
+        """
+        Store a value
+
+        Args:
+            key: Cache key
+            value: Value to store
+            ttl_seconds: Seconds until the entry expires
+        """
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, key: Hashable) -> None:
+        """
+        Drop a single entry
+
+        Args:
+            key: Cache key
+        """
+        self._entries.pop(key, None)
+
+    def invalidate_operation(self, operation: str) -> None:
+        """
+        Drop every entry cached for an operation
+
+        Keys are expected to be tuples whose first element is the operation name.
+
+        Args:
+            operation: Operation name, e.g. "list_clusters"
+        """
+        self.invalidate_prefix((operation,))
+
+    def invalidate_prefix(self, prefix: tuple[Any, ...]) -> None:
+        """
+        Drop every entry whose tuple key starts with prefix
+
+        Args:
+            prefix: Leading key elements, e.g. ("list_objects", namespace, bucket)
+        """
+        size = len(prefix)
+        for key in [k for k in self._entries if isinstance(k, tuple) and k[:size] == prefix]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        """Drop all entries"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+
+_MISSING = object()
@@ -18,15 +18,23 @@ class AIDPError(Exception):
         self.details = details or {}
         self.original_error = original_error
 
-    def to_dict(self) -> dict[str, Any]:
-        """Convert exception to dictionary format"""
+    def to_dict(self, include_original_error: bool = True) -> dict[str, Any]:
+        """
+        Convert exception to dictionary format
+
+        Args:
+            include_original_error: Whether to include the wrapped exception
+
+        Returns:
+            Error payload with type, message and any details
+        """
         result: dict[str, Any] = {
             "type": self.__class__.__name__,
             "message": self.message,
         }
         if self.details:
             result["details"] = self.details
-        if self.original_error:
+        if self.original_error and include_original_error:
             result["original_error"] = str(self.original_error)
         return result
 
@@ -4,8 +4,14 @@ Response formatting utilities for AIDP MCP Server
 from datetime import datetime, timezone
 from typing import Any, Optional
 import json
+import orjson
 from .errors import AIDPError
 
+# datetimes, numpy values and non-string keys are handled natively; anything else falls back to str()
+_ORJSON_OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+_SIZE_UNITS = ("B", "KB", "MB", "GB", "TB", "PB")
+
 
 def format_timestamp() -> str:
     """
@@ -66,30 +72,17 @@ def format_error_response(
     Returns:
         Formatted error response dictionary
     """
-    error_data: dict[str, Any] = {
-        "type": error.__class__.__name__,
-        "message": str(error),
-    }
-
-    # If it's our custom error, include details
+    # Our own errors know their payload, including details
     if isinstance(error, AIDPError):
-        if error.details:
-            error_data["details"] = error.details
-        if error.original_error and include_traceback:
-            error_data["original_error"] = str(error.original_error)
-
-    response = {
-        "success": False,
-        "error": error_data,
-        "metadata": {
-            "timestamp": format_timestamp(),
-        },
-    }
+        error_data = error.to_dict(include_original_error=include_traceback)
+    else:
+        error_data = {"type": error.__class__.__name__, "message": str(error)}
 
+    metadata = {"timestamp": format_timestamp()}
     if request_id:
-        response["metadata"]["request_id"] = request_id
+        metadata["request_id"] = request_id
 
-    return response
+    return {"success": False, "error": error_data, "metadata": metadata}
 
 
 def format_list_response(
@@ -97,6 +90,7 @@ def format_list_response(
     total_count: Optional[int] = None,
     page: Optional[int] = None,
     page_size: Optional[int] = None,
+    next_page: Optional[str] = None,
 ) -> dict[str, Any]:
     """
     Format a list/collection response with pagination metadata
@@ -106,6 +100,7 @@ def format_list_response(
         total_count: Total number of items available
         page: Current page number (1-indexed)
         page_size: Number of items per page
+        next_page: Opaque token for the next page of a token-paginated API
 
     Returns:
         Formatted response with pagination metadata
@@ -124,6 +119,11 @@ def format_list_response(
             "page_size": page_size,
             "has_more": (page * page_size) < (total_count or len(items)),
         }
+    elif next_page is not None:
+        data["pagination"] = {
+            "next_page": next_page,
+            "has_more": True,
+        }
 
     return data
 
@@ -165,11 +165,13 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted file size string (e.g., "1.5 MB")
     """
-    for unit in ["B", "KB", "MB", "GB", "TB"]:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} PB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} B"
+
+    # Each unit is 2**10 of the previous one, so the bit length picks the unit
+    # directly instead of dividing through each smaller unit in turn
+    index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (10 * index)):.2f} {_SIZE_UNITS[index]}"
 
 
 def format_duration(seconds: float) -> str:
@@ -185,35 +187,39 @@ def format_duration(seconds: float) -> str:
     if seconds < 60:
         return f"{seconds:.1f}s"
 
-    minutes = int(seconds // 60)
-    remaining_seconds = int(seconds % 60)
+    minutes, remaining_seconds = divmod(int(seconds), 60)
 
     if minutes < 60:
         return f"{minutes}m {remaining_seconds}s"
 
-    hours = minutes // 60
-    remaining_minutes = minutes % 60
+    hours, remaining_minutes = divmod(minutes, 60)
 
     if hours < 24:
         return f"{hours}h {remaining_minutes}m"
 
-    days = hours // 24
-    remaining_hours = hours % 24
+    days, remaining_hours = divmod(hours, 24)
 
     return f"{days}d {remaining_hours}h"
 
 
-def format_json_response(data: Any, indent: int = 2) -> str:
+def format_json_response(data: Any, indent: Optional[int] = 2) -> str:
     """
-    Format data as pretty-printed JSON string
+    Format data as a JSON string
+
+    Uses orjson, which only supports 2-space indentation; other widths go
+    through the standard library encoder.
 
     Args:
         data: Data to format
-        indent: Number of spaces for indentation
+        indent: Number of spaces for indentation, or None for compact output
 
     Returns:
         JSON formatted string
     """
+    if indent is None:
+        return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode()
+    if indent == 2:
+        return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS | orjson.OPT_INDENT_2).decode()
     return json.dumps(data, indent=indent, default=str, ensure_ascii=False)
 
 
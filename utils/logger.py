@@ -2,11 +2,15 @@
 Logging configuration for AIDP MCP Server
 """
 import logging
+import os
 import sys
 from pathlib import Path
 from logging.handlers import RotatingFileHandler
-from typing import Optional
-import colorlog
+from typing import Any, Optional
+
+# MCP servers communicate via stdin/stdout, so a stdin that is not a terminal
+# means we are likely running as an MCP server and should NOT log to console
+_IS_MCP_SERVER = not os.isatty(0)
 
 
 def setup_logging(
@@ -28,23 +32,17 @@ def setup_logging(
     numeric_level = getattr(logging, log_level.upper(), logging.INFO)
 
     # Create formatters
-    console_formatter = colorlog.ColoredFormatter(
-        "%(log_color)s%(asctime)s - %(name)s - %(levelname)s%(reset)s - %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        log_colors={
-            "DEBUG": "cyan",
-            "INFO": "green",
-            "WARNING": "yellow",
-            "ERROR": "red",
-            "CRITICAL": "red,bg_white",
-        },
-    )
-
     file_formatter = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s - [%(filename)s:%(lineno)d]",
         datefmt="%Y-%m-%d %H:%M:%S",
     )
 
+    # Neither format uses thread or process fields, so skip collecting them
+    # for every record
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(numeric_level)
@@ -52,12 +50,23 @@ def setup_logging(
     # Remove existing handlers
     root_logger.handlers.clear()
 
-    # Only add console handler if not running as MCP server (detect by checking if stdin is a pipe)
-    # MCP servers communicate via stdin/stdout, so we should NOT log to console
-    import os
-    is_mcp_server = not os.isatty(0)  # stdin is not a terminal = likely MCP server
+    # Only add console handler if not running as MCP server
+    if not _IS_MCP_SERVER:
+        # colorlog is only needed here, so MCP server processes never import it
+        import colorlog
+
+        console_formatter = colorlog.ColoredFormatter(
+            "%(log_color)s%(asctime)s - %(name)s - %(levelname)s%(reset)s - %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+            log_colors={
+                "DEBUG": "cyan",
+                "INFO": "green",
+                "WARNING": "yellow",
+                "ERROR": "red",
+                "CRITICAL": "red,bg_white",
+            },
+        )
 
-    if not is_mcp_server:
         # Console handler (only for interactive/debug mode)
         console_handler = logging.StreamHandler(sys.stderr)  # Use stderr, not stdout
         console_handler.setLevel(numeric_level)
@@ -106,15 +115,24 @@ class RequestLogger:
     def log_request(
         self, tool_name: str, arguments: dict, request_id: Optional[str] = None
     ) -> None:
-        """Log an incoming tool request"""
-        log_data = {
-            "tool": tool_name,
-            "args": arguments,
-        }
+        """
+        Log an incoming tool request
+
+        Argument values can be large (bulk file lists), so they are only
+        logged at DEBUG; INFO records carry just the argument names.
+        """
+        if not self.logger.isEnabledFor(logging.INFO):
+            return
+
+        log_data: dict[str, Any] = {"tool": tool_name}
+        if self.logger.isEnabledFor(logging.DEBUG):
+            log_data["args"] = arguments
+        else:
+            log_data["arg_names"] = list(arguments)
         if request_id:
             log_data["request_id"] = request_id
 
-        self.logger.info(f"Received request: {log_data}")
+        self.logger.info("Received request: %s", log_data)
 
     def log_response(
         self,
@@ -124,6 +142,10 @@ class RequestLogger:
         request_id: Optional[str] = None,
     ) -> None:
         """Log a tool response"""
+        level = logging.INFO if success else logging.ERROR
+        if not self.logger.isEnabledFor(level):
+            return
+
         status = "SUCCESS" if success else "FAILED"
         log_data = {
             "tool": tool_name,
@@ -133,15 +155,15 @@ class RequestLogger:
         if request_id:
             log_data["request_id"] = request_id
 
-        if success:
-            self.logger.info(f"Response: {log_data}")
-        else:
-            self.logger.error(f"Response: {log_data}")
+        self.logger.log(level, "Response: %s", log_data)
 
     def log_error(
         self, tool_name: str, error: Exception, request_id: Optional[str] = None
     ) -> None:
         """Log an error during tool execution"""
+        if not self.logger.isEnabledFor(logging.ERROR):
+            return
+
         log_data = {
             "tool": tool_name,
             "error_type": error.__class__.__name__,
@@ -150,4 +172,4 @@ class RequestLogger:
         if request_id:
             log_data["request_id"] = request_id
 
-        self.logger.error(f"Error: {log_data}", exc_info=True)
+        self.logger.error("Error: %s", log_data, exc_info=True)
@@ -2,9 +2,32 @@
 Input validation utilities for AIDP MCP Server
 """
 import re
-from typing import Any, Optional
+from functools import lru_cache
+from typing import Any, Callable, Optional, Sequence
 from .errors import ValidationError
 
+# Python types accepted for each JSON Schema type
+_JSON_SCHEMA_TYPES: dict[str, Any] = {
+    "string": str,
+    "integer": int,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+# Characters allowed in OCID segments; the middle segments may also contain "-"
+_OCID_SEGMENT_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+_OCID_MIDDLE_CHARS = _OCID_SEGMENT_CHARS | {"-"}
+
+# Patterns are compiled once at import rather than looked up on every call
+_BUCKET_NAME_RE = re.compile(r"^[a-zA-Z0-9._-]+$")
+# Every rule for a valid bucket name at once: allowed characters, with
+# periods only between other characters and never two in a row
+_VALID_BUCKET_NAME_RE = re.compile(r"[a-zA-Z0-9_-]+(?:\.[a-zA-Z0-9_-]+)*")
+# Workspace and cluster names share one character set
+_RESOURCE_NAME_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+
 
 def validate_ocid(ocid: str, resource_type: Optional[str] = None) -> None:
     """
@@ -20,25 +43,56 @@ def validate_ocid(ocid: str, resource_type: Optional[str] = None) -> None:
     if not ocid:
         raise ValidationError("OCID cannot be empty")
 
-    # OCID format: ocid1.<resource_type>.<realm>.<region>.<unique_id>
-    ocid_pattern = r"^ocid1\.[a-z0-9]+(\.[a-z0-9-]+){2,}\.[a-z0-9]+$"
+    # Both checks are case-insensitive, so lower the OCID once for them
+    lowered = ocid.lower()
 
-    if not re.match(ocid_pattern, ocid, re.IGNORECASE):
+    if not _is_ocid(lowered):
         raise ValidationError(
             f"Invalid OCID format: {ocid}",
             details={"expected_format": "ocid1.<resource_type>.<realm>.<region>.<unique_id>"},
         )
 
-    if resource_type:
-        expected_prefix = f"ocid1.{resource_type}."
-        if not ocid.lower().startswith(expected_prefix.lower()):
-            raise ValidationError(
-                f"OCID does not match expected resource type: {resource_type}",
-                details={
-                    "ocid": ocid,
-                    "expected_prefix": expected_prefix,
-                },
-            )
+    if resource_type and not lowered.startswith(_ocid_prefix(resource_type)):
+        raise ValidationError(
+            f"OCID does not match expected resource type: {resource_type}",
+            details={
+                "ocid": ocid,
+                "expected_prefix": f"ocid1.{resource_type}.",
+            },
+        )
+
+
+@lru_cache(maxsize=64)
+def _ocid_prefix(resource_type: str) -> str:
+    """Lowercased OCID prefix for a resource type; callers use a small fixed set"""
+    return f"ocid1.{resource_type.lower()}."
+
+
+def _is_ocid(ocid: str) -> bool:
+    """
+    Check the structure ocid1.<resource_type>.<realm>.<region>.<unique_id>
+
+    Segments cannot contain ".", so splitting on it identifies them exactly
+    and each one is checked with set operations instead of a regex. The
+    "ocid1" prefix is tested first, so most malformed input is rejected
+    before any segment is examined.
+
+    Args:
+        ocid: The OCID to check, already lowercased
+
+    Returns:
+        True if the OCID is well formed
+    """
+    if not ocid.startswith("ocid1."):
+        return False
+
+    parts = ocid.split(".")
+    return (
+        len(parts) >= 5
+        and bool(parts[1]) and _OCID_SEGMENT_CHARS.issuperset(parts[1])
+        and bool(parts[-1]) and _OCID_SEGMENT_CHARS.issuperset(parts[-1])
+        and all(part and _OCID_MIDDLE_CHARS.issuperset(part) for part in parts[2:-1])
+    )
 
 
 def validate_bucket_name(bucket_name: str) -> None:
@@ -66,13 +120,18 @@ def validate_bucket_name(bucket_name: str) -> None:
             details={"length": len(bucket_name)},
         )
 
+    # Valid names pass in one match; the separate checks below only run to
+    # report which rule an invalid name breaks
+    if _VALID_BUCKET_NAME_RE.fullmatch(bucket_name):
+        return
+
     if bucket_name.startswith(".") or bucket_name.endswith("."):
         raise ValidationError("Bucket name cannot start or end with a period")
 
     if ".." in bucket_name:
         raise ValidationError("Bucket name cannot contain consecutive periods")
 
-    if not re.match(r"^[a-zA-Z0-9._-]+$", bucket_name):
+    if not _BUCKET_NAME_RE.match(bucket_name):
         raise ValidationError(
             "Bucket name contains invalid characters",
             details={
@@ -106,59 +165,66 @@ def validate_object_name(object_name: str) -> None:
         )
 
 
+@lru_cache(maxsize=1024)
 def validate_workspace_name(workspace_name: str) -> None:
     """
     Validate a workspace name
 
+    Names that pass are memoized, so repeat calls for the same name are a
+    dict lookup. Invalid names raise every time, since exceptions are not cached.
+
     Args:
         workspace_name: The workspace name to validate
 
     Raises:
         ValidationError: If workspace name is invalid
     """
-    if not workspace_name:
-        raise ValidationError("Workspace name cannot be empty")
-
-    if len(workspace_name) > 100:
-        raise ValidationError(
-            "Workspace name too long (max 100 characters)",
-            details={"length": len(workspace_name)},
-        )
-
-    if not re.match(r"^[a-zA-Z0-9_-]+$", workspace_name):
-        raise ValidationError(
-            "Workspace name contains invalid characters",
-            details={
-                "workspace_name": workspace_name,
-                "allowed_characters": "alphanumeric, hyphen, underscore",
-            },
-        )
+    _validate_resource_name(workspace_name, "workspace")
 
 
+@lru_cache(maxsize=1024)
 def validate_cluster_name(cluster_name: str) -> None:
     """
     Validate a cluster name
 
+    Passing names are memoized, as in validate_workspace_name.
+
     Args:
         cluster_name: The cluster name to validate
 
     Raises:
         ValidationError: If cluster name is invalid
     """
-    if not cluster_name:
-        raise ValidationError("Cluster name cannot be empty")
+    _validate_resource_name(cluster_name, "cluster")
+
+
+def _validate_resource_name(name: str, kind: str) -> None:
+    """
+    Validate a workspace or cluster name, which follow the same rules
+
+    Args:
+        name: The name to validate
+        kind: Resource kind used in error messages and details, e.g. "workspace"
 
-    if len(cluster_name) > 100:
+    Raises:
+        ValidationError: If the name is empty, too long or has invalid characters
+    """
+    label = kind.capitalize()
+
+    if not name:
+        raise ValidationError(f"{label} name cannot be empty")
+
+    if len(name) > 100:
         raise ValidationError(
-            "Cluster name too long (max 100 characters)",
-            details={"length": len(cluster_name)},
+            f"{label} name too long (max 100 characters)",
+            details={"length": len(name)},
         )
 
-    if not re.match(r"^[a-zA-Z0-9_-]+$", cluster_name):
+    if not _RESOURCE_NAME_RE.match(name):
         raise ValidationError(
-            "Cluster name contains invalid characters",
+            f"{label} name contains invalid characters",
             details={
-                "cluster_name": cluster_name,
+                f"{kind}_name": name,
                 "allowed_characters": "alphanumeric, hyphen, underscore",
             },
         )
@@ -178,13 +244,18 @@ def validate_positive_integer(value: Any, field_name: str) -> int:
     Raises:
         ValidationError: If value is not a positive integer
     """
-    try:
-        int_value = int(value)
-    except (ValueError, TypeError):
-        raise ValidationError(
-            f"{field_name} must be an integer",
-            details={"value": value, "type": type(value).__name__},
-        )
+    # JSON arguments usually arrive as int already, so skip the conversion;
+    # bools and other types still go through int() as before
+    if type(value) is int:
+        int_value = value
+    else:
+        try:
+            int_value = int(value)
+        except (ValueError, TypeError):
+            raise ValidationError(
+                f"{field_name} must be an integer",
+                details={"value": value, "type": type(value).__name__},
+            )
 
     if int_value <= 0:
         raise ValidationError(
@@ -222,21 +293,74 @@ def validate_enum(value: str, valid_values: list[str], field_name: str) -> str:
     return value
 
 
-def validate_required_fields(data: dict[str, Any], required_fields: list[str]) -> None:
+def validate_required_fields(data: dict[str, Any], required_fields: Sequence[str]) -> None:
     """
     Validate that all required fields are present in data
 
     Args:
         data: Dictionary to validate
-        required_fields: List of required field names
+        required_fields: Required field names, in the order they are reported
 
     Raises:
         ValidationError: If any required field is missing
     """
-    missing_fields = [field for field in required_fields if field not in data or data[field] is None]
+    # A missing key and an explicit None both count as missing; get() covers
+    # both with one lookup per field
+    missing_fields = [field for field in required_fields if data.get(field) is None]
 
     if missing_fields:
         raise ValidationError(
             "Missing required fields",
             details={"missing_fields": missing_fields},
         )
+
+
+def compile_schema_validator(schema: dict[str, Any]) -> Callable[[dict[str, Any]], None]:
+    """
+    Compile a tool inputSchema into an argument validation function
+
+    The schema is walked once here; the returned function only checks the
+    required fields and the arguments actually supplied (top-level type and
+    enum). Null values for optional fields are treated as absent.
+
+    Args:
+        schema: JSON Schema of an object with "properties" and optional "required"
+
+    Returns:
+        Function that validates a tool's arguments
+
+    Raises:
+        ValidationError: From the returned function, if arguments don't match the schema
+    """
+    required_fields = list(schema.get("required", []))
+    checks: dict[str, tuple[str, Any, Optional[tuple[Any, ...]]]] = {}
+    for field, prop in schema.get("properties", {}).items():
+        type_name = prop.get("type")
+        enum = tuple(prop["enum"]) if "enum" in prop else None
+        checks[field] = (type_name, _JSON_SCHEMA_TYPES.get(type_name), enum)
+
+    def validate(arguments: dict[str, Any]) -> None:
+        validate_required_fields(arguments, required_fields)
+
+        invalid_fields = {}
+        for field, value in arguments.items():
+            check = checks.get(field)
+            if check is None or value is None:
+                continue
+            type_name, expected_type, enum = check
+            # bool is an int subclass, but not a JSON integer/number
+            if expected_type is not None and (
+                not isinstance(value, expected_type)
+                or (isinstance(value, bool) and type_name in ("integer", "number"))
+            ):
+                invalid_fields[field] = f"expected {type_name}, got {type(value).__name__}"
+            elif enum is not None and value not in enum:
+                invalid_fields[field] = f"expected one of {list(enum)}"
+
+        if invalid_fields:
+            raise ValidationError(
+                "Invalid field values",
+                details={"invalid_fields": invalid_fields},
+            )
+
+    return validate